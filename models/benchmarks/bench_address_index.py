@@ -0,0 +1,100 @@
+"""
+Benchmark for cross-source address matching.
+
+Indexes `size` synthetic realestate.com.au listings by canonical address key,
+then matches domain.com.au records (separate unit, number and street fields)
+against them. Compares a linear scan over the listings' parsed addresses with
+one AddressIndex lookup per record.
+
+Usage:
+    python benchmarks/bench_address_index.py
+    python benchmarks/bench_address_index.py --size 1000000 --queries 10000
+"""
+
+import argparse
+import random
+import time
+
+from models import Address, AddressIndex, Listing, PropertyType, address_key, record_address_key
+
+STREETS = ["Dorset", "Aberdeen", "Flinders", "Little Lonsdale", "Beach", "High", "Station", "Church"]
+TYPES = [("Road", "Rd"), ("Drive", "Dr"), ("Street", "St"), ("Avenue", "Ave")]
+SUBURBS = [("Boronia", "3155"), ("Dandenong North", "3175"), ("Melbourne", "3000"), ("Brighton", "3186")]
+
+
+def generate(size: int, seed: int = 42):
+    """Return (listings, addresses), one random address per listing."""
+    rng = random.Random(seed)
+    listings, addresses = [], []
+    for i in range(size):
+        unit = str(rng.randint(1, 20)) if rng.random() < 0.3 else None
+        number = str(rng.randint(1, 400))
+        street = rng.choice(STREETS)
+        street_type = rng.choice(TYPES)
+        suburb, postcode = rng.choice(SUBURBS)
+        line = f"{unit}/{number}" if unit else number
+        address = Address.model_construct(
+            suburb=suburb,
+            state="Vic",
+            postcode=postcode,
+            full_address=f"{line} {street} {street_type[0]}, {suburb}, Vic {postcode}",
+        )
+        listings.append(
+            Listing.model_construct(
+                listing_id=str(i),
+                source="realestate.com.au",
+                address=address,
+                suburb=suburb,
+                property_type=PropertyType.HOUSE,
+            )
+        )
+        addresses.append((unit, number, f"{street} {street_type[1]}", suburb.upper(), postcode))
+    return listings, addresses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--scan-queries", type=int, default=20)
+    args = parser.parse_args()
+
+    listings, addresses = generate(args.size)
+    rng = random.Random(7)
+    records = [
+        {
+            "unitNumber": unit,
+            "streetNumber": number,
+            "street": street,
+            "suburb": suburb,
+            "state": "VIC",
+            "postcode": postcode,
+        }
+        for unit, number, street, suburb, postcode in (rng.choice(addresses) for _ in range(args.queries))
+    ]
+
+    started = time.perf_counter()
+    index = AddressIndex(listings)
+    elapsed = time.perf_counter() - started
+    print(f"index {len(index):,} listings: {elapsed:.2f}s ({len(index) / elapsed:,.0f} listings/s)")
+
+    keys = [address_key(listing.address) for listing in listings]
+    scan_records = records[: args.scan_queries]
+    started = time.perf_counter()
+    for data in scan_records:
+        key = record_address_key(data, "domain.com.au")
+        scanned = [listing for listing, listing_key in zip(listings, keys, strict=True) if listing_key == key]
+    scan = (time.perf_counter() - started) / len(scan_records)
+    assert scanned == index.match_record(scan_records[-1], "domain.com.au")
+
+    started = time.perf_counter()
+    matched = sum(1 for data in records if index.match_record(data, "domain.com.au"))
+    lookup = (time.perf_counter() - started) / len(records)
+    assert matched == len(records)
+
+    print(f"linear scan:  {scan * 1e3:10.3f} ms/record")
+    print(f"index lookup: {lookup * 1e3:10.3f} ms/record ({scan / lookup:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark comparing memory use of EventTimeline and ColumnarEventTimeline.
+
+Loads the same N events into each backend and reports the bytes used per
+event (measured with tracemalloc), the load time, and a sample of query
+times.
+
+Usage:
+    python benchmarks/bench_columnar_events.py
+    python benchmarks/bench_columnar_events.py --sizes 100000 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime
+
+from bench_event_timeline import generate_events
+
+from models import ColumnarEventTimeline, EventTimeline, EventType
+
+
+def with_metadata(events):
+    """Attach PRICE_DROPPED-style metadata to every fourth event."""
+    for i, (event_type, listing_id, timestamp) in enumerate(events):
+        metadata = None
+        if i % 4 == 0:
+            metadata = {"old_price": "800000", "new_price": "750000", "drop_amount": "50000", "drop_percent": 6.25}
+        yield event_type, listing_id, timestamp, metadata
+
+
+def bench(timeline_cls, events):
+    tracemalloc.start()
+    started = time.perf_counter()
+    timeline = timeline_cls()
+    timeline.add_events(with_metadata(events))
+    load_seconds = time.perf_counter() - started
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(100):
+        timeline.get_events_between(datetime(2024, 1, 1, 12), datetime(2024, 1, 1, 13), event_type=EventType.PRICE_DROPPED)
+    query_ms = (time.perf_counter() - started) * 10
+
+    return used / len(events), load_seconds, query_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'backend':>22}  {'events':>10}  {'bytes/event':>11}  {'load s':>7}  {'1h window ms':>12}")
+    for size in args.sizes:
+        events = generate_events(size)
+        for timeline_cls in (EventTimeline, ColumnarEventTimeline):
+            per_event, load_seconds, query_ms = bench(timeline_cls, events)
+            print(f"{timeline_cls.__name__:>22}  {size:>10,}  {per_event:>11,.0f}  {load_seconds:>7.2f}  {query_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
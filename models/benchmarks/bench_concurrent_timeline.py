@@ -0,0 +1,83 @@
+"""
+Multi-threaded stress benchmark for ConcurrentEventTimeline.
+
+Runs T writer threads that each add their own slice of N events, then checks
+that no event was lost and that the merged timeline is correctly ordered.
+Reports throughput per thread count, next to a single EventTimeline guarded
+by one global lock.
+
+Note that on a standard (GIL) CPython build, event validation holds the GIL,
+so throughput gains come mainly from reduced lock contention; lock striping
+pays off fully on free-threaded builds.
+
+Usage:
+    python benchmarks/bench_concurrent_timeline.py
+    python benchmarks/bench_concurrent_timeline.py --size 400000 --threads 1 2 4 8 16
+"""
+
+import argparse
+import threading
+import time
+
+from bench_event_timeline import generate_events
+
+from models import ConcurrentEventTimeline, EventTimeline
+
+
+class GlobalLockTimeline:
+    """Baseline: one EventTimeline behind a single lock."""
+
+    def __init__(self):
+        self._timeline = EventTimeline()
+        self._lock = threading.Lock()
+
+    def add_event(self, *args):
+        with self._lock:
+            return self._timeline.add_event(*args)
+
+    def get_all_events(self):
+        with self._lock:
+            return self._timeline.get_all_events()
+
+
+def run(timeline, events, threads_count):
+    slices = [events[t::threads_count] for t in range(threads_count)]
+
+    def writer(items):
+        for event_type, listing_id, timestamp in items:
+            timeline.add_event(event_type, listing_id, timestamp)
+
+    threads = [threading.Thread(target=writer, args=(items,)) for items in slices]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    stored = timeline.get_all_events()
+    assert len(stored) == len(events), f"lost {len(events) - len(stored)} events"
+    assert all(a.timestamp >= b.timestamp for a, b in zip(stored, stored[1:], strict=False)), "events out of order"
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--stripes", type=int, default=16)
+    args = parser.parse_args()
+
+    events = generate_events(args.size)
+    print(f"{'timeline':>24}  {'threads':>7}  {'seconds':>8}  {'events/s':>10}")
+    for threads_count in args.threads:
+        for name, factory in (
+            ("global lock", GlobalLockTimeline),
+            (f"striped ({args.stripes})", lambda: ConcurrentEventTimeline(args.stripes)),
+        ):
+            elapsed = run(factory(), events, threads_count)
+            print(f"{name:>24}  {threads_count:>7}  {elapsed:>8.2f}  {args.size / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark for warm restarts from a persistent EventLog.
+
+Writes N events to a temporary log, checkpoints it, then measures how long a
+fresh load_timeline() takes and how fast queries are against the mapped log.
+
+Usage:
+    python benchmarks/bench_event_log.py
+    python benchmarks/bench_event_log.py --size 10000000 --batch 500000
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+
+from bench_event_timeline import generate_events
+
+from models import EventLog, EventType, load_timeline
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=250_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path:
+        write_seconds = 0.0
+        with EventLog(path) as log:
+            for start in range(0, args.size, args.batch):
+                events = generate_events(min(args.batch, args.size - start), seed=start)
+                _, seconds = timed(log.append_events, events)
+                write_seconds += seconds
+            _, checkpoint_seconds = timed(log.checkpoint)
+
+        timeline, load_seconds = timed(load_timeline, path)
+        window = (datetime(2024, 1, 1, 12), datetime(2024, 1, 1, 13))
+        _, query_seconds = timed(timeline.get_events_between, *window, None, EventType.PRICE_DROPPED)
+
+        print(f"events:           {len(timeline):,}")
+        print(f"append:           {write_seconds:.2f}s ({args.size / write_seconds:,.0f} events/s)")
+        print(f"checkpoint:       {checkpoint_seconds:.2f}s")
+        print(f"warm restart:     {load_seconds * 1000:.1f}ms")
+        print(f"1h window query:  {query_seconds * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark for loading events into an EventTimeline.
+
+Measures how long it takes to add N events, both one at a time with
+add_event and as a single add_events batch. Timestamps are mostly in order
+with a fraction of late-arriving (out-of-order) events, which mirrors
+replaying a nightly ingestion run.
+
+Both paths allocate the same Event objects, and on large runs the cyclic
+garbage collector's full passes over them take a large share of the time;
+--no-gc disables it to show the cost of the indexing work itself.
+
+Usage:
+    python benchmarks/bench_event_timeline.py
+    python benchmarks/bench_event_timeline.py --sizes 10000 100000
+    python benchmarks/bench_event_timeline.py --no-gc
+"""
+
+import argparse
+import gc
+import random
+import time
+from datetime import datetime, timedelta
+
+from models import EventTimeline, EventType
+
+EVENT_TYPES = list(EventType)
+
+
+def generate_events(size: int, listings: int = 5000, late_fraction: float = 0.05, seed: int = 42):
+    """Generate (event_type, listing_id, timestamp) tuples, mostly in time order."""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    events = []
+    for i in range(size):
+        timestamp = start + timedelta(seconds=i)
+        if rng.random() < late_fraction:
+            timestamp -= timedelta(seconds=rng.randint(1, 86400))
+        events.append((rng.choice(EVENT_TYPES), f"listing{rng.randrange(listings)}", timestamp))
+    return events
+
+
+def bench_load(size: int) -> float:
+    """Return the seconds taken to add `size` events via add_event."""
+    events = generate_events(size)
+    timeline = EventTimeline()
+
+    started = time.perf_counter()
+    for event_type, listing_id, timestamp in events:
+        timeline.add_event(event_type, listing_id, timestamp=timestamp)
+    elapsed = time.perf_counter() - started
+
+    assert len(timeline) == size
+    return elapsed
+
+
+def bench_bulk_load(size: int) -> float:
+    """Return the seconds taken to add `size` events via add_events."""
+    events = generate_events(size)
+    timeline = EventTimeline()
+
+    started = time.perf_counter()
+    timeline.add_events(events)
+    elapsed = time.perf_counter() - started
+
+    assert len(timeline) == size
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--no-gc", action="store_true", help="disable the garbage collector while timing")
+    args = parser.parse_args()
+    if args.no_gc:
+        gc.disable()
+
+    print(f"{'method':>10}  {'events':>10}  {'seconds':>9}  {'events/s':>10}")
+    for size in args.sizes:
+        for method, bench in (("add_event", bench_load), ("add_events", bench_bulk_load)):
+            elapsed = bench(size)
+            print(f"{method:>10}  {size:>10,}  {elapsed:>9.3f}  {size / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
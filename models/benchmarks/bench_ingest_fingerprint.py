@@ -0,0 +1,85 @@
+"""
+Benchmark for skipping unchanged records on re-ingestion.
+
+Simulates a daily re-scrape of testdata/search.json scaled up N times, where
+a small fraction of records has changed since the previous run. Compares
+ingesting every record (normalize, then save to a SQLiteListingStore) against
+checking fingerprints first and only ingesting the records that changed.
+
+Usage:
+    python benchmarks/bench_ingest_fingerprint.py
+    python benchmarks/bench_ingest_fingerprint.py --scale 1000 --changed 0.02
+"""
+
+import argparse
+import copy
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from models import SQLiteListingStore, normalize_realestate_data
+from models.fingerprint import FingerprintIndex
+from sample_data import load_search_records
+
+SOURCE = "realestate.com.au"
+
+
+def generate_scrapes(scale: int, changed: float, seed: int = 42):
+    """Return (yesterday, today) raw records, with `changed` of today's records edited."""
+    raw = load_search_records()
+
+    rng = random.Random(seed)
+    yesterday = []
+    for i in range(scale):
+        for data in raw:
+            data = dict(data)
+            data["id"] = f"{data['id']}-{i}"
+            yesterday.append(data)
+
+    today = []
+    for data in yesterday:
+        data = copy.copy(data)
+        # Image URLs are re-signed on every scrape
+        data["images"] = [f"{url}?v={rng.random()}" for url in data.get("images") or []]
+        if rng.random() < changed:
+            data["description"] = (data.get("description") or "") + " Price reduced."
+        today.append(data)
+    return yesterday, today
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=200)
+    parser.add_argument("--changed", type=float, default=0.02)
+    args = parser.parse_args()
+
+    yesterday, today = generate_scrapes(args.scale, args.changed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteListingStore(Path(tmp) / "full.db")
+        store.save_listings(normalize_realestate_data(data) for data in yesterday)
+        started = time.perf_counter()
+        full = store.save_listings(normalize_realestate_data(data) for data in today)
+        full_seconds = time.perf_counter() - started
+        store.close()
+
+        store = SQLiteListingStore(Path(tmp) / "skip.db")
+        index = FingerprintIndex()
+        store.save_listings(normalize_realestate_data(data) for data in index.skip_unchanged(yesterday, SOURCE))
+        started = time.perf_counter()
+        changed = store.save_listings(
+            normalize_realestate_data(data) for data in index.skip_unchanged(today, SOURCE)
+        )
+        skip_seconds = time.perf_counter() - started
+        store.close()
+
+    print(f"{len(today):,} records, {changed:,} changed")
+    print(f"{'ingest all':>16}: {full_seconds:8.3f}s")
+    print(f"{'skip unchanged':>16}: {skip_seconds:8.3f}s")
+    print(f"{'speedup':>16}: {full_seconds / skip_seconds:8.1f}x")
+    assert full == len(today)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark for JSON Lines export and import.
+
+Builds listings from testdata/search.json (each with a short price and
+auction history, scaled up 200x by default) and a synthetic event timeline,
+then measures writing and reading both as JSON Lines, uncompressed and with
+gzip. Listings are also written with model_dump_json for comparison.
+
+Usage:
+    python benchmarks/bench_jsonl.py
+    python benchmarks/bench_jsonl.py --scale 100 --events 1000000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+
+from bench_trusted_listings import generate_records
+
+from models import Event, EventTimeline, EventType, Listing, export_timeline, import_timeline, read_jsonl, write_jsonl
+
+
+def generate_events(count: int):
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+    event_types = list(EventType)
+    return [
+        (
+            rng.choice(event_types),
+            f"listing{rng.randrange(count // 10 + 1)}",
+            start + timedelta(seconds=rng.randrange(365 * 24 * 3600)),
+            {"old_price": "800000", "new_price": "750000", "drop_percent": 6.25},
+        )
+        for _ in range(count)
+    ]
+
+
+def report(label: str, count: int, elapsed: float, path: Path = None) -> None:
+    size = f"  {path.stat().st_size / count:6.0f} B/record" if path is not None else ""
+    print(f"{label:>28}: {elapsed:7.3f}s  ({count / elapsed:>10,.0f} records/s){size}")
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=200)
+    parser.add_argument("--events", type=int, default=500_000)
+    args = parser.parse_args()
+
+    listings = Listing.from_trusted_batch(generate_records(args.scale))
+    timeline = EventTimeline()
+    timeline.add_events(generate_events(args.events))
+    print(f"{len(listings):,} listings, {len(timeline):,} events")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        path = tmp / "dump.jsonl"
+
+        def dump_json():
+            with open(path, "wb") as f:
+                for listing in listings:
+                    f.write(listing.model_dump_json().encode() + b"\n")
+
+        _, elapsed = timed(dump_json)
+        report("listings model_dump_json", len(listings), elapsed, path)
+
+        for suffix in (".jsonl", ".jsonl.gz"):
+            path = tmp / f"listings{suffix}"
+            _, elapsed = timed(partial(write_jsonl, path, listings))
+            report(f"write listings {suffix}", len(listings), elapsed, path)
+            loaded, elapsed = timed(lambda path=path: list(read_jsonl(path, Listing)))
+            assert loaded[-1] == listings[-1]
+            report(f"read listings {suffix}", len(listings), elapsed)
+
+        for suffix in (".jsonl", ".jsonl.gz"):
+            path = tmp / f"events{suffix}"
+            _, elapsed = timed(partial(export_timeline, timeline, path))
+            report(f"export timeline {suffix}", len(timeline), elapsed, path)
+            loaded, elapsed = timed(partial(import_timeline, path))
+            assert len(loaded) == len(timeline)
+            report(f"import timeline {suffix}", len(timeline), elapsed)
+
+        events = timeline.get_all_events()
+        path = tmp / "events-only.jsonl"
+        write_jsonl(path, events)
+        loaded, elapsed = timed(lambda: list(read_jsonl(path, Event)))
+        report("read events .jsonl", len(events), elapsed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Throughput benchmark for diff_listings.
+
+Builds N (stored, rescraped) listing pairs from testdata/search.json, where a
+fraction of the rescraped listings has a changed price or status, and
+reports how many pairs per second diff_listings compares, with and without
+stored fingerprints to short-circuit on.
+
+Usage:
+    python benchmarks/bench_listing_diff.py
+    python benchmarks/bench_listing_diff.py --size 1000000 --changed 0.05
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from bench_trusted_listings import generate_records
+
+from models import Listing, ListingStatus, fingerprint_listing
+from models.diff import diff_listings
+
+
+def generate_pairs(size: int, changed: float, seed: int = 42):
+    """Return (stored, rescraped) listing pairs."""
+    rng = random.Random(seed)
+    samples = generate_records(1)
+    pairs = []
+    for i in range(size):
+        stored = Listing.from_trusted(samples[i % len(samples)])
+        rescraped = stored.model_copy()
+        if rng.random() < changed:
+            if rng.random() < 0.5:
+                rescraped.current_price = stored.current_price - Decimal(10_000)
+            else:
+                rescraped.status = ListingStatus.CANCELLED
+        pairs.append((stored, rescraped))
+    return pairs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--changed", type=float, default=0.05)
+    args = parser.parse_args()
+
+    pairs = generate_pairs(args.size, args.changed)
+
+    started = time.perf_counter()
+    changed = sum(1 for old, new in pairs if diff_listings(old, new))
+    elapsed = time.perf_counter() - started
+    print(f"{args.size:,} pairs, {changed:,} changed")
+    print(f"{'field compare':>16}: {args.size / elapsed:12,.0f} pairs/s")
+
+    fingerprinted = [(old, new, fingerprint_listing(old), fingerprint_listing(new)) for old, new in pairs]
+    started = time.perf_counter()
+    changed = sum(1 for old, new, old_fp, new_fp in fingerprinted if diff_listings(old, new, old_fp, new_fp))
+    elapsed = time.perf_counter() - started
+    print(f"{'fingerprinted':>16}: {args.size / elapsed:12,.0f} pairs/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark for vectorized analytics on a ListingFrame.
+
+Builds N ListingRecord instances (suburbs and property types taken from
+testdata/search.json, random prices and bedroom counts), loads them into a
+ListingFrame, and times a few typical questions against the same question
+answered with a Python loop over the records:
+
+- filter: 3+ bedroom houses under $900k
+- sort: all listings by price, most expensive first
+- group-by median: median price per suburb and property type
+
+Usage:
+    python benchmarks/bench_listing_frame.py
+    python benchmarks/bench_listing_frame.py --size 1000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+from collections import defaultdict
+
+from bench_trusted_listings import generate_records
+
+from models import Listing, ListingFrame, ListingRecord, PropertyType
+from models.compact import PROPERTY_TYPE_CODES
+
+
+def generate_listing_records(size: int):
+    samples = Listing.from_trusted_batch(generate_records(1))
+    rng = random.Random(42)
+    property_types = [PROPERTY_TYPE_CODES[t] for t in (PropertyType.HOUSE, PropertyType.UNIT, PropertyType.TOWNHOUSE)]
+    records = []
+    for i in range(size):
+        sample = samples[i % len(samples)]
+        records.append(
+            ListingRecord(
+                listing_id=f"{sample.listing_id}-{i}",
+                suburb=sample.suburb,
+                state=sample.address.state,
+                postcode=sample.address.postcode,
+                property_type_code=rng.choice(property_types),
+                bedrooms=rng.randint(1, 5),
+                current_price_cents=rng.randrange(300_000, 2_000_000) * 100 if rng.random() > 0.05 else None,
+            )
+        )
+    return records
+
+
+def python_filter(records):
+    return [
+        r
+        for r in records
+        if r.property_type is PropertyType.HOUSE
+        and r.bedrooms is not None
+        and r.bedrooms >= 3
+        and r.current_price_cents is not None
+        and r.current_price_cents <= 90_000_000
+    ]
+
+
+def python_sort(records):
+    priced = [r for r in records if r.current_price_cents is not None]
+    unpriced = [r for r in records if r.current_price_cents is None]
+    return sorted(priced, key=lambda r: r.current_price_cents, reverse=True) + unpriced
+
+
+def python_group_median(records):
+    groups = defaultdict(list)
+    for r in records:
+        if r.current_price_cents is not None:
+            groups[(r.suburb, r.property_type)].append(r.current_price_cents)
+    return {key: statistics.median(values) for key, values in groups.items()}
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    records = generate_listing_records(args.size)
+    frame, elapsed = timed(lambda: ListingFrame.from_listings(records))
+    print(f"{args.size:,} listings, frame built in {elapsed:.3f}s")
+
+    questions = [
+        (
+            "filter",
+            lambda: python_filter(records),
+            lambda: frame.filter(property_type=PropertyType.HOUSE, min_bedrooms=3, max_price=900_000),
+        ),
+        ("sort", lambda: python_sort(records), lambda: frame.sort("current_price_cents", descending=True)),
+        (
+            "group-by median",
+            lambda: python_group_median(records),
+            lambda: frame.group_by("suburb", "property_type").median("current_price_cents"),
+        ),
+    ]
+    for label, loop, vectorized in questions:
+        expected, loop_elapsed = timed(loop)
+        result, frame_elapsed = timed(vectorized)
+        assert len(result) == len(expected)
+        print(
+            f"{label:>16}: loop {loop_elapsed * 1000:8.1f} ms  frame {frame_elapsed * 1000:8.1f} ms"
+            f"  ({loop_elapsed / frame_elapsed:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Memory benchmark for compact ListingRecord instances.
+
+Normalizes the listings in testdata/search.json, gives each a short price
+history and copies them up to N listings with distinct IDs. Reports bytes
+per listing held as Listing models and as ListingRecord instances. Strings
+shared with the source data (such as descriptions and IDs) are not counted for
+either.
+
+Usage:
+    python benchmarks/bench_listing_records.py
+    python benchmarks/bench_listing_records.py --size 1000000
+"""
+
+import argparse
+import tracemalloc
+
+from bench_trusted_listings import generate_records
+
+from models import Listing, ListingRecord
+
+
+def measure(build) -> int:
+    """Return the bytes allocated while building (and keeping) a working set."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    samples = generate_records(1)
+    records = []
+    for i in range(args.size):
+        data = dict(samples[i % len(samples)])
+        data["listing_id"] = f"{data['listing_id']}-{i}"
+        records.append(data)
+
+    listing_bytes = measure(lambda: Listing.from_trusted_batch(records))
+    listings = Listing.from_trusted_batch(records)
+    record_bytes = measure(lambda: ListingRecord.from_listings(listings))
+
+    print(f"{args.size:,} listings")
+    print(f"{'Listing':>14}: {listing_bytes / args.size:8.0f} bytes/listing")
+    print(f"{'ListingRecord':>14}: {record_bytes / args.size:8.0f} bytes/listing")
+
+
+if __name__ == "__main__":
+    main()
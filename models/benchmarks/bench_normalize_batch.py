@@ -0,0 +1,55 @@
+"""
+Benchmark for multi-process batch normalization.
+
+Copies the raw records in testdata/search.json up to N records (as JSON
+lines, as a backfill would read them) and times normalize_batch with
+increasing worker counts, reporting throughput, speedup over a single
+in-process run, and the CPU time spent in the coordinating process.
+
+Usage:
+    python benchmarks/bench_normalize_batch.py
+    python benchmarks/bench_normalize_batch.py --size 1000000 --workers 1 2 4 8
+    python benchmarks/bench_normalize_batch.py --compact
+"""
+
+import argparse
+import json
+import os
+import time
+
+from models import normalize_batch
+from sample_data import load_search_records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--compact", action="store_true", help="return ListingRecord objects")
+    args = parser.parse_args()
+
+    samples = load_search_records()
+    lines = [json.dumps(sample).encode() for sample in samples]
+    records = [lines[i % len(lines)] for i in range(args.size)]
+    print(f"{args.size:,} records, {os.cpu_count()} CPUs")
+
+    baseline = None
+    for workers in sorted(set(args.workers)):
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        result = normalize_batch(
+            records, "realestate.com.au", workers=workers, chunk_size=args.chunk_size, compact=args.compact
+        )
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+        assert len(result.listings) == args.size and not result.errors
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>3} workers: {elapsed:7.2f}s  ({args.size / elapsed:>9,.0f} records/s,"
+            f" {baseline / elapsed:4.1f}x, coordinator CPU {cpu:6.2f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark for streaming reads of large scraper output files.
+
+Writes the raw records in testdata/search.json, repeated `scale` times, to a
+temporary JSON array file (the scrapers' format) and a JSON Lines file. Then
+compares json.load against the streaming readers and streaming
+normalization, reporting time and peak traced memory.
+
+Usage:
+    python benchmarks/bench_streaming.py
+    python benchmarks/bench_streaming.py --scale 1000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+
+from models import iter_json_array, iter_records, normalize_batch, stream_normalize
+from sample_data import load_search_records
+
+
+def measure(label: str, fn, size: int) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    count = fn()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:>26}: {elapsed:7.2f}s  peak {peak / 2**20:8.1f} MiB  ({count:,} records)")
+
+
+def consume(iterator) -> int:
+    count = 0
+    for _ in iterator:
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=200)
+    args = parser.parse_args()
+
+    samples = load_search_records()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        array_path = Path(tmp) / "search.json"
+        jsonl_path = Path(tmp) / "search.jsonl"
+        with open(array_path, "w") as array_file, open(jsonl_path, "w") as jsonl_file:
+            array_file.write("[")
+            for i in range(args.scale):
+                for j, sample in enumerate(samples):
+                    line = json.dumps(sample)
+                    array_file.write(("," if i or j else "") + line)
+                    jsonl_file.write(line + "\n")
+            array_file.write("]")
+        size = args.scale * len(samples)
+        print(f"{size:,} records, {array_path.stat().st_size / 2**20:.0f} MiB")
+
+        def load_and_count():
+            with open(array_path) as f:
+                return len(json.load(f))
+
+        def load_and_normalize():
+            with open(array_path) as f:
+                return len(normalize_batch(json.load(f), "realestate.com.au", workers=1).listings)
+
+        def stream_and_normalize(path):
+            # Keep only the latest chunk, as a loader that saves each chunk would
+            results = deque(stream_normalize(path, "realestate.com.au"), maxlen=1)
+            return size if results else 0
+
+        measure("json.load", load_and_count, size)
+        measure("iter_json_array", lambda: consume(iter_json_array(array_path)), size)
+        measure("iter_records (jsonl)", lambda: consume(iter_records(jsonl_path)), size)
+        measure("json.load + normalize", load_and_normalize, size)
+        measure("stream_normalize (array)", lambda: stream_and_normalize(array_path), size)
+        measure("stream_normalize (jsonl)", lambda: stream_and_normalize(jsonl_path), size)
+
+
+if __name__ == "__main__":
+    main()
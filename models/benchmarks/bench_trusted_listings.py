@@ -0,0 +1,62 @@
+"""
+Benchmark for re-hydrating listings with and without validation.
+
+Normalizes the listings in testdata/search.json, gives each a short price and
+auction history, dumps them with model_dump() and scales the result up (1000x
+by default). Then measures rebuilding every listing with full pydantic
+validation (Listing.model_validate) against the trusted path
+(Listing.from_trusted_batch), which skips validation.
+
+Usage:
+    python benchmarks/bench_trusted_listings.py
+    python benchmarks/bench_trusted_listings.py --scale 100
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from models import Listing, ListingStatus, normalize_realestate_data
+from sample_data import load_search_records
+
+
+def generate_records(scale: int):
+    """Return model_dump() dicts for the sample listings, repeated `scale` times."""
+    raw = load_search_records()
+
+    records = []
+    for data in raw:
+        listing = normalize_realestate_data(data)
+        start = datetime(2024, 1, 1)
+        for week in range(4):
+            listing.add_price_record(Decimal(800_000 - week * 10_000), start + timedelta(weeks=week))
+        listing.add_auction_record(start + timedelta(weeks=6), ListingStatus.SCHEDULED, start)
+        records.append(listing.model_dump())
+    return records * scale
+
+
+def bench(label: str, load, records) -> float:
+    started = time.perf_counter()
+    listings = load(records)
+    elapsed = time.perf_counter() - started
+
+    assert len(listings) == len(records)
+    print(f"{label:>10}: {elapsed:8.3f}s  ({elapsed / len(records) * 1e6:6.1f} us/listing)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=1000)
+    args = parser.parse_args()
+
+    records = generate_records(args.scale)
+    print(f"{len(records):,} listings")
+    validated = bench("validated", lambda rs: [Listing.model_validate(r) for r in rs], records)
+    trusted = bench("trusted", Listing.from_trusted_batch, records)
+    print(f"{'speedup':>10}: {validated / trusted:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""
+Sample scraper output shared by the benchmarks.
+"""
+
+import json
+from pathlib import Path
+
+# Raw realestate.com.au search results captured from the scraper
+SEARCH_JSON = Path(__file__).resolve().parents[2] / "testdata" / "search.json"
+
+
+def load_search_records() -> list:
+    """Return the raw records in SEARCH_JSON."""
+    with open(SEARCH_JSON) as f:
+        return json.load(f)
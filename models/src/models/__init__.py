@@ -8,8 +8,28 @@ enums for status tracking and models for price/auction history.
 from .enums import ListingStatus, PropertyType, EventType
 from .listing import Listing, PriceHistory, AuctionHistory
 from .address import Address
-from .events import Event, EventTimeline
-from .normalizers import normalize_realestate_data, normalize_domain_data
+from .compact import ListingRecord
+from .frame import ListingFrame, ListingGroups
+from .events import Event, EventPage, EventTimeline, ListingSummary
+from .columnar import ColumnarEventTimeline
+from .concurrent_timeline import ConcurrentEventTimeline
+from .sharded_timeline import ShardedEventTimeline
+from .eventlog import EventLog, MappedEventTimeline, load_timeline
+from .sqlite_store import SQLiteEventTimeline, SQLiteListingStore
+from .jsonl import JSONLWriter, export_timeline, import_timeline, read_jsonl, write_jsonl
+from .retention import RetentionPolicy, RetentionEngine
+from .subscriptions import EventBroker, EventSubscription
+from .normalizers import (
+    BatchResult,
+    RecordError,
+    normalize_batch,
+    normalize_domain_data,
+    normalize_realestate_data,
+)
+from .streaming import iter_json_array, iter_jsonl_records, iter_records, stream_normalize
+from .fingerprint import FingerprintIndex, fingerprint_listing, fingerprint_record
+from .diff import FieldChange, ListingChanges, apply_changes, diff_listings, diff_record
+from .address_key import AddressIndex, address_key, record_address_key
 
 __all__ = [
     "Listing",
@@ -19,9 +39,49 @@ __all__ = [
     "Address",
     "PriceHistory",
     "AuctionHistory",
+    "ListingRecord",
+    "ListingFrame",
+    "ListingGroups",
     "Event",
     "EventTimeline",
+    "EventPage",
+    "ListingSummary",
+    "RetentionPolicy",
+    "RetentionEngine",
+    "EventBroker",
+    "EventSubscription",
+    "ColumnarEventTimeline",
+    "ConcurrentEventTimeline",
+    "ShardedEventTimeline",
+    "EventLog",
+    "MappedEventTimeline",
+    "load_timeline",
+    "SQLiteEventTimeline",
+    "SQLiteListingStore",
+    "JSONLWriter",
+    "write_jsonl",
+    "read_jsonl",
+    "export_timeline",
+    "import_timeline",
     "normalize_realestate_data",
     "normalize_domain_data",
+    "normalize_batch",
+    "BatchResult",
+    "RecordError",
+    "iter_json_array",
+    "iter_jsonl_records",
+    "iter_records",
+    "stream_normalize",
+    "FingerprintIndex",
+    "fingerprint_listing",
+    "fingerprint_record",
+    "FieldChange",
+    "ListingChanges",
+    "diff_listings",
+    "diff_record",
+    "apply_changes",
+    "AddressIndex",
+    "address_key",
+    "record_address_key",
 ]
 
@@ -0,0 +1,289 @@
+"""
+Canonical address keys for matching listings across sources.
+
+realestate.com.au gives a formatted address ("1/360 Dorset Road, Boronia, Vic
+3155") while domain.com.au gives separate unit, street number and street
+fields. This module reduces either to the same key, with case, spacing, unit
+prefixes and street type abbreviations normalized, and provides AddressIndex,
+a hash index from key to listings, so matching a record takes one lookup.
+"""
+
+import re
+from typing import Optional, Any, Dict, Iterable, List, Mapping, Tuple
+
+from .address import Address
+from .listing import Listing
+
+# Street types and directions, abbreviated (Australia Post style)
+STREET_TYPE_ABBREVIATIONS: Dict[str, str] = {
+    "alley": "aly",
+    "approach": "app",
+    "arcade": "arc",
+    "avenue": "ave",
+    "av": "ave",
+    "boulevard": "bvd",
+    "blvd": "bvd",
+    "circle": "cir",
+    "circuit": "cct",
+    "close": "cl",
+    "court": "ct",
+    "crescent": "cres",
+    "cr": "cres",
+    "crs": "cres",
+    "drive": "dr",
+    "drv": "dr",
+    "esplanade": "esp",
+    "freeway": "fwy",
+    "grove": "gr",
+    "gve": "gr",
+    "highway": "hwy",
+    "lane": "ln",
+    "parade": "pde",
+    "place": "pl",
+    "plaza": "plz",
+    "promenade": "prom",
+    "rise": "rise",
+    "road": "rd",
+    "square": "sq",
+    "street": "st",
+    "str": "st",
+    "terrace": "tce",
+    "track": "trk",
+    "walk": "wlk",
+    "way": "wy",
+}
+
+DIRECTION_ABBREVIATIONS: Dict[str, str] = {
+    "north": "n",
+    "south": "s",
+    "east": "e",
+    "west": "w",
+}
+
+_UNIT_PREFIX = re.compile(r"^(?:unit|apartment|apt|flat|villa|suite|shop|u)\s*", re.IGNORECASE)
+# "1/360 Dorset Road", "Unit 1/360 Dorset Road", "360A Dorset Road", "12-14 Smith St"
+_STREET_ADDRESS = re.compile(
+    r"^\s*(?:(?P<unit>[^/\s,]+(?:\s+[^/\s,]+)?)\s*/\s*)?(?P<number>\d+[a-z]?(?:\s*-\s*\d+[a-z]?)?)\s+(?P<street>.+?)\s*$",
+    re.IGNORECASE,
+)
+_NON_WORD = re.compile(r"[^\w\s/-]+")
+
+
+def _clean(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    return " ".join(_NON_WORD.sub(" ", str(value)).lower().split())
+
+
+def _unit(value: Optional[str]) -> str:
+    return _clean(_UNIT_PREFIX.sub("", str(value).strip())) if value else ""
+
+
+def _number(value: Optional[str]) -> str:
+    return _clean(value).replace(" ", "")
+
+
+def _street(value: Optional[str]) -> str:
+    words = _clean(value).split()
+    # Abbreviate a trailing direction, then the street type before it
+    if len(words) > 2 and words[-1] in DIRECTION_ABBREVIATIONS:
+        words[-1] = DIRECTION_ABBREVIATIONS[words[-1]]
+        type_index = -2
+    else:
+        type_index = -1
+    if len(words) > 1:
+        words[type_index] = STREET_TYPE_ABBREVIATIONS.get(words[type_index], words[type_index])
+    return " ".join(words)
+
+
+def split_street_address(value: Optional[str]) -> Optional[Tuple[Optional[str], str, str]]:
+    """
+    Split a street address line into unit, street number and street.
+
+    Only the part before the first comma is read, so a full address such as
+    "1/360 Dorset Road, Boronia, Vic 3155" works too.
+
+    Returns:
+        (unit or None, number, street), or None if the line has no street number
+    """
+    if not value:
+        return None
+    match = _STREET_ADDRESS.match(value.split(",", 1)[0])
+    if match is None:
+        return None
+    return match.group("unit"), match.group("number"), match.group("street")
+
+
+def canonical_key(
+    unit: Optional[str],
+    number: Optional[str],
+    street: Optional[str],
+    suburb: Optional[str],
+    postcode: Optional[str],
+) -> Optional[str]:
+    """
+    Build the canonical key for address parts.
+
+    Returns:
+        "unit|number|street|suburb|postcode" in normalized form, or None if
+        the street number, street or suburb is missing
+    """
+    number = _number(number)
+    street = _street(street)
+    suburb = _clean(suburb)
+    if not (number and street and suburb):
+        return None
+    return f"{_unit(unit)}|{number}|{street}|{suburb}|{_clean(postcode)}"
+
+
+def address_key(address: Address) -> Optional[str]:
+    """
+    Build the canonical key for an Address.
+
+    Uses the structured street fields when present, otherwise parses the
+    short or full address. A street field holding a combined "unit/number
+    street" line is split as well.
+
+    Returns:
+        Canonical key, or None if the address has no usable street address
+    """
+    if address.street_number and address.street_name:
+        return canonical_key(
+            address.unit_number, address.street_number, address.street_name, address.suburb, address.postcode
+        )
+    for line in (address.street_name, address.short_address, address.full_address):
+        parts = split_street_address(line)
+        if parts is not None:
+            return canonical_key(*parts, address.suburb, address.postcode)
+    return None
+
+
+def record_address_key(data: Mapping[str, Any], source: str) -> Optional[str]:
+    """
+    Build the canonical key straight from a raw scraper record, without normalizing it.
+
+    Args:
+        data: Raw JSON data from a scraper
+        source: Data source ("realestate.com.au" or "domain.com.au")
+
+    Returns:
+        Canonical key, or None if the record has no usable street address
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    if source == "realestate.com.au":
+        address = data.get("address") or {}
+        display = address.get("display") or {}
+        return address_key(
+            Address.model_construct(
+                suburb=address.get("suburb", ""),
+                state=address.get("state", ""),
+                postcode=address.get("postcode", ""),
+                full_address=display.get("fullAddress"),
+                short_address=display.get("shortAddress"),
+            )
+        )
+    if source == "domain.com.au":
+        return address_key(
+            Address.model_construct(
+                street_number=data.get("streetNumber"),
+                street_name=data.get("street"),
+                unit_number=data.get("unitNumber"),
+                suburb=data.get("suburb", ""),
+                state=data.get("state", ""),
+                postcode=data.get("postcode", ""),
+            )
+        )
+    raise ValueError(f"Unknown source: {source!r}")
+
+
+class AddressIndex:
+    """
+    Hash index from canonical address key to listings.
+
+    A listing is identified by (source, listing_id); adding it again
+    replaces the earlier version, moving it if its address changed.
+    Listings without a usable street address are not indexed.
+    """
+
+    def __init__(self, listings: Iterable[Listing] = ()):
+        """
+        Initialize the index.
+
+        Args:
+            listings: Optional listings to index
+        """
+        self._by_key: Dict[str, List[Listing]] = {}
+        self._key_by_listing: Dict[Tuple[Optional[str], str], str] = {}
+        self.add_many(listings)
+
+    def add(self, listing: Listing) -> Optional[str]:
+        """
+        Index a listing under its address key.
+
+        Returns:
+            The key, or None if the listing has no usable street address
+        """
+        self.discard(listing)
+        key = address_key(listing.address)
+        if key is None:
+            return None
+        self._by_key.setdefault(key, []).append(listing)
+        self._key_by_listing[(listing.source, listing.listing_id)] = key
+        return key
+
+    def add_many(self, listings: Iterable[Listing]) -> int:
+        """
+        Index many listings.
+
+        Returns:
+            Number of listings indexed
+        """
+        return sum(1 for listing in listings if self.add(listing) is not None)
+
+    def discard(self, listing: Listing) -> None:
+        """Remove a listing (by source and listing ID) if it is indexed."""
+        identity = (listing.source, listing.listing_id)
+        key = self._key_by_listing.pop(identity, None)
+        if key is None:
+            return
+        remaining = [other for other in self._by_key[key] if (other.source, other.listing_id) != identity]
+        if remaining:
+            self._by_key[key] = remaining
+        else:
+            del self._by_key[key]
+
+    def get(self, key: Optional[str]) -> List[Listing]:
+        """Return the listings indexed under a key."""
+        if key is None:
+            return []
+        return list(self._by_key.get(key, ()))
+
+    def find(self, address: Address) -> List[Listing]:
+        """Return the listings at the same address."""
+        return self.get(address_key(address))
+
+    def match(self, listing: Listing) -> List[Listing]:
+        """Return other listings at the same address as a listing (itself excluded)."""
+        identity = (listing.source, listing.listing_id)
+        return [other for other in self.find(listing.address) if (other.source, other.listing_id) != identity]
+
+    def match_record(self, data: Mapping[str, Any], source: str) -> List[Listing]:
+        """
+        Return the listings at the address of a raw scraper record.
+
+        Raises:
+            ValueError: If the source is unknown
+        """
+        return self.get(record_address_key(data, source))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def __len__(self) -> int:
+        """Return the number of listings indexed."""
+        return len(self._key_by_listing)
+
+    def __repr__(self) -> str:
+        return f"AddressIndex(listings={len(self)}, addresses={len(self._by_key)})"
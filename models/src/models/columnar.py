@@ -0,0 +1,420 @@
+"""
+Columnar event storage for large event histories.
+
+This module provides a compact, array-backed alternative to EventTimeline
+for multi-year histories with millions of events. Events are stored as
+columns of fixed-width integers and are only built into Event instances
+when a query returns them.
+"""
+
+import json
+import math
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from itertools import chain, islice
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+
+from .enums import EVENT_TYPE_CODES, EVENT_TYPES, EventType
+from .events import Event, EventInput, from_epoch_micros, to_epoch_micros, validate_events
+
+
+def encode_metadata(metadata: Dict[str, Any]) -> bytes:
+    """Encode event metadata as compact JSON, or empty bytes if there is none."""
+    if not metadata:
+        return b""
+    return json.dumps(metadata, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def decode_metadata(data: bytes) -> Dict[str, Any]:
+    """Decode metadata written by encode_metadata."""
+    return json.loads(data) if data else {}
+
+
+class ColumnarEventTimeline:
+    """
+    Array-backed event timeline with the same query API as EventTimeline.
+
+    Each event is one row across a set of typed columns:
+
+    - timestamps: int64 microseconds since the Unix epoch (UTC)
+    - listing codes: uint32 index into a dictionary of listing IDs
+    - type codes: uint8 event type code (see EVENT_TYPE_CODES)
+    - metadata: compact JSON in a shared byte buffer, addressed by end offsets
+
+    Rows are appended in insertion order, so a row number doubles as the
+    event's sequence number. The ordered indexes hold row numbers sorted by
+    (timestamp, -row), which returns events sharing a timestamp in insertion
+    order, exactly as EventTimeline does.
+
+    Each listing also keeps a count of its events per type, so
+    has_event_type and count_events for a listing and type are O(1) like
+    EventTimeline's (listing, type) index.
+
+    Metadata is kept as JSON, so it does not round-trip exactly: values
+    that are not JSON types, such as Decimal and datetime, come back as
+    strings. Naive timestamps are treated as UTC.
+    """
+
+    def __init__(self):
+        """Initialize an empty columnar timeline."""
+        self._timestamps = array("q")
+        self._tz_aware = array("B")
+        self._listing_codes = array("I")
+        self._type_codes = array("B")
+        self._metadata_ends = array("Q")
+        self._metadata = bytearray()
+
+        self._listing_ids: List[str] = []
+        self._listing_code_by_id: Dict[str, int] = {}
+
+        # Ordered indexes of row numbers
+        self._order = array("I")
+        self._rows_by_listing: Dict[int, array] = {}
+        self._rows_by_type: Dict[int, array] = {}
+        # Events per type code for each listing code
+        self._type_counts: Dict[int, array] = {}
+
+    def _row_key(self, row: int) -> Tuple[int, int]:
+        return self._timestamps[row], -row
+
+    def _listing_code(self, listing_id: str) -> int:
+        code = self._listing_code_by_id.get(listing_id)
+        if code is None:
+            code = self._listing_code_by_id[listing_id] = len(self._listing_ids)
+            self._listing_ids.append(listing_id)
+            self._rows_by_listing[code] = array("I")
+            self._type_counts[code] = array("I", [0]) * len(EVENT_TYPES)
+        return code
+
+    def _type_counts_for(self, code: int) -> array:
+        """Return a listing's per-type event counts, counting its rows if not yet known."""
+        counts = self._type_counts.get(code)
+        if counts is None:
+            counts = array("I", [0]) * len(EVENT_TYPES)
+            type_codes = self._type_codes
+            for row in self._rows_by_listing[code]:
+                counts[type_codes[row]] += 1
+            self._type_counts[code] = counts
+        return counts
+
+    def _append_row(self, event: Event) -> int:
+        """Append an event's columns and return its row number."""
+        row = len(self._timestamps)
+        micros, aware = to_epoch_micros(event.timestamp)
+        type_code = EVENT_TYPE_CODES[event.event_type]
+
+        listing_code = self._listing_code(event.listing_id)
+        self._timestamps.append(micros)
+        self._tz_aware.append(aware)
+        self._listing_codes.append(listing_code)
+        self._type_codes.append(type_code)
+        self._type_counts_for(listing_code)[type_code] += 1
+        self._metadata.extend(encode_metadata(event.metadata))
+        self._metadata_ends.append(len(self._metadata))
+
+        if type_code not in self._rows_by_type:
+            self._rows_by_type[type_code] = array("I")
+        return row
+
+    def _indexes_for(self, row: int) -> Tuple[array, array, array]:
+        return (
+            self._order,
+            self._rows_by_listing[self._listing_codes[row]],
+            self._rows_by_type[self._type_codes[row]],
+        )
+
+    def _insert(self, index: array, row: int) -> None:
+        key = self._row_key(row)
+        if not index or self._row_key(index[-1]) < key:
+            index.append(row)
+        else:
+            index.insert(bisect_left(index, key, key=self._row_key), row)
+
+    def _merge(self, index: array, rows: List[int]) -> None:
+        """Merge rows already sorted by key into an ordered index."""
+        if not index or self._row_key(index[-1]) < self._row_key(rows[0]):
+            index.extend(rows)
+            return
+        merged = sorted(chain(index, rows), key=self._row_key)
+        del index[:]
+        index.extend(merged)
+
+    def _build_event(self, row: int) -> Event:
+        """Materialize a row as an Event without re-validating it."""
+        start = self._metadata_ends[row - 1] if row > 0 else 0
+        end = self._metadata_ends[row]
+        return Event.model_construct(
+            event_type=EVENT_TYPES[self._type_codes[row]],
+            timestamp=from_epoch_micros(self._timestamps[row], bool(self._tz_aware[row])),
+            listing_id=self._listing_ids[self._listing_codes[row]],
+            metadata=decode_metadata(bytes(self._metadata[start:end])),
+        )
+
+    def add_event(
+        self,
+        event_type: EventType,
+        listing_id: str,
+        timestamp: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Event:
+        """
+        Add an event to the timeline.
+
+        Args:
+            event_type: Type of event
+            listing_id: ID of the listing
+            timestamp: When the event occurred (defaults to now)
+            metadata: Additional metadata about the event
+
+        Returns:
+            The created Event instance
+        """
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+
+        if metadata is None:
+            metadata = {}
+
+        event = Event(
+            event_type=event_type,
+            timestamp=timestamp,
+            listing_id=listing_id,
+            metadata=metadata,
+        )
+
+        row = self._append_row(event)
+        for index in self._indexes_for(row):
+            self._insert(index, row)
+
+        return event
+
+    def add_events(self, events: Iterable[EventInput]) -> Dict[str, int]:
+        """
+        Add a batch of events to the timeline.
+
+        Accepts the same inputs as EventTimeline.add_events and merges the
+        batch into each index with a single ordering step.
+
+        Args:
+            events: Event instances, mappings of Event fields, or tuples of
+                (event_type, listing_id[, timestamp[, metadata]])
+
+        Returns:
+            Number of events added per listing ID
+        """
+        validated = validate_events(events)
+        if not validated:
+            return {}
+
+        rows = sorted((self._append_row(event) for event in validated), key=self._row_key)
+
+        pending: Dict[int, Tuple[array, List[int]]] = {}
+        counts: Dict[str, int] = {}
+        for row in rows:
+            for index in self._indexes_for(row):
+                batch = pending.get(id(index))
+                if batch is None:
+                    batch = pending[id(index)] = (index, [])
+                batch[1].append(row)
+            listing_id = self._listing_ids[self._listing_codes[row]]
+            counts[listing_id] = counts.get(listing_id, 0) + 1
+
+        for index, batch_rows in pending.values():
+            self._merge(index, batch_rows)
+
+        return counts
+
+    def _select(
+        self,
+        listing_id: Optional[str],
+        event_type: Optional[EventType],
+    ) -> Tuple[Optional[array], Optional[int]]:
+        """Return the index answering a query and a type code still to filter on."""
+        if listing_id is None and event_type is None:
+            return self._order, None
+        if listing_id is None:
+            return self._rows_by_type.get(EVENT_TYPE_CODES[EventType(event_type)]), None
+
+        code = self._listing_code_by_id.get(listing_id)
+        if code is None:
+            return None, None
+        type_code = None if event_type is None else EVENT_TYPE_CODES[EventType(event_type)]
+        return self._rows_by_listing[code], type_code
+
+    def _newest_rows(self, rows: Iterable[int], type_code: Optional[int], limit: Optional[int]) -> Iterator[int]:
+        if type_code is not None:
+            type_codes = self._type_codes
+            rows = (row for row in rows if type_codes[row] == type_code)
+        return islice(rows, limit)
+
+    def get_events_for_listing(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Query events for a specific listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events for the listing, sorted by timestamp (most recent first)
+        """
+        rows, type_code = self._select(listing_id, event_type)
+        if rows is None:
+            return []
+        return [self._build_event(row) for row in self._newest_rows(reversed(rows), type_code, limit)]
+
+    def get_all_events(
+        self,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get all events, optionally filtered by type.
+
+        Args:
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events, sorted by timestamp (most recent first)
+        """
+        rows, type_code = self._select(None, event_type)
+        if rows is None:
+            return []
+        return [self._build_event(row) for row in self._newest_rows(reversed(rows), type_code, limit)]
+
+    def get_events_between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get events within a time range, optionally filtered by listing and/or type.
+
+        Args:
+            start: Earliest timestamp to include (None for no lower bound)
+            end: Latest timestamp to include (None for no upper bound)
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events in the range, sorted by timestamp (most recent first)
+        """
+        rows, type_code = self._select(listing_id, event_type)
+        if rows is None:
+            return []
+
+        low = 0 if start is None else bisect_left(rows, (to_epoch_micros(start)[0],), key=self._row_key)
+        high = len(rows)
+        if end is not None:
+            high = bisect_right(rows, (to_epoch_micros(end)[0], math.inf), key=self._row_key)
+
+        in_range = (rows[i] for i in range(high - 1, low - 1, -1))
+        return [self._build_event(row) for row in self._newest_rows(in_range, type_code, limit)]
+
+    def get_latest_event(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+    ) -> Optional[Event]:
+        """
+        Get the most recent event for a listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+
+        Returns:
+            Most recent event, or None if no events exist
+        """
+        events = self.get_events_for_listing(listing_id, event_type, limit=1)
+        return events[0] if events else None
+
+    def has_event_type(
+        self,
+        listing_id: str,
+        event_type: EventType,
+    ) -> bool:
+        """
+        Check if a listing has any events of a specific type.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Event type to check for
+
+        Returns:
+            True if listing has at least one event of this type
+        """
+        return self.count_events(listing_id, event_type) > 0
+
+    def count_events(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+    ) -> int:
+        """
+        Count events, optionally filtered by listing and/or event type.
+
+        Args:
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+
+        Returns:
+            Number of events matching the criteria
+        """
+        rows, type_code = self._select(listing_id, event_type)
+        if rows is None:
+            return 0
+        if type_code is None:
+            return len(rows)
+        return self._type_counts_for(self._listing_code_by_id[listing_id])[type_code]
+
+    def memory_usage(self) -> int:
+        """
+        Return the approximate number of bytes held by the timeline.
+
+        Counts the column and index buffers, the metadata buffer and the
+        listing ID dictionary.
+        """
+        buffers = [
+            self._timestamps,
+            self._tz_aware,
+            self._listing_codes,
+            self._type_codes,
+            self._metadata_ends,
+            self._order,
+            *self._rows_by_listing.values(),
+            *self._rows_by_type.values(),
+            *self._type_counts.values(),
+        ]
+        total = sum(buffer.itemsize * len(buffer) for buffer in buffers)
+        total += len(self._metadata)
+        total += sum(sys.getsizeof(listing_id) for listing_id in self._listing_ids)
+        return total
+
+    def bytes_per_event(self) -> float:
+        """Return the average number of bytes used per stored event."""
+        return self.memory_usage() / len(self) if len(self) else 0.0
+
+    def clear(self) -> None:
+        """Clear all events from the timeline."""
+        self.__init__()
+
+    def __len__(self) -> int:
+        """Return the total number of events."""
+        return len(self._timestamps)
+
+    def __repr__(self) -> str:
+        return f"ColumnarEventTimeline(events={len(self)}, listings={len(self._listing_ids)})"
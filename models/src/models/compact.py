@@ -0,0 +1,212 @@
+"""
+Compact in-memory listing records.
+
+This module provides ListingRecord, a slotted, read-only snapshot of the
+fields that ranking and filtering need, for services that keep millions of
+active listings in memory. Prices are stored as integer cents, enums as small
+integer codes, and suburb/state/postcode/source strings are interned so that
+listings in the same area share them.
+"""
+
+import sys
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional, Any, Dict, Iterable, List, Tuple
+
+from .enums import PROPERTY_TYPE_CODES, PROPERTY_TYPES, ListingStatus, PropertyType
+from .listing import Listing
+from .money import from_cents, to_cents
+
+LISTING_STATUSES: List[ListingStatus] = list(ListingStatus)
+LISTING_STATUS_CODES: Dict[ListingStatus, int] = {status: code for code, status in enumerate(LISTING_STATUSES)}
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def _size(value: Optional[Decimal]) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+class ListingRecord:
+    """
+    Read-only, slotted snapshot of a listing for the in-memory working set.
+
+    Holds the fields used to rank and filter listings; descriptions, links,
+    history and timestamps other than the auction date are left out. Use
+    to_listing to get a Listing back (with those fields at their defaults),
+    or look the full listing up by listing_id.
+    """
+
+    __slots__ = (
+        "listing_id",
+        "suburb",
+        "state",
+        "postcode",
+        "full_address",
+        "property_type_code",
+        "status_code",
+        "bedrooms",
+        "bathrooms",
+        "land_size",
+        "building_size",
+        "current_price_cents",
+        "previous_price_cents",
+        "auction_datetime",
+        "source",
+    )
+
+    listing_id: str
+    suburb: str
+    state: str
+    postcode: str
+    full_address: Optional[str]
+    property_type_code: int
+    status_code: int
+    bedrooms: Optional[int]
+    bathrooms: Optional[int]
+    land_size: Optional[float]
+    building_size: Optional[float]
+    current_price_cents: Optional[int]
+    previous_price_cents: Optional[int]
+    auction_datetime: Optional[datetime]
+    source: Optional[str]
+
+    def __init__(
+        self,
+        listing_id: str,
+        suburb: str,
+        state: str,
+        postcode: str,
+        full_address: Optional[str] = None,
+        property_type_code: int = PROPERTY_TYPE_CODES[PropertyType.OTHER],
+        status_code: int = LISTING_STATUS_CODES[ListingStatus.UNKNOWN],
+        bedrooms: Optional[int] = None,
+        bathrooms: Optional[int] = None,
+        land_size: Optional[float] = None,
+        building_size: Optional[float] = None,
+        current_price_cents: Optional[int] = None,
+        previous_price_cents: Optional[int] = None,
+        auction_datetime: Optional[datetime] = None,
+        source: Optional[str] = None,
+    ):
+        set_field = object.__setattr__
+        set_field(self, "listing_id", listing_id)
+        set_field(self, "suburb", sys.intern(suburb))
+        set_field(self, "state", sys.intern(state))
+        set_field(self, "postcode", sys.intern(postcode))
+        set_field(self, "full_address", full_address)
+        set_field(self, "property_type_code", property_type_code)
+        set_field(self, "status_code", status_code)
+        set_field(self, "bedrooms", bedrooms)
+        set_field(self, "bathrooms", bathrooms)
+        set_field(self, "land_size", land_size)
+        set_field(self, "building_size", building_size)
+        set_field(self, "current_price_cents", current_price_cents)
+        set_field(self, "previous_price_cents", previous_price_cents)
+        set_field(self, "auction_datetime", auction_datetime)
+        set_field(self, "source", _intern(source))
+
+    @classmethod
+    def from_listing(cls, listing: Listing) -> "ListingRecord":
+        """Build a compact record from a Listing."""
+        return cls(
+            listing_id=listing.listing_id,
+            suburb=listing.suburb,
+            state=listing.address.state,
+            postcode=listing.address.postcode,
+            full_address=listing.address.full_address,
+            property_type_code=PROPERTY_TYPE_CODES[listing.property_type],
+            status_code=LISTING_STATUS_CODES[listing.status],
+            bedrooms=listing.bedrooms,
+            bathrooms=listing.bathrooms,
+            land_size=_size(listing.land_size),
+            building_size=_size(listing.building_size),
+            current_price_cents=to_cents(listing.current_price),
+            previous_price_cents=to_cents(listing.previous_price),
+            auction_datetime=listing.auction_datetime,
+            source=listing.source,
+        )
+
+    @classmethod
+    def from_listings(cls, listings: Iterable[Listing]) -> List["ListingRecord"]:
+        """Build compact records for many listings."""
+        return [cls.from_listing(listing) for listing in listings]
+
+    def to_listing(self) -> Listing:
+        """
+        Convert back to a Listing.
+
+        Fields the record does not hold (description, links, history, street
+        details) are left at their defaults.
+        """
+        return Listing.from_trusted(
+            {
+                "listing_id": self.listing_id,
+                "address": {
+                    "suburb": self.suburb,
+                    "state": self.state,
+                    "postcode": self.postcode,
+                    "full_address": self.full_address,
+                },
+                "suburb": self.suburb,
+                "property_type": self.property_type,
+                "bedrooms": self.bedrooms,
+                "bathrooms": self.bathrooms,
+                "land_size": Decimal(repr(self.land_size)) if self.land_size is not None else None,
+                "building_size": Decimal(repr(self.building_size)) if self.building_size is not None else None,
+                "status": self.status,
+                "current_price": self.current_price,
+                "previous_price": self.previous_price,
+                "auction_datetime": self.auction_datetime,
+                "source": self.source,
+            }
+        )
+
+    @property
+    def property_type(self) -> PropertyType:
+        """Type of property."""
+        return PROPERTY_TYPES[self.property_type_code]
+
+    @property
+    def status(self) -> ListingStatus:
+        """Current listing status."""
+        return LISTING_STATUSES[self.status_code]
+
+    @property
+    def current_price(self) -> Optional[Decimal]:
+        """Current listing price as a Decimal."""
+        return from_cents(self.current_price_cents)
+
+    @property
+    def previous_price(self) -> Optional[Decimal]:
+        """Previous listing price as a Decimal."""
+        return from_cents(self.previous_price_cents)
+
+    def _values(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self):
+        return (type(self), self._values())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ListingRecord):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        return (
+            f"ListingRecord(listing_id={self.listing_id!r}, suburb={self.suburb!r}, "
+            f"property_type={self.property_type.value!r}, status={self.status.value!r}, "
+            f"current_price_cents={self.current_price_cents!r})"
+        )
@@ -0,0 +1,356 @@
+"""
+Thread-safe event timeline for concurrent writers.
+
+This module provides ConcurrentEventTimeline, which partitions events by
+listing ID across lock-striped EventTimeline instances so that ingestion
+threads writing different listings rarely contend on the same lock.
+"""
+
+import heapq
+import threading
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Sequence, Tuple
+
+from .enums import EventType
+from .events import Event, EventInput, EventTimeline, validate_events
+
+
+def shard_for(listing_id: str, shards: int) -> int:
+    """
+    Map a listing ID to a shard number in [0, shards).
+
+    Uses CRC32 rather than hash() so the mapping is the same in every process.
+    """
+    return zlib.crc32(listing_id.encode("utf-8")) % shards
+
+
+def merge_newest_first(
+    keyed_events: Iterable[Sequence[Tuple[Any, Event]]],
+    limit: Optional[int] = None,
+) -> List[Event]:
+    """
+    K-way merge lists of (key, event) pairs that are each sorted newest first.
+
+    Args:
+        keyed_events: One list per partition, each sorted by key descending
+        limit: Optional limit on number of events to return
+
+    Returns:
+        Merged events, sorted by key descending
+    """
+    merged = heapq.merge(*keyed_events, key=itemgetter(0), reverse=True)
+    return [event for _, event in islice(merged, limit)]
+
+
+class _Counter:
+    """Thread-safe sequence counter shared by all stripes."""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> "_Counter":
+        return self
+
+    def __next__(self) -> int:
+        with self._lock:
+            value = self._value
+            self._value += 1
+            return value
+
+    def reserve(self, n: int) -> range:
+        """Take `n` consecutive sequence numbers at once."""
+        with self._lock:
+            start = self._value
+            self._value += n
+        return range(start, start + n)
+
+
+class _StripeSequence:
+    """A stripe's sequence: numbers assigned to a batch by add_events, else fresh ones from the shared counter."""
+
+    def __init__(self, counter: _Counter):
+        self._counter = counter
+        self.pending: deque = deque()
+
+    def __iter__(self) -> "_StripeSequence":
+        return self
+
+    def __next__(self) -> int:
+        if self.pending:
+            return self.pending.popleft()
+        return next(self._counter)
+
+
+class ConcurrentEventTimeline:
+    """
+    Event timeline that is safe to share between threads.
+
+    Events are partitioned into stripes by a hash of their listing ID, each
+    stripe being an EventTimeline guarded by its own lock. Writes and
+    per-listing reads lock a single stripe. Global reads lock every stripe
+    (always in the same order) while they take their results, so they see a
+    consistent snapshot: a batch added with add_events is either entirely
+    visible or not at all. All stripes share one sequence counter, so merged
+    results order ties exactly as a single EventTimeline would.
+    """
+
+    def __init__(self, stripes: int = 16):
+        """
+        Initialize an empty concurrent timeline.
+
+        Args:
+            stripes: Number of lock stripes
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        self._sequence = _Counter()
+        self._stripe_sequences = [_StripeSequence(self._sequence) for _ in range(stripes)]
+        self._stripes = [EventTimeline(sequence=sequence) for sequence in self._stripe_sequences]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._listeners: List[Callable[[Event], None]] = []
+
+    def _stripe(self, listing_id: str) -> int:
+        return shard_for(listing_id, len(self._stripes))
+
+    @contextmanager
+    def _locked(self, stripes: Iterable[int]) -> Iterator[None]:
+        """Hold the locks of the given stripes, acquired in ascending order."""
+        held = []
+        try:
+            for i in sorted(set(stripes)):
+                self._locks[i].acquire()
+                held.append(i)
+            yield
+        finally:
+            for i in reversed(held):
+                self._locks[i].release()
+
+    def add_listener(self, listener: Callable[[Event], None]) -> None:
+        """
+        Register a callback invoked with every event added to the timeline.
+
+        Listeners run in the writing thread once its stripe locks have been
+        released, so a listener that waits (such as an attached EventBroker
+        applying backpressure) does not hold up readers.
+        """
+        # Replaced rather than mutated, so writers iterate a stable list
+        self._listeners = self._listeners + [listener]
+
+    def remove_listener(self, listener: Callable[[Event], None]) -> None:
+        """Unregister a callback added with add_listener."""
+        listeners = list(self._listeners)
+        listeners.remove(listener)
+        self._listeners = listeners
+
+    def _notify(self, events: List[Event]) -> None:
+        for listener in self._listeners:
+            for event in events:
+                listener(event)
+
+    def add_event(
+        self,
+        event_type: EventType,
+        listing_id: str,
+        timestamp: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Event:
+        """
+        Add an event to the timeline.
+
+        Args:
+            event_type: Type of event
+            listing_id: ID of the listing
+            timestamp: When the event occurred (defaults to now)
+            metadata: Additional metadata about the event
+
+        Returns:
+            The created Event instance
+        """
+        i = self._stripe(listing_id)
+        with self._locks[i]:
+            event = self._stripes[i].add_event(event_type, listing_id, timestamp, metadata)
+        self._notify([event])
+        return event
+
+    def add_events(self, events: Iterable[EventInput]) -> Dict[str, int]:
+        """
+        Add a batch of events to the timeline atomically.
+
+        The batch is validated and given sequence numbers in batch order
+        before any lock is taken, then every stripe it touches is locked while
+        the events are merged in. Events sharing a timestamp therefore keep
+        their batch order across stripes, as in a single EventTimeline.
+
+        Args:
+            events: Event instances, mappings of Event fields, or tuples of
+                (event_type, listing_id[, timestamp[, metadata]])
+
+        Returns:
+            Number of events added per listing ID
+        """
+        validated = validate_events(events)
+        by_stripe: Dict[int, Tuple[List[Event], List[int]]] = {}
+        for event, sequence_number in zip(validated, self._sequence.reserve(len(validated)), strict=True):
+            stripe_events, sequence_numbers = by_stripe.setdefault(self._stripe(event.listing_id), ([], []))
+            stripe_events.append(event)
+            sequence_numbers.append(sequence_number)
+
+        counts: Dict[str, int] = {}
+        with self._locked(by_stripe):
+            for i, (stripe_events, sequence_numbers) in by_stripe.items():
+                pending = self._stripe_sequences[i].pending
+                pending.extend(sequence_numbers)
+                try:
+                    counts.update(self._stripes[i].add_events(stripe_events))
+                finally:
+                    pending.clear()
+        self._notify(validated)
+        return counts
+
+    def get_events_for_listing(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Query events for a specific listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events for the listing, sorted by timestamp (most recent first)
+        """
+        i = self._stripe(listing_id)
+        with self._locks[i]:
+            return self._stripes[i].get_events_for_listing(listing_id, event_type, limit)
+
+    def get_all_events(
+        self,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get all events, optionally filtered by type.
+
+        Args:
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events, sorted by timestamp (most recent first)
+        """
+        return self.get_events_between(None, None, event_type=event_type, limit=limit)
+
+    def get_events_between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get events within a time range, optionally filtered by listing and/or type.
+
+        Args:
+            start: Earliest timestamp to include (None for no lower bound)
+            end: Latest timestamp to include (None for no upper bound)
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events in the range, sorted by timestamp (most recent first)
+        """
+        if listing_id is not None:
+            i = self._stripe(listing_id)
+            with self._locks[i]:
+                return self._stripes[i].get_events_between(start, end, listing_id, event_type, limit)
+
+        with self._locked(range(len(self._stripes))):
+            keyed = [stripe._keyed_events(None, event_type, start, end, limit) for stripe in self._stripes]
+        return merge_newest_first(keyed, limit)
+
+    def get_latest_event(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+    ) -> Optional[Event]:
+        """
+        Get the most recent event for a listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+
+        Returns:
+            Most recent event, or None if no events exist
+        """
+        i = self._stripe(listing_id)
+        with self._locks[i]:
+            return self._stripes[i].get_latest_event(listing_id, event_type)
+
+    def has_event_type(
+        self,
+        listing_id: str,
+        event_type: EventType,
+    ) -> bool:
+        """
+        Check if a listing has any events of a specific type.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Event type to check for
+
+        Returns:
+            True if listing has at least one event of this type
+        """
+        i = self._stripe(listing_id)
+        with self._locks[i]:
+            return self._stripes[i].has_event_type(listing_id, event_type)
+
+    def count_events(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+    ) -> int:
+        """
+        Count events, optionally filtered by listing and/or event type.
+
+        Args:
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+
+        Returns:
+            Number of events matching the criteria
+        """
+        if listing_id is not None:
+            i = self._stripe(listing_id)
+            with self._locks[i]:
+                return self._stripes[i].count_events(listing_id, event_type)
+
+        with self._locked(range(len(self._stripes))):
+            return sum(stripe.count_events(None, event_type) for stripe in self._stripes)
+
+    def clear(self) -> None:
+        """Clear all events from the timeline."""
+        with self._locked(range(len(self._stripes))):
+            for stripe in self._stripes:
+                stripe.clear()
+
+    def __len__(self) -> int:
+        """Return the total number of events."""
+        return self.count_events()
+
+    def __repr__(self) -> str:
+        return f"ConcurrentEventTimeline(events={len(self)}, stripes={len(self._stripes)})"
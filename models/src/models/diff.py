@@ -0,0 +1,211 @@
+"""
+Field-level diffs between listing snapshots.
+
+This module compares two versions of a Listing, or a stored Listing against
+newly scraped raw data, and returns a typed change set. Applying the change
+set goes through Listing.add_price_record and Listing.add_auction_record,
+so price drops and auction changes are logged as events automatically.
+"""
+
+from datetime import datetime
+from typing import Optional, Any, Dict, Iterable, Iterator, Mapping, NamedTuple
+
+from .enums import ListingStatus
+from .events import EventTimeline
+from .fingerprint import fingerprint_record
+from .listing import Listing
+from .normalizers import get_normalizer
+
+# Scraped Listing fields compared by diff_listings
+DIFF_FIELDS = (
+    "address",
+    "suburb",
+    "property_type",
+    "bedrooms",
+    "bathrooms",
+    "land_size",
+    "building_size",
+    "status",
+    "current_price",
+    "auction_datetime",
+    "property_link",
+    "description",
+)
+
+
+class FieldChange(NamedTuple):
+    """A change to one Listing field."""
+
+    field: str
+    old: Any
+    new: Any
+
+
+class ListingChanges:
+    """
+    The fields that differ between two snapshots of a listing.
+
+    Evaluates as false when nothing changed. Iterating yields FieldChange
+    entries in DIFF_FIELDS order.
+    """
+
+    __slots__ = ("listing_id", "changes")
+
+    def __init__(self, listing_id: str, changes: Iterable[FieldChange] = ()):
+        self.listing_id = listing_id
+        self.changes: Dict[str, FieldChange] = {change.field: change for change in changes}
+
+    @property
+    def price(self) -> Optional[FieldChange]:
+        """Change to current_price, if any."""
+        return self.changes.get("current_price")
+
+    @property
+    def status(self) -> Optional[FieldChange]:
+        """Change to status, if any."""
+        return self.changes.get("status")
+
+    @property
+    def auction_datetime(self) -> Optional[FieldChange]:
+        """Change to auction_datetime, if any."""
+        return self.changes.get("auction_datetime")
+
+    def get(self, field: str) -> Optional[FieldChange]:
+        """Return the change to a field, if any."""
+        return self.changes.get(field)
+
+    def __contains__(self, field: str) -> bool:
+        return field in self.changes
+
+    def __iter__(self) -> Iterator[FieldChange]:
+        return iter(self.changes.values())
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __repr__(self) -> str:
+        return f"ListingChanges(listing_id={self.listing_id!r}, fields={list(self.changes)})"
+
+
+def diff_listings(
+    old: Listing,
+    new: Listing,
+    old_fingerprint: Optional[str] = None,
+    new_fingerprint: Optional[str] = None,
+) -> ListingChanges:
+    """
+    Compare two snapshots of a listing.
+
+    Fields the new snapshot does not provide (None, or an UNKNOWN status)
+    are not reported as changes, since scrapes often omit them. History and
+    bookkeeping fields are not compared.
+
+    Args:
+        old: Previous (e.g. stored) snapshot
+        new: New snapshot
+        old_fingerprint: Optional stored fingerprint of the old snapshot
+        new_fingerprint: Optional fingerprint of the new snapshot; when both
+            are given and equal, the comparison is skipped
+
+    Returns:
+        Change set, empty if nothing changed
+    """
+    if old_fingerprint is not None and old_fingerprint == new_fingerprint:
+        return ListingChanges(old.listing_id)
+
+    old_values = old.__dict__
+    new_values = new.__dict__
+    changes = []
+    for field in DIFF_FIELDS:
+        new_value = new_values[field]
+        if new_value is None or new_value is ListingStatus.UNKNOWN:
+            continue
+        old_value = old_values[field]
+        if old_value != new_value:
+            changes.append(FieldChange(field, old_value, new_value))
+    return ListingChanges(old.listing_id, changes)
+
+
+def diff_record(
+    stored: Listing,
+    data: Mapping[str, Any],
+    source: str,
+    stored_fingerprint: Optional[str] = None,
+) -> ListingChanges:
+    """
+    Compare a stored listing against newly scraped raw data.
+
+    Args:
+        stored: Stored listing
+        data: Raw JSON data from a scraper
+        source: Data source ("realestate.com.au" or "domain.com.au")
+        stored_fingerprint: Optional fingerprint_record of the raw data the
+            stored listing was built from; when it matches the new data, the
+            data is not normalized at all
+
+    Returns:
+        Change set, empty if nothing changed
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    normalize = get_normalizer(source)
+    if stored_fingerprint is not None and stored_fingerprint == fingerprint_record(data, source):
+        return ListingChanges(stored.listing_id)
+    return diff_listings(stored, normalize(data))
+
+
+def apply_changes(
+    listing: Listing,
+    changes: ListingChanges,
+    timestamp: Optional[datetime] = None,
+    event_timeline: Optional[EventTimeline] = None,
+) -> Listing:
+    """
+    Apply a change set to a listing, logging events for price and auction changes.
+
+    A price change goes through add_price_record (logging PRICE_DROPPED on a
+    drop). A status or auction date change goes through add_auction_record
+    when an auction date is known (logging CANCELLED, VOIDED or
+    RESCHEDULED); otherwise the status is set directly. Other fields are
+    set directly.
+
+    Args:
+        listing: Listing to update in place
+        changes: Change set from diff_listings or diff_record
+        timestamp: When the changes were observed (defaults to now)
+        event_timeline: Optional EventTimeline to log events to
+
+    Returns:
+        The updated listing
+    """
+    if not changes:
+        return listing
+    if timestamp is None:
+        timestamp = datetime.utcnow()
+
+    for change in changes:
+        if change.field not in ("current_price", "status", "auction_datetime"):
+            setattr(listing, change.field, change.new)
+
+    if changes.price is not None:
+        listing.add_price_record(changes.price.new, timestamp, event_timeline)
+
+    if changes.status is not None or changes.auction_datetime is not None:
+        status = changes.status.new if changes.status is not None else listing.status
+        auction_datetime = (
+            changes.auction_datetime.new if changes.auction_datetime is not None else listing.auction_datetime
+        )
+        if auction_datetime is not None:
+            listing.add_auction_record(auction_datetime, status, timestamp, event_timeline=event_timeline)
+            if changes.auction_datetime is not None:
+                # add_auction_record only moves the date later; the scrape is authoritative
+                listing.auction_datetime = auction_datetime
+        else:
+            listing.status = status
+
+    listing.updated_at = timestamp
+    return listing
@@ -2,7 +2,10 @@
 Enums for property listing data models.
 """
 
+from array import array
 from enum import Enum
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, List
 
 
 class ListingStatus(str, Enum):
@@ -37,30 +40,125 @@ class PropertyType(str, Enum):
         return self.value
 
     @classmethod
-    def from_string(cls, value: str) -> "PropertyType":
-        """Convert string to PropertyType, handling variations."""
+    def from_string(cls, value: Optional[str], source: Optional[str] = None) -> "PropertyType":
+        """
+        Convert string to PropertyType, handling variations.
+
+        Labels are looked up in the source's vocabulary (when given) and then
+        in a table of known labels; other strings are classified by keyword,
+        and the result is memoized.
+
+        Args:
+            value: Property type label, e.g. "House" or "Apartment / Unit / Flat"
+            source: Optional data source ("realestate.com.au" or "domain.com.au")
+        """
         if not value:
             return cls.OTHER
+        if source is not None:
+            property_type = SOURCE_PROPERTY_TYPES.get(source, {}).get(value)
+            if property_type is not None:
+                return property_type
+        return _property_type_for_label(value)
 
-        value_lower = value.lower().strip()
-
-        # Handle common variations
-        if "house" in value_lower:
-            return cls.HOUSE
-        elif "unit" in value_lower or "flat" in value_lower:
-            return cls.UNIT
-        elif "apartment" in value_lower:
-            return cls.APARTMENT
-        elif "townhouse" in value_lower or "town house" in value_lower:
-            return cls.TOWNHOUSE
-        elif "villa" in value_lower:
-            return cls.VILLA
-        elif "land" in value_lower:
-            return cls.LAND
-        elif "studio" in value_lower:
-            return cls.STUDIO
-        else:
-            return cls.OTHER
+    @classmethod
+    def from_strings(cls, values: Iterable[Optional[str]], source: Optional[str] = None) -> array:
+        """
+        Convert many labels to PropertyType codes in one pass.
+
+        Codes are positions in declaration order (list(PropertyType)), as
+        used by ListingRecord and ListingFrame. Each distinct label is
+        converted once.
+
+        Args:
+            values: Property type labels
+            source: Optional data source ("realestate.com.au" or "domain.com.au")
+
+        Returns:
+            array("B") of codes, one per label
+        """
+        codes: Dict[Optional[str], int] = {}
+        result = array("B")
+        append = result.append
+        for value in values:
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = PROPERTY_TYPE_CODES[cls.from_string(value, source)]
+            append(code)
+        return result
+
+
+# Keyword rules for labels not in a table, checked in order. "townhouse" comes
+# before "house", which it contains.
+_PROPERTY_TYPE_KEYWORDS = (
+    (("townhouse", "town house"), PropertyType.TOWNHOUSE),
+    (("house",), PropertyType.HOUSE),
+    (("unit", "flat"), PropertyType.UNIT),
+    (("apartment",), PropertyType.APARTMENT),
+    (("villa",), PropertyType.VILLA),
+    (("land",), PropertyType.LAND),
+    (("studio",), PropertyType.STUDIO),
+)
+
+# Compact codes are positions in declaration order (used by ListingRecord,
+# ListingFrame and PropertyType.from_strings)
+PROPERTY_TYPES: List[PropertyType] = list(PropertyType)
+PROPERTY_TYPE_CODES: Dict[PropertyType, int] = {
+    property_type: code for code, property_type in enumerate(PROPERTY_TYPES)
+}
+
+# Known labels (lower case, single-spaced) from both sources
+PROPERTY_TYPE_LABELS: Dict[str, PropertyType] = {
+    **{property_type.value: property_type for property_type in PropertyType},
+    "apartment / unit / flat": PropertyType.UNIT,
+    "new apartments / off the plan": PropertyType.APARTMENT,
+    "penthouse": PropertyType.APARTMENT,
+    "town house": PropertyType.TOWNHOUSE,
+    "vacant land": PropertyType.LAND,
+}
+
+# Labels as each site emits them
+REALESTATE_PROPERTY_TYPES: Dict[str, PropertyType] = {
+    "House": PropertyType.HOUSE,
+    "Unit": PropertyType.UNIT,
+    "Apartment": PropertyType.APARTMENT,
+    "Townhouse": PropertyType.TOWNHOUSE,
+    "Villa": PropertyType.VILLA,
+    "Land": PropertyType.LAND,
+    "Studio": PropertyType.STUDIO,
+}
+
+DOMAIN_PROPERTY_TYPES: Dict[str, PropertyType] = {
+    # Display labels (listing pages)
+    "House": PropertyType.HOUSE,
+    "Apartment / Unit / Flat": PropertyType.UNIT,
+    "New Apartments / Off the Plan": PropertyType.APARTMENT,
+    "Townhouse": PropertyType.TOWNHOUSE,
+    "Villa": PropertyType.VILLA,
+    "Vacant land": PropertyType.LAND,
+    "Studio": PropertyType.STUDIO,
+    # Codes (search results)
+    "ApartmentUnitFlat": PropertyType.UNIT,
+    "NewApartments": PropertyType.APARTMENT,
+    "Penthouse": PropertyType.APARTMENT,
+    "VacantLand": PropertyType.LAND,
+}
+
+SOURCE_PROPERTY_TYPES: Dict[str, Dict[str, PropertyType]] = {
+    "realestate.com.au": REALESTATE_PROPERTY_TYPES,
+    "domain.com.au": DOMAIN_PROPERTY_TYPES,
+}
+
+
+@lru_cache(maxsize=1024)
+def _property_type_for_label(value: str) -> PropertyType:
+    value_lower = " ".join(value.lower().split())
+    property_type = PROPERTY_TYPE_LABELS.get(value_lower)
+    if property_type is not None:
+        return property_type
+    for keywords, property_type in _PROPERTY_TYPE_KEYWORDS:
+        if any(keyword in value_lower for keyword in keywords):
+            return property_type
+    return PropertyType.OTHER
 
 
 class EventType(str, Enum):
@@ -74,3 +172,17 @@ class EventType(str, Enum):
     def __str__(self) -> str:
         return self.value
 
+
+# Codes for event types in event logs on disk (eventlog.py) and in
+# ColumnarEventTimeline, pinned rather than taken from declaration order so
+# existing logs keep their meaning. Never renumber or reuse a code; give a
+# new type the next one.
+EVENT_TYPE_CODES: Dict[EventType, int] = {
+    EventType.AUCTION_CANCELLED: 0,
+    EventType.AUCTION_RESCHEDULED: 1,
+    EventType.AUCTION_VOIDED: 2,
+    EventType.PRICE_DROPPED: 3,
+}
+# Event types by code
+EVENT_TYPES: List[EventType] = sorted(EVENT_TYPE_CODES, key=EVENT_TYPE_CODES.__getitem__)
+
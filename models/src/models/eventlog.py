@@ -0,0 +1,374 @@
+"""
+Persistent, append-only event log.
+
+This module stores events on disk so that history survives process restarts.
+An event log is a directory containing:
+
+- ``events.dat``: a small header followed by fixed-size 24-byte records
+  (int64 timestamp, uint32 listing code, uint8 type code from the pinned
+  EVENT_TYPE_CODES table, uint8 timezone flag, uint64 end offset of the
+  event's metadata)
+- ``metadata.dat``: the metadata blob segment, compact JSON per event
+- ``listings.dat``: the listing ID dictionary, one JSON string per line
+- ``index.dat``: an optional checkpoint of the ordered indexes
+
+Records are only ever appended, and a record is written after the listing ID
+and metadata it references, so a crash can at worst leave a partial trailing
+record, which is ignored on reopen. Reopening memory-maps the record file and
+the checkpointed indexes; only records appended after the last checkpoint are
+indexed in memory.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+from .columnar import ColumnarEventTimeline, encode_metadata
+from .enums import EVENT_TYPE_CODES, EVENT_TYPES
+from .events import Event, EventInput, to_epoch_micros, validate_events
+
+EVENTS_FILE = "events.dat"
+METADATA_FILE = "metadata.dat"
+LISTINGS_FILE = "listings.dat"
+INDEX_FILE = "index.dat"
+
+_EVENTS_MAGIC = b"UHFEVLOG"
+_INDEX_MAGIC = b"UHFEVIDX"
+_VERSION = 1
+
+# Header: magic, format version, record size (16 bytes keeps records 8-byte aligned)
+_EVENTS_HEADER = struct.Struct("<8sII")
+# Record: timestamp, listing code, type code, tz-aware flag, padding, metadata end
+_RECORD = struct.Struct("<qIBBxxQ")
+# Index header: magic, version, padding, rows covered, listing count, type count
+_INDEX_HEADER = struct.Struct("<8sIIQQQ")
+
+
+class EventLog:
+    """
+    Append-only on-disk event log.
+
+    Use an EventLog to durably record events and `load_timeline` to reopen
+    them in any process:
+
+        with EventLog("data/events") as log:
+            log.append_events(events)
+            log.checkpoint()
+
+        timeline = load_timeline("data/events")
+        timeline.get_events_between(start, end, event_type=EventType.PRICE_DROPPED)
+    """
+
+    def __init__(self, path: Union[str, Path], fsync: bool = False):
+        """
+        Open an event log for appending, creating it if needed.
+
+        Args:
+            path: Directory holding the log files
+            fsync: Whether flush() should also fsync the files to disk
+        """
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+
+        events_path = self.path / EVENTS_FILE
+        if not events_path.exists() or events_path.stat().st_size < _EVENTS_HEADER.size:
+            with open(events_path, "wb") as f:
+                f.write(_EVENTS_HEADER.pack(_EVENTS_MAGIC, _VERSION, _RECORD.size))
+        else:
+            _read_events_header(events_path)
+
+        # Drop anything an interrupted write left past the last complete
+        # record: a partial record, unreferenced metadata, a partial listing ID
+        record_bytes = events_path.stat().st_size - _EVENTS_HEADER.size
+        self._count = record_bytes // _RECORD.size
+        self._events_file = open(events_path, "r+b")
+        self._events_file.truncate(_EVENTS_HEADER.size + self._count * _RECORD.size)
+        self._metadata_size = 0
+        if self._count:
+            self._events_file.seek(_EVENTS_HEADER.size + (self._count - 1) * _RECORD.size)
+            self._metadata_size = _RECORD.unpack(self._events_file.read(_RECORD.size))[-1]
+        self._events_file.seek(0, os.SEEK_END)
+
+        self._listing_ids = _read_listing_ids(self.path / LISTINGS_FILE)
+        self._listing_code_by_id = {listing_id: code for code, listing_id in enumerate(self._listing_ids)}
+        listings_size = sum(len(json.dumps(i).encode("utf-8")) + 1 for i in self._listing_ids)
+
+        self._metadata_file = open(self.path / METADATA_FILE, "ab")
+        self._metadata_file.truncate(self._metadata_size)
+        self._listings_file = open(self.path / LISTINGS_FILE, "ab")
+        self._listings_file.truncate(listings_size)
+
+    def append(self, event: EventInput) -> None:
+        """Append a single event to the log."""
+        self.append_events([event])
+
+    def append_events(self, events: Iterable[EventInput]) -> int:
+        """
+        Append a batch of events to the log.
+
+        Accepts the same inputs as EventTimeline.add_events. Events are written
+        in input order; ordering by timestamp happens when the log is indexed.
+
+        Args:
+            events: Event instances, mappings of Event fields, or tuples of
+                (event_type, listing_id[, timestamp[, metadata]])
+
+        Returns:
+            Number of events appended
+        """
+        validated = validate_events(events)
+        new_listings = []
+        metadata = bytearray()
+        records = bytearray()
+
+        for event in validated:
+            code = self._listing_code_by_id.get(event.listing_id)
+            if code is None:
+                code = self._listing_code_by_id[event.listing_id] = len(self._listing_ids)
+                self._listing_ids.append(event.listing_id)
+                new_listings.append(event.listing_id)
+
+            micros, aware = to_epoch_micros(event.timestamp)
+            metadata.extend(encode_metadata(event.metadata))
+            records.extend(
+                _RECORD.pack(
+                    micros,
+                    code,
+                    EVENT_TYPE_CODES[event.event_type],
+                    aware,
+                    self._metadata_size + len(metadata),
+                )
+            )
+
+        # Write referenced data before the records that point at it
+        if new_listings:
+            self._listings_file.write("".join(json.dumps(i) + "\n" for i in new_listings).encode("utf-8"))
+            self._listings_file.flush()
+        self._metadata_file.write(metadata)
+        self._metadata_file.flush()
+        self._events_file.write(records)
+
+        self._metadata_size += len(metadata)
+        self._count += len(validated)
+        return len(validated)
+
+    def flush(self) -> None:
+        """Flush buffered writes, and fsync them if the log was opened with fsync=True."""
+        for f in (self._listings_file, self._metadata_file, self._events_file):
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def checkpoint(self) -> None:
+        """
+        Write the ordered indexes for every record currently in the log.
+
+        Reopening a checkpointed log maps these indexes directly instead of
+        rebuilding them. Only records appended after the checkpoint need to be
+        indexed on load, so this is cheap to call periodically.
+        """
+        self.flush()
+        write_index(load_timeline(self.path), self.path / INDEX_FILE)
+
+    def close(self) -> None:
+        """Flush and close the log files."""
+        self.flush()
+        for f in (self._listings_file, self._metadata_file, self._events_file):
+            f.close()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of events in the log."""
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"EventLog(path={str(self.path)!r}, events={self._count}, listings={len(self._listing_ids)})"
+
+
+class MappedEventTimeline(ColumnarEventTimeline):
+    """
+    Read-only ColumnarEventTimeline backed by a memory-mapped event log.
+
+    Columns are strided views over the mapped record file, so opening the log
+    does not parse the records. Create instances with `load_timeline`; new
+    events should be appended through an EventLog and the log reloaded.
+    """
+
+    def add_event(self, *args, **kwargs) -> Event:
+        raise TypeError("MappedEventTimeline is read-only; append events through an EventLog")
+
+    def add_events(self, *args, **kwargs) -> Dict[str, int]:
+        raise TypeError("MappedEventTimeline is read-only; append events through an EventLog")
+
+    def clear(self) -> None:
+        raise TypeError("MappedEventTimeline is read-only; append events through an EventLog")
+
+    def __repr__(self) -> str:
+        return f"MappedEventTimeline(events={len(self)}, listings={len(self._listing_ids)})"
+
+
+def load_timeline(path: Union[str, Path]) -> MappedEventTimeline:
+    """
+    Reopen an event log as a queryable, read-only timeline.
+
+    Args:
+        path: Directory holding the log files
+
+    Returns:
+        MappedEventTimeline over the records present when the log was opened
+    """
+    path = Path(path)
+    events_path = path / EVENTS_FILE
+    _read_events_header(events_path)
+
+    # Size the record file before reading what records point at: a writer
+    # appends listing IDs and metadata before the records that use them, so
+    # everything the first `count` records reference is already on disk
+    count = (events_path.stat().st_size - _EVENTS_HEADER.size) // _RECORD.size
+    records = _map(events_path)[_EVENTS_HEADER.size : _EVENTS_HEADER.size + count * _RECORD.size]
+    listing_ids = _read_listing_ids(path / LISTINGS_FILE)
+
+    timeline = MappedEventTimeline()
+    timeline._timestamps = records.cast("q")[0::3]
+    timeline._listing_codes = records.cast("I")[2::6]
+    timeline._type_codes = records[12 :: _RECORD.size]
+    timeline._tz_aware = records[13 :: _RECORD.size]
+    timeline._metadata_ends = records.cast("Q")[2::3]
+    timeline._metadata = _map(path / METADATA_FILE)
+    timeline._listing_ids = listing_ids
+    timeline._listing_code_by_id = {listing_id: code for code, listing_id in enumerate(listing_ids)}
+
+    indexed = _read_index(timeline, path / INDEX_FILE, count)
+    for code in range(len(listing_ids)):
+        timeline._rows_by_listing.setdefault(code, array("I"))
+
+    # Index records appended since the last checkpoint in memory
+    if indexed < count:
+        tail = sorted(range(indexed, count), key=timeline._row_key)
+        timeline._order = _mutable(timeline._order)
+        timeline._merge(timeline._order, tail)
+
+        by_listing: Dict[int, List[int]] = {}
+        by_type: Dict[int, List[int]] = {}
+        for row in tail:
+            by_listing.setdefault(timeline._listing_codes[row], []).append(row)
+            by_type.setdefault(timeline._type_codes[row], []).append(row)
+
+        for indexes, batches in ((timeline._rows_by_listing, by_listing), (timeline._rows_by_type, by_type)):
+            for code, rows in batches.items():
+                index = indexes[code] = _mutable(indexes.get(code, array("I")))
+                timeline._merge(index, rows)
+
+    return timeline
+
+
+def write_index(timeline: ColumnarEventTimeline, path: Union[str, Path]) -> None:
+    """
+    Write a timeline's ordered indexes to an index file.
+
+    The file is written to a temporary path and atomically renamed, so readers
+    never see a partially written index.
+    """
+    path = Path(path)
+    rows = len(timeline)
+    listing_count = len(timeline._listing_ids)
+    type_count = len(EVENT_TYPES)
+
+    listing_offsets, listing_rows = _flatten(timeline._rows_by_listing, listing_count)
+    type_offsets, type_rows = _flatten(timeline._rows_by_type, type_count)
+
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _VERSION, 0, rows, listing_count, type_count))
+        for values in (timeline._order, listing_offsets, listing_rows, type_offsets, type_rows):
+            f.write(values)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_index(timeline: MappedEventTimeline, path: Path, count: int) -> int:
+    """Attach checkpointed indexes to a timeline and return the rows they cover."""
+    if not path.exists():
+        return 0
+
+    view = _map(path)
+    magic, version, _, rows, listing_count, type_count = _INDEX_HEADER.unpack_from(view)
+    if magic != _INDEX_MAGIC or version != _VERSION or rows > count or type_count != len(EVENT_TYPES):
+        return 0
+
+    values = view[_INDEX_HEADER.size :].cast("I")
+    position = 0
+
+    def take(size: int) -> memoryview:
+        nonlocal position
+        section = values[position : position + size]
+        position += size
+        return section
+
+    timeline._order = take(rows)
+    listing_offsets = take(listing_count + 1)
+    listing_rows = take(rows)
+    type_offsets = take(type_count + 1)
+    type_rows = take(rows)
+
+    for code in range(listing_count):
+        timeline._rows_by_listing[code] = listing_rows[listing_offsets[code] : listing_offsets[code + 1]]
+    for code in range(type_count):
+        if type_offsets[code + 1] > type_offsets[code]:
+            timeline._rows_by_type[code] = type_rows[type_offsets[code] : type_offsets[code + 1]]
+
+    return rows
+
+
+def _flatten(indexes: Dict[int, Iterable[int]], size: int) -> tuple:
+    """Flatten per-code row indexes into (offsets, rows) arrays."""
+    offsets = array("I", [0])
+    rows = array("I")
+    for code in range(size):
+        rows.extend(indexes.get(code, ()))
+        offsets.append(len(rows))
+    return offsets, rows
+
+
+def _mutable(rows) -> array:
+    """Return an index as a mutable array, copying it out of a mapped view if needed."""
+    return rows if isinstance(rows, array) else array("I", rows)
+
+
+def _map(path: Path) -> memoryview:
+    """Memory-map a file read-only, returning an empty view for empty files."""
+    if not path.exists() or path.stat().st_size == 0:
+        return memoryview(b"")
+    with open(path, "rb") as f:
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _read_events_header(path: Path) -> None:
+    with open(path, "rb") as f:
+        header = f.read(_EVENTS_HEADER.size)
+    if len(header) < _EVENTS_HEADER.size:
+        raise ValueError(f"Not an event log: {path}")
+    magic, version, record_size = _EVENTS_HEADER.unpack(header)
+    if magic != _EVENTS_MAGIC or version != _VERSION or record_size != _RECORD.size:
+        raise ValueError(f"Not an event log or unsupported version: {path}")
+
+
+def _read_listing_ids(path: Path) -> List[str]:
+    """Read the listing ID dictionary, ignoring a partially written last line."""
+    if not path.exists():
+        return []
+    with open(path, "rb") as f:
+        data = f.read()
+    lines = data.split(b"\n")
+    return [json.loads(line) for line in lines[:-1]]
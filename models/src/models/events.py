@@ -5,11 +5,20 @@ This module provides event logging functionality that stores events with
 timestamps and metadata, and allows querying events per listing.
 """
 
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+import base64
+import math
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from itertools import count, islice
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, NamedTuple, Set, Tuple, Union
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from .enums import EventType
+from .money import from_cents, to_cents
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
 
 
 class Event(BaseModel):
@@ -38,6 +47,381 @@ class Event(BaseModel):
         return f"Event(type={self.event_type}, listing_id={self.listing_id}, timestamp={self.timestamp})"
 
 
+_AUCTION_OUTCOMES = {
+    EventType.AUCTION_CANCELLED,
+    EventType.AUCTION_RESCHEDULED,
+    EventType.AUCTION_VOIDED,
+}
+
+
+def _drop_amount_cents(event: Event) -> Optional[int]:
+    """Return a price drop event's drop amount in cents, if recorded."""
+    cents = event.metadata.get("drop_amount_cents")
+    if cents is None:
+        # Events logged before amounts were also recorded in cents
+        try:
+            cents = to_cents(str(event.metadata["drop_amount"]))
+        except (KeyError, InvalidOperation, ValueError):
+            pass
+    return cents
+
+
+class ListingSummary(BaseModel):
+    """
+    Compact summary of events that were compacted out of a timeline.
+
+    Retention rolls old events into one summary per listing so that their
+    totals remain queryable after the events themselves are dropped.
+    """
+
+    listing_id: str = Field(..., description="ID of the listing the summary covers")
+    event_counts: Dict[EventType, int] = Field(default_factory=dict, description="Compacted events per type")
+    price_drop_count: int = Field(0, description="Number of compacted PRICE_DROPPED events")
+    total_drop_amount: Decimal = Field(Decimal("0"), description="Sum of compacted price drop amounts")
+    total_drop_amount_cents: int = Field(0, description="Sum of compacted price drop amounts in cents")
+    last_auction_outcome: Optional[EventType] = Field(None, description="Most recent compacted auction event type")
+    last_auction_outcome_at: Optional[datetime] = Field(None, description="When the last auction outcome occurred")
+    first_event_at: Optional[datetime] = Field(None, description="Timestamp of the oldest compacted event")
+    last_event_at: Optional[datetime] = Field(None, description="Timestamp of the newest compacted event")
+
+    class Config:
+        """Pydantic configuration."""
+
+        json_encoders = {
+            Decimal: str,
+            datetime: lambda v: v.isoformat(),
+        }
+
+    @property
+    def event_count(self) -> int:
+        """Total number of compacted events."""
+        return sum(self.event_counts.values())
+
+    def absorb(self, event: Event) -> None:
+        """Fold an event into the summary."""
+        self.event_counts[event.event_type] = self.event_counts.get(event.event_type, 0) + 1
+
+        if self.first_event_at is None or event.timestamp < self.first_event_at:
+            self.first_event_at = event.timestamp
+        if self.last_event_at is None or event.timestamp >= self.last_event_at:
+            self.last_event_at = event.timestamp
+
+        if event.event_type == EventType.PRICE_DROPPED:
+            self.price_drop_count += 1
+            cents = _drop_amount_cents(event)
+            if cents is not None:
+                self.total_drop_amount_cents += cents
+                self.total_drop_amount = from_cents(self.total_drop_amount_cents)
+        elif event.event_type in _AUCTION_OUTCOMES:
+            if self.last_auction_outcome_at is None or event.timestamp >= self.last_auction_outcome_at:
+                self.last_auction_outcome = event.event_type
+                self.last_auction_outcome_at = event.timestamp
+
+
+def to_epoch_micros(value: datetime) -> Tuple[int, bool]:
+    """
+    Convert a datetime to integer microseconds since the Unix epoch.
+
+    Naive datetimes are treated as UTC, which matches the `datetime.utcnow()`
+    default used throughout the models.
+
+    Returns:
+        Tuple of (microseconds, whether the datetime was timezone-aware)
+    """
+    if value.tzinfo is not None:
+        return (value.astimezone(timezone.utc).replace(tzinfo=None) - _EPOCH) // _MICROSECOND, True
+    return (value - _EPOCH) // _MICROSECOND, False
+
+
+def from_epoch_micros(micros: int, aware: bool = False) -> datetime:
+    """Convert microseconds since the Unix epoch back to a datetime (UTC if aware)."""
+    value = _EPOCH + timedelta(microseconds=micros)
+    return value.replace(tzinfo=timezone.utc) if aware else value
+
+
+# Accepted inputs for EventTimeline.add_events: an Event, a mapping of Event
+# fields, or a tuple of (event_type, listing_id[, timestamp[, metadata]])
+EventInput = Union[Event, Dict[str, Any], Tuple[Any, ...]]
+
+_EVENT_LIST_ADAPTER = TypeAdapter(List[Event])
+_validate_event = Event.model_validate
+
+
+def validate_events(events: Iterable[EventInput]) -> List[Event]:
+    """
+    Validate a batch of event inputs into Event instances in one pass.
+
+    Tuples are read as (event_type, listing_id[, timestamp[, metadata]]) and a
+    missing timestamp defaults to the time of the call. Existing Event
+    instances are passed through without re-validation.
+
+    Args:
+        events: Event instances, mappings of Event fields, or tuples
+
+    Returns:
+        List of validated Event instances, in input order
+
+    Raises:
+        pydantic.ValidationError: If any input is not a valid event
+    """
+    now = datetime.utcnow()
+    items = list(events)
+    try:
+        # One model validation per item, with no intermediate dicts for tuples
+        validated = []
+        append = validated.append
+        for item in items:
+            if isinstance(item, Event):
+                append(item)
+                continue
+            if isinstance(item, tuple):
+                size = len(item)
+                if size == 3:
+                    event_type, listing_id, timestamp = item
+                    metadata = None
+                elif size == 4:
+                    event_type, listing_id, timestamp, metadata = item
+                elif size == 2:
+                    event_type, listing_id = item
+                    timestamp = metadata = None
+                else:
+                    append(_validate_event(item))
+                    continue
+                append(
+                    Event(
+                        event_type=event_type,
+                        listing_id=listing_id,
+                        timestamp=now if timestamp is None else timestamp,
+                        metadata={} if metadata is None else metadata,
+                    )
+                )
+            else:
+                append(_validate_event(_event_fields(item, now)))
+        return validated
+    except ValidationError:
+        # Validate again as a list so the error carries the failing item's index
+        _EVENT_LIST_ADAPTER.validate_python([_event_fields(item, now) for item in items])
+        raise
+
+
+def _event_fields(item: Any, now: datetime) -> Any:
+    """Return an event input as Event fields; inputs that are not events are returned as-is."""
+    if isinstance(item, tuple):
+        if not 2 <= len(item) <= 4:
+            # Left as a tuple, which fails validation
+            return item
+        event_type, listing_id, *rest = item
+        return {
+            "event_type": event_type,
+            "listing_id": listing_id,
+            "timestamp": rest[0] if len(rest) > 0 and rest[0] is not None else now,
+            "metadata": rest[1] if len(rest) > 1 and rest[1] is not None else {},
+        }
+    if isinstance(item, dict) and item.get("timestamp") is None:
+        return {**item, "timestamp": now}
+    return item
+
+
+# Ordering key for an event: (timestamp, -sequence). Sequence numbers increase
+# with every insert, so among events sharing a timestamp the earliest inserted
+# one sorts last and is therefore yielded first when reading most-recent-first.
+_EventKey = Tuple[datetime, int]
+
+
+class EventPage(NamedTuple):
+    """A page of events and the cursor to resume after it (None on the last page)."""
+
+    events: List[Event]
+    next_cursor: Optional[str]
+
+
+def _encode_cursor(key: _EventKey) -> str:
+    """Encode an ordering key as an opaque, URL-safe cursor string."""
+    timestamp, negative_sequence = key
+    micros, aware = to_epoch_micros(timestamp)
+    raw = f"{micros}:{int(aware)}:{-negative_sequence}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> _EventKey:
+    """Decode a cursor produced by _encode_cursor back into an ordering key."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        micros, aware, sequence = (int(part) for part in raw.split(":"))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid event cursor: {cursor!r}") from e
+    return from_epoch_micros(micros, bool(aware)), -sequence
+
+
+class _EventSequence:
+    """
+    Events kept in timestamp order.
+
+    Events are stored oldest-first so that the common case of appending a newer
+    event is O(1); out-of-order events are placed with a binary search. Readers
+    walk the list backwards to get the most-recent-first ordering.
+
+    Discarded events are only marked dead and skipped by readers; the lists are
+    rebuilt once dead events make up a quarter of them, so discarding is
+    amortized O(1) per event.
+    """
+
+    __slots__ = ("_events", "_keys", "_dead")
+
+    def __init__(self):
+        self._events: List[Event] = []
+        self._keys: List[_EventKey] = []
+        self._dead: Set[int] = set()
+
+    def insert(self, event: Event, key: _EventKey) -> None:
+        """Insert an event at its ordered position."""
+        if not self._keys or key > self._keys[-1]:
+            self._events.append(event)
+            self._keys.append(key)
+        else:
+            index = bisect_left(self._keys, key)
+            self._events.insert(index, event)
+            self._keys.insert(index, key)
+
+    def merge(self, events: List[Event], keys: List[_EventKey]) -> None:
+        """
+        Merge a batch of events whose keys are already sorted.
+
+        A batch newer or older than every stored event is appended or
+        prepended; otherwise the two sorted runs are combined with a single
+        stable sort, which Python's timsort performs as a linear merge.
+        """
+        if not self._keys or keys[0] > self._keys[-1]:
+            self._events.extend(events)
+            self._keys.extend(keys)
+            return
+        if keys[-1] < self._keys[0]:
+            # Older than everything stored, e.g. a newest-first import
+            self._events = events + self._events
+            self._keys = keys + self._keys
+            return
+
+        self._purge()
+        all_events = self._events + events
+        all_keys = self._keys + keys
+        order = sorted(range(len(all_keys)), key=all_keys.__getitem__)
+        self._events = [all_events[i] for i in order]
+        self._keys = [all_keys[i] for i in order]
+
+    def replace(self, key: _EventKey, event: Event) -> None:
+        """Replace the event stored under `key`, keeping its position."""
+        index = bisect_left(self._keys, key)
+        self._dead.discard(id(self._events[index]))
+        self._events[index] = event
+
+    def _live(self, low: int, high: int) -> Iterator[int]:
+        """Yield the indexes of live events from high - 1 down to low."""
+        events = self._events
+        dead = self._dead
+        for i in range(high - 1, low - 1, -1):
+            if id(events[i]) not in dead:
+                yield i
+
+    def items(self) -> Iterator[Tuple[_EventKey, Event]]:
+        """Yield live (key, event) pairs, oldest first."""
+        dead = self._dead
+        for key, event in zip(self._keys, self._events, strict=True):
+            if id(event) not in dead:
+                yield key, event
+
+    def newest(self, limit: Optional[int] = None) -> List[Event]:
+        """Return events most recent first, up to `limit` events."""
+        if self._dead:
+            return [self._events[i] for i in islice(self._live(0, len(self._events)), limit)]
+        if limit is None:
+            return self._events[::-1]
+        return list(islice(reversed(self._events), limit))
+
+    def between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """Return events with start <= timestamp <= end, most recent first."""
+        if self._dead:
+            low, high = self._bounds(start, end, None)
+            return [self._events[i] for i in islice(self._live(low, high), limit)]
+        low, high = self._bounds(start, end, limit)
+        if low >= high:
+            return []
+        return self._events[high - 1 : low - 1 if low > 0 else None : -1]
+
+    def keyed_between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        limit: Optional[int] = None,
+    ) -> List[Tuple[_EventKey, Event]]:
+        """Like between(), but return (key, event) pairs for merging timelines."""
+        if self._dead:
+            low, high = self._bounds(start, end, None)
+            return [(self._keys[i], self._events[i]) for i in islice(self._live(low, high), limit)]
+        low, high = self._bounds(start, end, limit)
+        return [(self._keys[i], self._events[i]) for i in range(high - 1, low - 1, -1)]
+
+    def _bounds(self, start: Optional[datetime], end: Optional[datetime], limit: Optional[int]) -> Tuple[int, int]:
+        low = 0 if start is None else bisect_left(self._keys, (start,))
+        high = len(self._keys) if end is None else bisect_right(self._keys, (end, math.inf))
+        if limit is not None:
+            low = max(low, high - limit)
+        return low, high
+
+    def page(self, before: Optional[_EventKey], size: int) -> Tuple[List[Event], Optional[_EventKey]]:
+        """
+        Return up to `size` events older than `before`, most recent first.
+
+        Also returns the key of the last event in the page, or None if there
+        are no older events left.
+        """
+        high = len(self._keys) if before is None else bisect_left(self._keys, before)
+        if self._dead:
+            indexes = list(islice(self._live(0, high), size))
+            if not indexes:
+                return [], None
+            low = indexes[-1]
+            return [self._events[i] for i in indexes], (self._keys[low] if low > 0 else None)
+        low = max(0, high - size)
+        if low >= high:
+            return [], None
+        events = self._events[low:high][::-1]
+        return events, (self._keys[low] if low > 0 else None)
+
+    def discard(self, events: List[Event]) -> None:
+        """Remove events (which must be in the sequence)."""
+        self._dead.update(id(event) for event in events)
+        if len(self._dead) * 4 > len(self._events):
+            self._purge()
+
+    def _purge(self) -> None:
+        """Drop dead events from the lists."""
+        if not self._dead:
+            return
+        keep = list(self._live(0, len(self._events)))[::-1]
+        self._events = [self._events[i] for i in keep]
+        self._keys = [self._keys[i] for i in keep]
+        self._dead.clear()
+
+    def __len__(self) -> int:
+        return len(self._events) - len(self._dead)
+
+
+def _merge_groups(
+    index: Dict[Any, _EventSequence], groups: Dict[Any, List[int]], events: List[Event], keys: List[_EventKey]
+) -> None:
+    """Merge each group of batch positions into its sequence in `index`, creating missing ones."""
+    for group_key, positions in groups.items():
+        sequence = index.get(group_key)
+        if sequence is None:
+            sequence = index[group_key] = _EventSequence()
+        sequence.merge(list(map(events.__getitem__, positions)), list(map(keys.__getitem__, positions)))
+
+
 class EventTimeline:
     """
     Timeline system for storing and querying events per listing.
@@ -46,10 +430,64 @@ class EventTimeline:
     Events are stored with timestamp + metadata and are queryable per listing.
     """
 
-    def __init__(self):
-        """Initialize an empty event timeline."""
-        self._events: List[Event] = []
-        self._events_by_listing: Dict[str, List[Event]] = {}
+    def __init__(self, sequence: Optional[Iterator[int]] = None):
+        """
+        Initialize an empty event timeline.
+
+        Args:
+            sequence: Optional shared counter for sequence numbers, so that
+                several timelines can be merged with a consistent tie order
+        """
+        self._events = _EventSequence()
+        self._events_by_listing: Dict[str, _EventSequence] = {}
+        self._events_by_type: Dict[EventType, _EventSequence] = {}
+        self._events_by_listing_type: Dict[Tuple[str, EventType], _EventSequence] = {}
+        self._summaries: Dict[str, ListingSummary] = {}
+        self._rollups: Dict[Tuple[str, EventType], Tuple[_EventKey, Event]] = {}
+        self._compacted_extra: Dict[Tuple[Optional[str], Optional[EventType]], int] = {}
+        self._listeners: List[Callable[[Event], None]] = []
+        self._sequence = sequence if sequence is not None else count()
+
+    def add_listener(self, listener: Callable[[Event], None]) -> None:
+        """
+        Register a callback invoked with every event added to the timeline.
+
+        Listeners run synchronously inside add_event/add_events, after the
+        event has been indexed, so they should hand work off rather than block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Event], None]) -> None:
+        """Unregister a callback added with add_listener."""
+        self._listeners.remove(listener)
+
+    def _sequences_for(self, event: Event) -> Tuple[_EventSequence, ...]:
+        """Return every index an event belongs to, creating missing ones."""
+        listing_key = event.listing_id
+        type_key = event.event_type
+        listing_type_key = (listing_key, type_key)
+
+        by_listing = self._events_by_listing.get(listing_key)
+        if by_listing is None:
+            by_listing = self._events_by_listing[listing_key] = _EventSequence()
+        by_type = self._events_by_type.get(type_key)
+        if by_type is None:
+            by_type = self._events_by_type[type_key] = _EventSequence()
+        by_listing_type = self._events_by_listing_type.get(listing_type_key)
+        if by_listing_type is None:
+            by_listing_type = self._events_by_listing_type[listing_type_key] = _EventSequence()
+
+        return self._events, by_listing, by_type, by_listing_type
+
+    def _select(self, listing_id: Optional[str], event_type: Optional[EventType]) -> Optional[_EventSequence]:
+        """Return the index that answers a listing/type query, if any events match."""
+        if listing_id is None and event_type is None:
+            return self._events
+        if listing_id is None:
+            return self._events_by_type.get(event_type)
+        if event_type is None:
+            return self._events_by_listing.get(listing_id)
+        return self._events_by_listing_type.get((listing_id, event_type))
 
     def add_event(
         self,
@@ -83,22 +521,75 @@ class EventTimeline:
             metadata=metadata,
         )
 
-        # Add to events list
-        self._events.append(event)
+        # Insert into the global, listing, type and (listing, type) indexes,
+        # all of which stay ordered by timestamp without re-sorting
+        key = (event.timestamp, -next(self._sequence))
+        for sequence in self._sequences_for(event):
+            sequence.insert(event, key)
 
-        # Add to listing-specific index
-        if listing_id not in self._events_by_listing:
-            self._events_by_listing[listing_id] = []
-        self._events_by_listing[listing_id].append(event)
-
-        # Sort events by timestamp (most recent first)
-        self._events.sort(key=lambda e: e.timestamp, reverse=True)
-        self._events_by_listing[listing_id].sort(
-            key=lambda e: e.timestamp, reverse=True
-        )
+        for listener in self._listeners:
+            listener(event)
 
         return event
 
+    def add_events(self, events: Iterable[EventInput]) -> Dict[str, int]:
+        """
+        Add a batch of events to the timeline.
+
+        The whole batch is validated in one pass and sorted once; each index
+        then takes a single merge of its share of the batch instead of a
+        binary-search insert per event. Events sharing a timestamp keep the
+        order in which they appear in the batch.
+
+        Args:
+            events: Event instances, mappings of Event fields, or tuples of
+                (event_type, listing_id[, timestamp[, metadata]])
+
+        Returns:
+            Number of events added per listing ID
+        """
+        validated = validate_events(events)
+        if not validated:
+            return {}
+
+        keys = [(event.timestamp, -next(self._sequence)) for event in validated]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        events = list(map(validated.__getitem__, order))
+        keys = list(map(keys.__getitem__, order))
+
+        # Group the sorted batch's positions per index; each group stays sorted,
+        # so every index takes one merge instead of a bisect per event
+        by_listing: Dict[str, List[int]] = {}
+        by_type: Dict[EventType, List[int]] = {}
+        by_listing_type: Dict[Tuple[str, EventType], List[int]] = {}
+        for position, event in enumerate(events):
+            listing_id = event.listing_id
+            event_type = event.event_type
+            positions = by_listing.get(listing_id)
+            if positions is None:
+                positions = by_listing[listing_id] = []
+            positions.append(position)
+            positions = by_type.get(event_type)
+            if positions is None:
+                positions = by_type[event_type] = []
+            positions.append(position)
+            positions = by_listing_type.get((listing_id, event_type))
+            if positions is None:
+                positions = by_listing_type[(listing_id, event_type)] = []
+            positions.append(position)
+
+        self._events.merge(events, keys)
+        _merge_groups(self._events_by_listing, by_listing, events, keys)
+        _merge_groups(self._events_by_type, by_type, events, keys)
+        _merge_groups(self._events_by_listing_type, by_listing_type, events, keys)
+        counts = {listing_id: len(positions) for listing_id, positions in by_listing.items()}
+
+        for listener in self._listeners:
+            for event in validated:
+                listener(event)
+
+        return counts
+
     def get_events_for_listing(
         self,
         listing_id: str,
@@ -116,17 +607,10 @@ class EventTimeline:
         Returns:
             List of events for the listing, sorted by timestamp (most recent first)
         """
-        events = self._events_by_listing.get(listing_id, [])
-
-        # Filter by event type if specified
-        if event_type is not None:
-            events = [e for e in events if e.event_type == event_type]
-
-        # Apply limit if specified
-        if limit is not None:
-            events = events[:limit]
-
-        return events
+        events = self._select(listing_id, event_type)
+        if events is None:
+            return []
+        return events.newest(limit)
 
     def get_all_events(
         self,
@@ -143,17 +627,143 @@ class EventTimeline:
         Returns:
             List of events, sorted by timestamp (most recent first)
         """
-        events = self._events.copy()
+        events = self._select(None, event_type)
+        if events is None:
+            return []
+        return events.newest(limit)
 
-        # Filter by event type if specified
-        if event_type is not None:
-            events = [e for e in events if e.event_type == event_type]
+    def get_events_between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get events within a time range, optionally filtered by listing and/or type.
 
-        # Apply limit if specified
-        if limit is not None:
-            events = events[:limit]
+        The range is located with a binary search on the ordered index, so the
+        cost is O(log n + k) for k matching events.
+
+        Args:
+            start: Earliest timestamp to include (None for no lower bound)
+            end: Latest timestamp to include (None for no upper bound)
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events in the range, sorted by timestamp (most recent first)
+        """
+        events = self._select(listing_id, event_type)
+        if events is None:
+            return []
+        return events.between(start, end, limit)
+
+    def get_events_page(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> EventPage:
+        """
+        Get one page of events, most recent first, resuming from a cursor.
+
+        Cursors are opaque strings encoding the timestamp and sequence number of
+        the last event returned, so paging stays stable while new events are
+        added: newer events never shift later pages.
+
+        Args:
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            cursor: Cursor from a previous page (None to start from the newest event)
+            page_size: Maximum number of events in the page
+
+        Returns:
+            EventPage with the events and the cursor for the next page
+
+        Raises:
+            ValueError: If the cursor is malformed or page_size is not positive
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        before = _decode_cursor(cursor) if cursor is not None else None
+        events = self._select(listing_id, event_type)
+        if events is None:
+            return EventPage([], None)
+
+        page, last_key = events.page(before, page_size)
+        return EventPage(page, _encode_cursor(last_key) if last_key is not None else None)
 
-        return events
+    def iter_pages(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[EventPage]:
+        """
+        Iterate over pages of events, most recent first.
+
+        Only one page is held in memory at a time. Each page carries the cursor
+        that resumes iteration after it, so an exporter can persist the cursor
+        and pick up where it left off.
+
+        Args:
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            cursor: Cursor to resume from (None to start from the newest event)
+            page_size: Maximum number of events per page
+
+        Yields:
+            EventPage instances until the oldest matching event is reached
+        """
+        while True:
+            page = self.get_events_page(listing_id, event_type, cursor, page_size)
+            if page.events:
+                yield page
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def iter_events(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 1000,
+    ) -> Iterator[Event]:
+        """
+        Iterate over events, most recent first, fetching them a page at a time.
+
+        Args:
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            cursor: Cursor to resume from (None to start from the newest event)
+            page_size: Number of events fetched per page
+
+        Yields:
+            Events sorted by timestamp (most recent first)
+        """
+        for page in self.iter_pages(listing_id, event_type, cursor, page_size):
+            yield from page.events
+
+    def _keyed_events(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[_EventKey, Event]]:
+        """Return matching (key, event) pairs, most recent first, for merging timelines."""
+        events = self._select(listing_id, event_type)
+        if events is None:
+            return []
+        return events.keyed_between(start, end, limit)
 
     def get_latest_event(
         self,
@@ -188,8 +798,7 @@ class EventTimeline:
         Returns:
             True if listing has at least one event of this type
         """
-        events = self.get_events_for_listing(listing_id, event_type)
-        return len(events) > 0
+        return (listing_id, event_type) in self._events_by_listing_type
 
     def count_events(
         self,
@@ -204,19 +813,128 @@ class EventTimeline:
             event_type: Optional filter by event type
 
         Returns:
-            Number of events matching the criteria
+            Number of events matching the criteria, including compacted events
         """
-        if listing_id is not None:
-            events = self.get_events_for_listing(listing_id, event_type)
-            return len(events)
+        events = self._select(listing_id, event_type)
+        if events is None:
+            return 0
+        return len(events) + self._compacted_extra.get((listing_id, event_type), 0)
+
+    def compact(
+        self,
+        expired: Callable[[Event], bool],
+        listing_ids: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        Roll expired events into summaries and drop them.
+
+        The expired events of each (listing, event type) are replaced by one
+        rollup event of that type, stored in place of the newest of them, with
+        the number of events it stands for in metadata["compacted_events"]
+        (and, for price drops, their total in "total_drop_amount" and
+        "total_drop_amount_cents"). Queries and paging return the rollups
+        alongside the remaining events, count_events and has_event_type still
+        count the compacted events, and get_listing_summary totals them per
+        listing. len() counts stored events, rollups included.
+
+        Args:
+            expired: Returns True for events that should be compacted
+            listing_ids: Listings to examine (defaults to all listings)
+
+        Returns:
+            Number of events compacted
+        """
+        if listing_ids is None:
+            listing_ids = list(self._events_by_listing)
+
+        compacted = 0
+        for listing_id in listing_ids:
+            events = self._events_by_listing.get(listing_id)
+            if events is None:
+                continue
+            expired_by_type: Dict[EventType, List[Tuple[_EventKey, Event]]] = {}
+            for key, event in events.items():
+                rollup = self._rollups.get((listing_id, event.event_type))
+                if (rollup is None or rollup[1] is not event) and expired(event):
+                    expired_by_type.setdefault(event.event_type, []).append((key, event))
+            if not expired_by_type:
+                continue
+
+            summary = self._summaries.get(listing_id)
+            if summary is None:
+                summary = self._summaries[listing_id] = ListingSummary(listing_id=listing_id)
+            for event_type, expired_events in expired_by_type.items():
+                for _, event in expired_events:
+                    summary.absorb(event)
+                self._roll_up(listing_id, event_type, expired_events)
+                compacted += len(expired_events)
+
+        return compacted
+
+    def _roll_up(self, listing_id: str, event_type: EventType, expired: List[Tuple[_EventKey, Event]]) -> None:
+        """Replace expired events (oldest first) of one listing and type with a single rollup event."""
+        previous = self._rollups.get((listing_id, event_type))
+        metadata = dict(previous[1].metadata) if previous is not None else {"compacted_events": 0}
+        metadata["compacted_events"] += len(expired)
+        if event_type == EventType.PRICE_DROPPED:
+            cents = metadata.get("total_drop_amount_cents", 0)
+            cents += sum(_drop_amount_cents(event) or 0 for _, event in expired)
+            metadata["total_drop_amount_cents"] = cents
+            metadata["total_drop_amount"] = str(from_cents(cents))
+
+        # The rollup takes the slot of the newest event it replaces, which
+        # is already at the right position in every index
+        dropped = [event for _, event in expired]
+        if previous is not None and previous[0] > expired[-1][0]:
+            key = previous[0]
         else:
-            events = self.get_all_events(event_type)
-            return len(events)
+            key = expired[-1][0]
+            dropped.pop()
+            if previous is not None:
+                dropped.append(previous[1])
+
+        rollup = Event(event_type=event_type, timestamp=key[0], listing_id=listing_id, metadata=metadata)
+        self._rollups[(listing_id, event_type)] = (key, rollup)
+        for sequence in (
+            self._events,
+            self._events_by_listing[listing_id],
+            self._events_by_type[event_type],
+            self._events_by_listing_type[(listing_id, event_type)],
+        ):
+            sequence.replace(key, rollup)
+            if dropped:
+                sequence.discard(dropped)
+
+        # Each rollup stands for compacted_events events but is stored once
+        added = len(expired) if previous is not None else len(expired) - 1
+        for scope in ((None, None), (listing_id, None), (None, event_type), (listing_id, event_type)):
+            self._compacted_extra[scope] = self._compacted_extra.get(scope, 0) + added
+
+    def get_listing_ids(self) -> List[str]:
+        """Return the IDs of all listings that have events in the timeline."""
+        return list(self._events_by_listing)
+
+    def get_listing_summary(self, listing_id: str) -> Optional[ListingSummary]:
+        """
+        Get the summary of compacted events for a listing.
+
+        Args:
+            listing_id: ID of the listing
+
+        Returns:
+            ListingSummary, or None if no events have been compacted for the listing
+        """
+        return self._summaries.get(listing_id)
 
     def clear(self) -> None:
         """Clear all events from the timeline."""
-        self._events.clear()
+        self._events = _EventSequence()
         self._events_by_listing.clear()
+        self._events_by_type.clear()
+        self._events_by_listing_type.clear()
+        self._summaries.clear()
+        self._rollups.clear()
+        self._compacted_extra.clear()
 
     def __len__(self) -> int:
         """Return the total number of events."""
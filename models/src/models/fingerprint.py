@@ -0,0 +1,230 @@
+"""
+Content fingerprints for idempotent ingestion.
+
+A fingerprint is a stable hash over the normalized fields of a record, so it
+ignores volatile fields such as image URLs and agent details. Ingestion keeps the
+last fingerprint seen for each listing in a FingerprintIndex and skips
+records whose fingerprint has not changed, without normalizing or
+validating them again.
+"""
+
+import hashlib
+from decimal import Decimal
+from typing import Optional, Any, Callable, Dict, Iterable, Iterator, Mapping, Tuple
+
+from .address import Address
+from .listing import Listing
+
+# Field holding the listing ID in raw records, per source
+ID_FIELDS: Dict[str, str] = {
+    "realestate.com.au": "id",
+    "domain.com.au": "listingId",
+}
+
+
+def _realestate_content(data: Mapping[str, Any]) -> Tuple[Any, ...]:
+    # The fields normalize_realestate_data reads; keep the two in sync
+    address = data.get("address") or {}
+    display = address.get("display") or {}
+    sizes = data.get("propertySizes") or {}
+    features = data.get("generalFeatures") or {}
+    return (
+        data.get("id"),
+        data.get("propertyType"),
+        data.get("description"),
+        data.get("propertyLink"),
+        address.get("suburb"),
+        address.get("state"),
+        address.get("postcode"),
+        display.get("fullAddress"),
+        display.get("shortAddress"),
+        (sizes.get("land") or {}).get("displayValue"),
+        (sizes.get("building") or {}).get("displayValue"),
+        (features.get("bedrooms") or {}).get("value"),
+        (features.get("bathrooms") or {}).get("value"),
+        data.get("auction"),
+    )
+
+
+def _domain_content(data: Mapping[str, Any]) -> Tuple[Any, ...]:
+    # The fields normalize_domain_data reads; keep the two in sync
+    return (
+        data.get("listingId"),
+        data.get("streetNumber"),
+        data.get("street"),
+        data.get("unitNumber"),
+        data.get("suburb"),
+        data.get("state"),
+        data.get("postcode"),
+        data.get("propertyType"),
+        data.get("beds"),
+        data.get("baths"),
+        data.get("listingUrl"),
+        data.get("description"),
+    )
+
+
+_CONTENT_EXTRACTORS: Dict[str, Callable[[Mapping[str, Any]], Tuple[Any, ...]]] = {
+    "realestate.com.au": _realestate_content,
+    "domain.com.au": _domain_content,
+}
+
+
+def _digest(content: Tuple[Any, ...]) -> str:
+    # Strings are hashed as-is rather than through repr(), which is several
+    # times slower for long descriptions
+    payload = "\x1f".join([value if type(value) is str else repr(value) for value in content])
+    return hashlib.blake2b(payload.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+def _amount(value: Optional[Decimal]) -> Optional[Decimal]:
+    # Equal amounts fingerprint the same regardless of trailing zeros
+    return value.normalize() if value is not None else None
+
+
+def fingerprint_record(data: Mapping[str, Any], source: str) -> str:
+    """
+    Fingerprint a raw scraper record.
+
+    Only the fields the source's normalizer reads are hashed, so volatile
+    fields such as image URLs, agents and school data are ignored.
+
+    Args:
+        data: Raw JSON data from a scraper
+        source: Data source ("realestate.com.au" or "domain.com.au")
+
+    Returns:
+        Hex digest that changes only when a normalized field changes
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    try:
+        extract = _CONTENT_EXTRACTORS[source]
+    except KeyError:
+        raise ValueError(f"Unknown source: {source!r}") from None
+    return _digest((source,) + extract(data))
+
+
+def fingerprint_listing(listing: Listing) -> str:
+    """
+    Fingerprint the content of a Listing.
+
+    Covers the scraped fields; accumulated history, bookkeeping timestamps
+    and the derived previous_price are left out.
+
+    Args:
+        listing: Listing to fingerprint
+
+    Returns:
+        Hex digest of the listing's content
+    """
+    address: Address = listing.address
+    return _digest(
+        (
+            listing.listing_id,
+            address.street_number,
+            address.street_name,
+            address.unit_number,
+            address.suburb,
+            address.state,
+            address.postcode,
+            address.full_address,
+            address.short_address,
+            listing.suburb,
+            listing.property_type.value,
+            listing.bedrooms,
+            listing.bathrooms,
+            _amount(listing.land_size),
+            _amount(listing.building_size),
+            listing.status.value,
+            _amount(listing.current_price),
+            listing.auction_datetime,
+            listing.property_link,
+            listing.description,
+            listing.source,
+        )
+    )
+
+
+def record_key(data: Mapping[str, Any], source: str) -> str:
+    """
+    Build the index key for a raw record.
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    try:
+        id_field = ID_FIELDS[source]
+    except KeyError:
+        raise ValueError(f"Unknown source: {source!r}") from None
+    return f"{source}:{data.get(id_field, '')}"
+
+
+class FingerprintIndex:
+    """
+    Last-seen fingerprint per record, for skipping unchanged records.
+
+    Keys are built by record_key (for raw records) or can be any string,
+    such as a listing ID. The index can be saved with as_dict and restored
+    by passing that mapping to the constructor.
+    """
+
+    def __init__(self, fingerprints: Optional[Mapping[str, str]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            fingerprints: Previously saved fingerprints by key
+        """
+        self._fingerprints: Dict[str, str] = dict(fingerprints) if fingerprints else {}
+
+    def check(self, key: str, fingerprint: str) -> bool:
+        """
+        Record a fingerprint for a key.
+
+        Returns:
+            True if it matches the last fingerprint seen for the key (the
+            record is unchanged), False if it is new or has changed
+        """
+        if self._fingerprints.get(key) == fingerprint:
+            return True
+        self._fingerprints[key] = fingerprint
+        return False
+
+    def skip_unchanged(self, records: Iterable[Mapping[str, Any]], source: str) -> Iterator[Mapping[str, Any]]:
+        """
+        Yield only the raw records that are new or changed since last seen.
+
+        Fingerprints are recorded as records are yielded; call discard for a
+        record that then fails to ingest so it is retried next time.
+
+        Args:
+            records: Raw JSON records from a scraper
+            source: Data source ("realestate.com.au" or "domain.com.au")
+        """
+        for data in records:
+            if not self.check(record_key(data, source), fingerprint_record(data, source)):
+                yield data
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the last fingerprint seen for a key, if any."""
+        return self._fingerprints.get(key)
+
+    def discard(self, key: str) -> None:
+        """Forget a key so its next record is treated as changed."""
+        self._fingerprints.pop(key, None)
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return a copy of the fingerprints by key, e.g. for saving."""
+        return dict(self._fingerprints)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fingerprints
+
+    def __len__(self) -> int:
+        """Return the number of keys tracked."""
+        return len(self._fingerprints)
+
+    def __repr__(self) -> str:
+        return f"FingerprintIndex(keys={len(self)})"
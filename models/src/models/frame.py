@@ -0,0 +1,470 @@
+"""
+Columnar listing table for in-memory analytics.
+
+This module provides ListingFrame, a NumPy-backed table with one array per
+listing field, so questions such as "median price of 3-bedroom houses per
+suburb" run as vectorized array operations instead of Python loops over
+Listing objects. NumPy is an optional dependency; it is only imported when
+a frame is built.
+"""
+
+from decimal import Decimal
+from typing import Optional, Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from .compact import LISTING_STATUS_CODES, LISTING_STATUSES, PROPERTY_TYPE_CODES, PROPERTY_TYPES, ListingRecord
+from .enums import ListingStatus, PropertyType
+from .listing import Listing
+from .money import to_cents
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+# String columns, stored as int32 codes into a sorted array of distinct values
+CATEGORY_COLUMNS = ("suburb", "state", "postcode", "source")
+
+# Enum columns, stored as uint8 codes into the enum's members
+ENUM_COLUMNS = {
+    "property_type": PROPERTY_TYPES,
+    "status": LISTING_STATUSES,
+}
+
+# Numeric columns and their dtypes; each has a mask of which rows have a value
+NUMERIC_COLUMNS = {
+    "bedrooms": "int32",
+    "bathrooms": "int32",
+    "land_size": "float64",
+    "building_size": "float64",
+    "current_price_cents": "int64",
+    "previous_price_cents": "int64",
+}
+
+COLUMNS = ("listing_id",) + CATEGORY_COLUMNS + tuple(ENUM_COLUMNS) + tuple(NUMERIC_COLUMNS)
+
+ListingLike = Union[Listing, ListingRecord]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("ListingFrame requires numpy (pip install numpy)")
+
+
+def _listing_row(listing: ListingLike) -> Tuple[Any, ...]:
+    if isinstance(listing, ListingRecord):
+        return (
+            listing.listing_id,
+            listing.suburb,
+            listing.state,
+            listing.postcode,
+            listing.source,
+            listing.property_type_code,
+            listing.status_code,
+            listing.bedrooms,
+            listing.bathrooms,
+            listing.land_size,
+            listing.building_size,
+            listing.current_price_cents,
+            listing.previous_price_cents,
+        )
+    return (
+        listing.listing_id,
+        listing.suburb,
+        listing.address.state,
+        listing.address.postcode,
+        listing.source,
+        PROPERTY_TYPE_CODES[listing.property_type],
+        LISTING_STATUS_CODES[listing.status],
+        listing.bedrooms,
+        listing.bathrooms,
+        listing.land_size,
+        listing.building_size,
+        to_cents(listing.current_price),
+        to_cents(listing.previous_price),
+    )
+
+
+def _record_row(record: Mapping[str, Any]) -> Tuple[Any, ...]:
+    address = record.get("address") or {}
+    return (
+        str(record["listing_id"]),
+        record.get("suburb") or address.get("suburb", ""),
+        address.get("state", ""),
+        address.get("postcode", ""),
+        record.get("source"),
+        PROPERTY_TYPE_CODES[PropertyType(record.get("property_type", PropertyType.OTHER))],
+        LISTING_STATUS_CODES[ListingStatus(record.get("status", ListingStatus.UNKNOWN))],
+        record.get("bedrooms"),
+        record.get("bathrooms"),
+        record.get("land_size"),
+        record.get("building_size"),
+        to_cents(record.get("current_price")),
+        to_cents(record.get("previous_price")),
+    )
+
+
+def _numeric(values: Sequence[Any], dtype: str) -> Tuple["np.ndarray", "np.ndarray"]:
+    column = np.array(values, dtype=object)
+    present = column != None  # noqa: E711 - elementwise comparison
+    column[~present] = 0
+    return column.astype(dtype), present.astype(bool)
+
+
+def _categorize(values: Sequence[Optional[str]]) -> Tuple["np.ndarray", "np.ndarray"]:
+    # Code values in first-seen order with a dict (much faster than sorting
+    # the strings), then renumber so codes follow sorted value order
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault("" if value is None else value, len(index)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    categories = np.array(list(index), dtype=object)
+    order = np.argsort(categories)
+    renumber = np.empty(len(order), dtype=np.int32)
+    renumber[order] = np.arange(len(order), dtype=np.int32)
+    return categories[order], renumber[codes]
+
+
+def _sort_groups(groups: "np.ndarray", values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    # Sort rows by group, then value. Integer values are packed with the group
+    # into a single int64 key when they fit, which sorts several times faster
+    # than lexsort.
+    if len(values) and values.dtype.kind in "iu":
+        low = int(values.min())
+        span = int(values.max()) - low + 1
+        if span * (int(groups.max()) + 1) < 2**63:
+            keys = np.sort(groups.astype(np.int64) * span + (values.astype(np.int64) - low))
+            return keys // span, keys % span + low
+    order = np.lexsort((values, groups))
+    return groups[order], values[order]
+
+
+def _interpolate(sorted_values: "np.ndarray", starts: "np.ndarray", counts: "np.ndarray", q: float) -> "np.ndarray":
+    # numpy's default "linear" percentile, applied to each sorted group at once
+    position = (counts - 1) * (q / 100.0)
+    low = np.floor(position).astype(np.int64)
+    high = np.minimum(low + 1, counts - 1)
+    fraction = position - low
+    low_values = sorted_values[starts + low].astype(np.float64)
+    high_values = sorted_values[starts + high].astype(np.float64)
+    return low_values + (high_values - low_values) * fraction
+
+
+class ListingFrame:
+    """
+    NumPy-backed columnar table of listings.
+
+    Build one with from_listings (Listing or ListingRecord instances) or
+    from_records (mappings of Listing fields, e.g. model_dump() output).
+    Frames are not modified in place: filter, sort and take return new
+    frames.
+
+    Columns (see COLUMNS) are read with frame[name]. String and enum columns
+    come back decoded; use codes(name) for the underlying integer codes.
+    Numeric columns come back as raw arrays, with present(name) marking
+    which rows have a value. Prices are int64 cents.
+    """
+
+    def __init__(
+        self,
+        listing_ids: "np.ndarray",
+        codes: Dict[str, "np.ndarray"],
+        categories: Dict[str, "np.ndarray"],
+        numeric: Dict[str, Tuple["np.ndarray", "np.ndarray"]],
+    ):
+        """
+        Initialize a frame from prepared columns.
+
+        Prefer from_listings or from_records; this constructor does not
+        check that the columns line up.
+        """
+        _require_numpy()
+        self._listing_ids = listing_ids
+        self._codes = codes
+        self._categories = categories
+        self._numeric = numeric
+
+    @classmethod
+    def _from_rows(cls, rows: List[Tuple[Any, ...]]) -> "ListingFrame":
+        _require_numpy()
+        columns = list(zip(*rows, strict=True)) if rows else [()] * len(COLUMNS)
+        by_name = dict(zip(COLUMNS, columns, strict=True))
+
+        codes: Dict[str, np.ndarray] = {}
+        categories: Dict[str, np.ndarray] = {}
+        for name in CATEGORY_COLUMNS:
+            categories[name], codes[name] = _categorize(by_name[name])
+        for name in ENUM_COLUMNS:
+            codes[name] = np.array(by_name[name], dtype=np.uint8)
+
+        numeric = {name: _numeric(by_name[name], dtype) for name, dtype in NUMERIC_COLUMNS.items()}
+        return cls(np.array(by_name["listing_id"], dtype=object), codes, categories, numeric)
+
+    @classmethod
+    def from_listings(cls, listings: Iterable[ListingLike]) -> "ListingFrame":
+        """Build a frame from Listing or ListingRecord instances."""
+        return cls._from_rows([_listing_row(listing) for listing in listings])
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "ListingFrame":
+        """
+        Build a frame from mappings of Listing fields, without building Listings.
+
+        Accepts the dicts produced by Listing.model_dump() (or stored by
+        SQLiteListingStore); prices may be Decimals, numbers or strings.
+        """
+        return cls._from_rows([_record_row(record) for record in records])
+
+    def __len__(self) -> int:
+        return len(self._listing_ids)
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        if name == "listing_id":
+            return self._listing_ids
+        if name in CATEGORY_COLUMNS:
+            return self._categories[name][self._codes[name]]
+        if name in ENUM_COLUMNS:
+            return np.array(ENUM_COLUMNS[name], dtype=object)[self._codes[name]]
+        if name in NUMERIC_COLUMNS:
+            return self._numeric[name][0]
+        raise KeyError(name)
+
+    def codes(self, name: str) -> "np.ndarray":
+        """Return the integer codes of a string or enum column."""
+        return self._codes[name]
+
+    def present(self, name: str) -> "np.ndarray":
+        """Return a boolean mask of the rows that have a value in a numeric column."""
+        return self._numeric[name][1]
+
+    def _code_for(self, name: str, value: Any) -> int:
+        if name in ENUM_COLUMNS:
+            members = ENUM_COLUMNS[name]
+            return members.index(type(members[0])(value))
+        categories = self._categories[name]
+        index = int(np.searchsorted(categories, value))
+        if index < len(categories) and categories[index] == value:
+            return index
+        return -1
+
+    def mask(
+        self,
+        suburb: Optional[str] = None,
+        state: Optional[str] = None,
+        property_type: Optional[PropertyType] = None,
+        status: Optional[ListingStatus] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        min_bedrooms: Optional[int] = None,
+        max_bedrooms: Optional[int] = None,
+    ) -> "np.ndarray":
+        """
+        Build a boolean row mask from equality and range conditions.
+
+        Conditions are combined with AND. Rows without a price (or bedroom
+        count) never match a price (or bedroom) range.
+
+        Returns:
+            Boolean array with one entry per row
+        """
+        keep = np.ones(len(self), dtype=bool)
+        for name, value in (("suburb", suburb), ("state", state), ("property_type", property_type), ("status", status)):
+            if value is not None:
+                keep &= self._codes[name] == self._code_for(name, value)
+        for name, low, high in (
+            ("current_price_cents", to_cents(min_price), to_cents(max_price)),
+            ("bedrooms", min_bedrooms, max_bedrooms),
+        ):
+            if low is None and high is None:
+                continue
+            values, present = self._numeric[name]
+            keep &= present
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+        return keep
+
+    def filter(self, mask: Optional["np.ndarray"] = None, **conditions: Any) -> "ListingFrame":
+        """
+        Return the rows matching a boolean mask and/or conditions.
+
+        Args:
+            mask: Optional boolean array with one entry per row
+            **conditions: Keyword conditions accepted by mask()
+
+        Returns:
+            New frame with the matching rows, in their current order
+        """
+        keep = self.mask(**conditions)
+        if mask is not None:
+            keep &= np.asarray(mask, dtype=bool)
+        return self.take(np.flatnonzero(keep))
+
+    def take(self, indices: "np.ndarray") -> "ListingFrame":
+        """Return a new frame with the rows at the given positions, in that order."""
+        return ListingFrame(
+            self._listing_ids[indices],
+            {name: codes[indices] for name, codes in self._codes.items()},
+            self._categories,
+            {name: (values[indices], present[indices]) for name, (values, present) in self._numeric.items()},
+        )
+
+    def _sort_key(self, name: str) -> "np.ndarray":
+        if name == "listing_id":
+            return self._listing_ids
+        if name in CATEGORY_COLUMNS or name in ENUM_COLUMNS:
+            # Category codes follow sorted value order; enum codes follow declaration order
+            return self._codes[name]
+        raise KeyError(name)
+
+    def sort(self, by: str, descending: bool = False) -> "ListingFrame":
+        """
+        Return the rows sorted by a column.
+
+        The sort is stable. Rows with no value in a numeric column go last
+        in either direction.
+
+        Args:
+            by: Column name
+            descending: Sort largest first
+        """
+        if by in NUMERIC_COLUMNS:
+            values, present = self._numeric[by]
+            order = np.argsort(-values if descending else values, kind="stable")
+            order = np.concatenate([order[present[order]], order[~present[order]]])
+        else:
+            key = self._sort_key(by)
+            order = np.argsort(_descending_rank(key) if descending else key, kind="stable")
+        return self.take(order)
+
+    def _valid_values(self, name: str) -> "np.ndarray":
+        values, present = self._numeric[name]
+        return values[present]
+
+    def median(self, column: str) -> Optional[float]:
+        """Median of a numeric column over rows that have a value (None if none do)."""
+        return self.percentile(column, 50)
+
+    def percentile(self, column: str, q: float) -> Optional[float]:
+        """
+        Percentile (0-100, linear interpolation) of a numeric column.
+
+        Rows without a value are ignored; returns None if no row has one.
+        """
+        values = self._valid_values(column)
+        if not len(values):
+            return None
+        return float(np.percentile(values, q))
+
+    def mean(self, column: str) -> Optional[float]:
+        """Mean of a numeric column over rows that have a value (None if none do)."""
+        values = self._valid_values(column)
+        return float(values.mean()) if len(values) else None
+
+    def group_by(self, *columns: str) -> "ListingGroups":
+        """
+        Group rows by one or more string or enum columns.
+
+        Example:
+            frame.group_by("suburb", "property_type").median("current_price_cents")
+        """
+        if not columns:
+            raise ValueError("group_by needs at least one column")
+        return ListingGroups(self, columns)
+
+    def __repr__(self) -> str:
+        return f"ListingFrame(rows={len(self)})"
+
+
+def _descending_rank(key: "np.ndarray") -> "np.ndarray":
+    # Rank distinct keys largest first, so a stable ascending sort on the rank
+    # orders rows by key descending while keeping ties in their current order
+    distinct, inverse = np.unique(key, return_inverse=True)
+    return (len(distinct) - 1) - inverse.reshape(-1)
+
+
+class ListingGroups:
+    """
+    Rows of a ListingFrame grouped by one or more columns.
+
+    Aggregates return a dict from group key to value. Keys are the decoded
+    column value (suburb name, PropertyType, ...), or a tuple of them when
+    grouping by several columns. Groups are ordered by key.
+    """
+
+    def __init__(self, frame: ListingFrame, columns: Sequence[str]):
+        self._frame = frame
+        self._columns = tuple(columns)
+
+        # Combine the columns' codes into one group code per row
+        combined = np.zeros(len(frame), dtype=np.int64)
+        self._sizes = []
+        for name in self._columns:
+            if name in CATEGORY_COLUMNS:
+                size = len(frame._categories[name])
+            elif name in ENUM_COLUMNS:
+                size = len(ENUM_COLUMNS[name])
+            else:
+                raise ValueError(f"Cannot group by column: {name!r}")
+            combined = combined * size + frame.codes(name)
+            self._sizes.append(size)
+        self._group_codes, self._inverse, self._counts = np.unique(combined, return_inverse=True, return_counts=True)
+        self._inverse = self._inverse.reshape(-1)
+
+    def _decode(self, code: int) -> Any:
+        parts = []
+        for name, size in zip(reversed(self._columns), reversed(self._sizes), strict=True):
+            code, part = divmod(code, size)
+            if name in CATEGORY_COLUMNS:
+                parts.append(self._frame._categories[name][part])
+            else:
+                parts.append(ENUM_COLUMNS[name][part])
+        parts.reverse()
+        return parts[0] if len(parts) == 1 else tuple(parts)
+
+    def _result(self, group_indices: "np.ndarray", values: Iterable[Any]) -> Dict[Any, Any]:
+        return {self._decode(int(self._group_codes[g])): value for g, value in zip(group_indices, values, strict=True)}
+
+    def keys(self) -> List[Any]:
+        """Return the group keys."""
+        return [self._decode(int(code)) for code in self._group_codes]
+
+    def count(self) -> Dict[Any, int]:
+        """Number of rows per group."""
+        return self._result(range(len(self._group_codes)), (int(n) for n in self._counts))
+
+    def percentile(self, column: str, q: float) -> Dict[Any, float]:
+        """
+        Percentile (0-100, linear interpolation) of a numeric column per group.
+
+        Rows without a value are ignored; groups with no values are left out.
+        """
+        values, present = self._frame._numeric[column]
+        groups = self._inverse[present]
+        values = values[present]
+        # Sort by group, then value, so each group is a sorted run
+        groups, values = _sort_groups(groups, values)
+        group_indices, starts, counts = np.unique(groups, return_index=True, return_counts=True)
+        results = _interpolate(values, starts, counts, q)
+        return self._result(group_indices, (float(value) for value in results))
+
+    def median(self, column: str) -> Dict[Any, float]:
+        """Median of a numeric column per group (groups with no values are left out)."""
+        return self.percentile(column, 50)
+
+    def mean(self, column: str) -> Dict[Any, float]:
+        """Mean of a numeric column per group (groups with no values are left out)."""
+        values, present = self._frame._numeric[column]
+        groups = self._inverse[present]
+        counts = np.bincount(groups, minlength=len(self._group_codes))
+        sums = np.bincount(groups, weights=values[present].astype(np.float64), minlength=len(self._group_codes))
+        group_indices = np.flatnonzero(counts)
+        return self._result(group_indices, (float(sums[g] / counts[g]) for g in group_indices))
+
+    def __len__(self) -> int:
+        return len(self._group_codes)
+
+    def __repr__(self) -> str:
+        return f"ListingGroups(by={list(self._columns)}, groups={len(self)})"
@@ -0,0 +1,308 @@
+"""
+Streaming JSON Lines export and import.
+
+This module writes Listing and Event models (and whole event timelines) as
+JSON Lines, one object per line, and reads them back. Serialization uses
+orjson when it is installed and the stdlib json module otherwise. Files can
+be compressed with gzip or, when the zstandard package is installed, zstd;
+the compression is picked from the file suffix (".gz", ".zst") unless given
+explicitly.
+
+Output is written straight from model state rather than through
+model_dump_json, whose per-class json_encoders run Python callbacks for
+every Decimal and datetime. Reading validates each line with
+model_validate_json, so listings round-trip to equal models. Event metadata
+is free-form, so it is read back as plain JSON values: Decimal and datetime
+metadata values come back as strings.
+"""
+
+import gzip
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional, Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from .events import Event, EventTimeline
+from .listing import Listing
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+M = TypeVar("M", bound=BaseModel)
+
+PathOrFile = Union[str, Path, BinaryIO]
+
+GZIP = "gzip"
+ZSTD = "zstd"
+
+# gzip.open defaults to level 9, which writes several times slower for a
+# modestly smaller file
+GZIP_LEVEL = 3
+
+_SUFFIX_COMPRESSION = {
+    ".gz": GZIP,
+    ".gzip": GZIP,
+    ".zst": ZSTD,
+    ".zstd": ZSTD,
+}
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_json_default)
+
+else:  # pragma: no cover - exercised only without orjson
+    _encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=_json_default).encode
+
+    def _dumps(obj: Any) -> bytes:
+        return _encode(obj).encode("utf-8")
+
+
+def _listing_state(listing: Listing) -> Dict[str, Any]:
+    state = dict(listing.__dict__)
+    state["address"] = listing.address.__dict__
+    state["price_history"] = [record.__dict__ for record in listing.price_history]
+    state["auction_history"] = [record.__dict__ for record in listing.auction_history]
+    return state
+
+
+def _event_state(event: Event) -> Dict[str, Any]:
+    return event.__dict__
+
+
+# Plain-data converters for models with known shapes; others use model_dump
+_STATE: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    Listing: _listing_state,
+    Event: _event_state,
+}
+
+
+def _compression_for(path: PathOrFile, compression: Optional[str]) -> Optional[str]:
+    if compression is not None or not isinstance(path, (str, Path)):
+        return compression
+    return _SUFFIX_COMPRESSION.get(Path(path).suffix.lower())
+
+
+def open_compressed(path: PathOrFile, mode: str, compression: Optional[str] = None) -> BinaryIO:
+    """
+    Open a path (or wrap a binary file) for reading or writing bytes.
+
+    Args:
+        path: File path, or a binary file object
+        mode: "rb" or "wb"
+        compression: "gzip", "zstd", or None to infer from the suffix
+
+    Raises:
+        ValueError: If the compression is unknown
+        ImportError: If zstd is requested without the zstandard package
+    """
+    compression = _compression_for(path, compression)
+    if compression is None:
+        return open(path, mode) if isinstance(path, (str, Path)) else path
+    if compression == GZIP:
+        if isinstance(path, (str, Path)):
+            return gzip.open(path, mode, compresslevel=GZIP_LEVEL)
+        return gzip.GzipFile(fileobj=path, mode=mode, compresslevel=GZIP_LEVEL)
+    if compression == ZSTD:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the zstandard package") from None
+        stream = zstandard.open(path, mode)
+        return io.BufferedReader(stream) if mode == "rb" else stream
+    raise ValueError(f"Unknown compression: {compression!r}")
+
+
+class JSONLWriter:
+    """
+    Streaming JSON Lines writer for pydantic models.
+
+    Use as a context manager, or call close() when done:
+
+        with JSONLWriter("listings.jsonl.gz") as writer:
+            writer.write_many(listings)
+    """
+
+    def __init__(
+        self,
+        path: PathOrFile,
+        compression: Optional[str] = None,
+        buffer_size: int = 1 << 20,
+    ):
+        """
+        Open a file for writing.
+
+        Args:
+            path: File path, or a binary file object to write to
+            compression: "gzip", "zstd", or None to infer from the suffix
+            buffer_size: Bytes collected before each write to the file
+        """
+        self._file = open_compressed(path, "wb", compression)
+        self._owns_file = self._file is not path
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self.buffer_size = buffer_size
+        self.count = 0
+
+    def write(self, obj: BaseModel) -> None:
+        """Write one model as a line."""
+        to_state = _STATE.get(type(obj))
+        line = _dumps(to_state(obj) if to_state is not None else obj.model_dump())
+        self._buffer.append(line)
+        self._buffered += len(line) + 1
+        self.count += 1
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, objs: Iterable[BaseModel]) -> int:
+        """
+        Write many models, one per line.
+
+        Returns:
+            Number of models written
+        """
+        written = self.count
+        for obj in objs:
+            self.write(obj)
+        return self.count - written
+
+    def flush(self) -> None:
+        """Write buffered lines to the file."""
+        if self._buffer:
+            self._buffer.append(b"")
+            self._file.write(b"\n".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+    def close(self) -> None:
+        """Flush and close the file (a file object passed in is only flushed)."""
+        self.flush()
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "JSONLWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def write_jsonl(path: PathOrFile, objs: Iterable[BaseModel], compression: Optional[str] = None) -> int:
+    """
+    Write models to a JSON Lines file.
+
+    Args:
+        path: File path, or a binary file object to write to
+        objs: Models to write
+        compression: "gzip", "zstd", or None to infer from the suffix
+
+    Returns:
+        Number of models written
+    """
+    with JSONLWriter(path, compression) as writer:
+        return writer.write_many(objs)
+
+
+def read_jsonl(path: PathOrFile, model: Type[M], compression: Optional[str] = None) -> Iterator[M]:
+    """
+    Stream models from a JSON Lines file.
+
+    Args:
+        path: File path, or a binary file object to read from
+        model: Model class of every line (e.g. Listing or Event)
+        compression: "gzip", "zstd", or None to infer from the suffix
+
+    Yields:
+        Validated model instances, in file order
+
+    Raises:
+        ValueError: If a line is not a valid model, with its line number
+    """
+    f = open_compressed(path, "rb", compression)
+    try:
+        validate = model.model_validate_json
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield validate(line)
+            except ValueError as e:
+                raise ValueError(f"Invalid {model.__name__} on line {number}: {e}") from e
+    finally:
+        if f is not path:
+            f.close()
+
+
+def export_timeline(timeline: EventTimeline, path: PathOrFile, compression: Optional[str] = None) -> int:
+    """
+    Write every event in a timeline to a JSON Lines file.
+
+    Events are streamed a page at a time through the timeline's iter_events,
+    so memory use does not grow with the timeline. They are written most
+    recent first, in query order (events sharing a timestamp in the order
+    they were added), which import_timeline rebuilds. Timelines without
+    iter_events are exported from get_all_events.
+
+    Args:
+        timeline: Timeline to export (any timeline with iter_events or get_all_events)
+        path: File path, or a binary file object to write to
+        compression: "gzip", "zstd", or None to infer from the suffix
+
+    Returns:
+        Number of events written
+    """
+    iter_events = getattr(timeline, "iter_events", None)
+    events = iter_events() if iter_events is not None else timeline.get_all_events()
+    return write_jsonl(path, events, compression)
+
+
+def import_timeline(
+    path: PathOrFile,
+    timeline: Optional[EventTimeline] = None,
+    compression: Optional[str] = None,
+    batch_size: int = 100_000,
+) -> EventTimeline:
+    """
+    Load events from a JSON Lines file into a timeline.
+
+    Reads files written most recent first by export_timeline, as well as
+    files in oldest-first order; either way each batch is merged in without
+    re-sorting the events already loaded.
+
+    Args:
+        path: File path, or a binary file object to read from
+        timeline: Timeline to add the events to (defaults to a new EventTimeline)
+        compression: "gzip", "zstd", or None to infer from the suffix
+        batch_size: Number of events passed to each add_events call
+
+    Returns:
+        The timeline the events were added to
+    """
+    if timeline is None:
+        timeline = EventTimeline()
+    batch: List[Event] = []
+    for event in read_jsonl(path, Event, compression):
+        batch.append(event)
+        if len(batch) >= batch_size:
+            timeline.add_events(batch)
+            batch = []
+    if batch:
+        timeline.add_events(batch)
+    return timeline
@@ -2,14 +2,17 @@
 Core listing data model with price and auction history support.
 """
 
+import heapq
 from datetime import datetime
-from typing import Optional, List
+from operator import attrgetter
+from typing import Optional, Any, Dict, Iterable, List, Mapping, Sequence, Union
 from decimal import Decimal
 from pydantic import BaseModel, Field, field_validator
 
 from .enums import ListingStatus, PropertyType, EventType
 from .address import Address
 from .events import EventTimeline, Event
+from .money import to_cents
 
 
 class PriceHistory(BaseModel):
@@ -19,6 +22,11 @@ class PriceHistory(BaseModel):
     timestamp: datetime = Field(..., description="When this price was recorded")
     source: Optional[str] = Field(None, description="Source of the price data")
 
+    @property
+    def price_cents(self) -> int:
+        """Price as integer cents."""
+        return to_cents(self.price)
+
     class Config:
         """Pydantic configuration."""
 
@@ -44,6 +52,58 @@ class AuctionHistory(BaseModel):
         }
 
 
+_by_timestamp = attrgetter("timestamp")
+_object_setattr = object.__setattr__
+
+# Field names per model class; reading model_fields off the class goes
+# through a deprecation shim on recent pydantic releases and costs microseconds
+_field_names: Dict[type, Any] = {}
+
+
+def _construct_trusted(cls: type, values: Dict[str, Any]) -> BaseModel:
+    """
+    Create a model instance from trusted field values without validation.
+
+    When every field is present (the usual case for ``model_dump()`` output)
+    the instance state is set directly, which is cheaper than both validation
+    and ``model_construct``; otherwise ``model_construct`` fills in defaults.
+    """
+    field_names = _field_names.get(cls)
+    if field_names is None:
+        field_names = _field_names[cls] = frozenset(cls.model_fields)
+    if values.keys() != field_names:
+        return cls.model_construct(**values)
+    instance = cls.__new__(cls)
+    _object_setattr(instance, "__dict__", values)
+    _object_setattr(instance, "__pydantic_fields_set__", set(values))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _insert_newest_first(history: list, record: Union[PriceHistory, AuctionHistory]) -> None:
+    """
+    Insert a record into a history list sorted by timestamp, most recent first.
+
+    The record goes after any existing records with the same timestamp,
+    matching a stable re-sort of the list with the record appended.
+    """
+    lo, hi = 0, len(history)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if history[mid].timestamp < record.timestamp:
+            hi = mid
+        else:
+            lo = mid + 1
+    history.insert(lo, record)
+
+
+def _merge_newest_first(history: list, records: Sequence[Union[PriceHistory, AuctionHistory]]) -> None:
+    """Merge records (in the order they were applied) into a most-recent-first history list."""
+    newest_first = sorted(records, key=_by_timestamp, reverse=True)
+    history[:] = heapq.merge(history, newest_first, key=_by_timestamp, reverse=True)
+
+
 class Listing(BaseModel):
     """
     Core property listing data model.
@@ -99,6 +159,64 @@ class Listing(BaseModel):
         """Ensure suburb matches address suburb."""
         return v.strip()
 
+    @property
+    def current_price_cents(self) -> Optional[int]:
+        """Current listing price as integer cents."""
+        return to_cents(self.current_price)
+
+    @property
+    def previous_price_cents(self) -> Optional[int]:
+        """Previous listing price as integer cents."""
+        return to_cents(self.previous_price)
+
+    @classmethod
+    def from_trusted(cls, data: Mapping[str, Any]) -> "Listing":
+        """
+        Build a listing from already-validated data without re-validating it.
+
+        Intended for re-hydrating listings from our own storage. The data
+        must be in the shape produced by ``model_dump()`` (Python mode, not
+        JSON mode): Decimal prices, datetime objects and enum members. Nested
+        addresses and history records may be dicts or model instances and are
+        not re-validated either. Missing fields get their defaults and
+        unknown keys are ignored.
+
+        Args:
+            data: Listing fields as produced by ``Listing.model_dump()``
+
+        Returns:
+            Listing model instance
+        """
+        fields = dict(data)
+        address = fields.get("address")
+        # The dict check first skips the slow ABC check in the common case
+        if isinstance(address, dict) or isinstance(address, Mapping):
+            fields["address"] = _construct_trusted(Address, dict(address))
+        if "price_history" in fields:
+            fields["price_history"] = [
+                record if isinstance(record, PriceHistory) else _construct_trusted(PriceHistory, dict(record))
+                for record in fields["price_history"]
+            ]
+        if "auction_history" in fields:
+            fields["auction_history"] = [
+                record if isinstance(record, AuctionHistory) else _construct_trusted(AuctionHistory, dict(record))
+                for record in fields["auction_history"]
+            ]
+        return _construct_trusted(cls, fields)
+
+    @classmethod
+    def from_trusted_batch(cls, records: Iterable[Mapping[str, Any]]) -> List["Listing"]:
+        """
+        Build many listings from already-validated data; see from_trusted.
+
+        Args:
+            records: Listing fields as produced by ``Listing.model_dump()``
+
+        Returns:
+            List of Listing model instances
+        """
+        return [cls.from_trusted(data) for data in records]
+
     def add_price_record(
         self,
         price: Decimal,
@@ -118,6 +236,51 @@ class Listing(BaseModel):
         if timestamp is None:
             timestamp = datetime.utcnow()
 
+        event = self._apply_price(price, timestamp)
+        _insert_newest_first(self.price_history, PriceHistory(price=price, timestamp=timestamp))
+
+        if event is not None and event_timeline is not None:
+            event_timeline.add_event(**event)
+
+    def replay_price_records(
+        self,
+        records: Iterable[PriceHistory],
+        event_timeline: Optional[EventTimeline] = None,
+    ) -> int:
+        """
+        Apply a batch of price records in one pass.
+
+        Equivalent to calling add_price_record for each record in timestamp
+        order, but the history is merged once and PRICE_DROPPED events are
+        added to the timeline as a single batch.
+
+        Args:
+            records: Price records to apply, in any order
+            event_timeline: Optional EventTimeline to log events to
+
+        Returns:
+            Number of PRICE_DROPPED events detected
+        """
+        batch = sorted(records, key=_by_timestamp)
+        events = []
+        for record in batch:
+            event = self._apply_price(record.price, record.timestamp)
+            if event is not None:
+                events.append(event)
+
+        _merge_newest_first(self.price_history, batch)
+
+        if events and event_timeline is not None:
+            event_timeline.add_events(events)
+        return len(events)
+
+    def _apply_price(self, price: Decimal, timestamp: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Update current/previous prices for a new price.
+
+        Returns:
+            Fields of the PRICE_DROPPED event to log, or None if the price did not drop
+        """
         # Detect price drop before updating
         price_dropped = (
             self.current_price is not None
@@ -131,29 +294,25 @@ class Listing(BaseModel):
         # Update current price
         self.current_price = price
 
-        # Add to history
-        self.price_history.append(
-            PriceHistory(price=price, timestamp=timestamp)
-        )
-
-        # Sort history by timestamp (most recent first)
-        self.price_history.sort(key=lambda x: x.timestamp, reverse=True)
-
-        # Log PRICE_DROPPED event if detected
-        if price_dropped and event_timeline is not None:
-            price_drop_amount = self.previous_price - price
-            price_drop_percent = (price_drop_amount / self.previous_price) * 100
-            event_timeline.add_event(
-                event_type=EventType.PRICE_DROPPED,
-                listing_id=self.listing_id,
-                timestamp=timestamp,
-                metadata={
-                    "old_price": str(self.previous_price),
-                    "new_price": str(price),
-                    "drop_amount": str(price_drop_amount),
-                    "drop_percent": float(price_drop_percent),
-                },
-            )
+        if not price_dropped:
+            return None
+
+        price_drop_amount = self.previous_price - price
+        price_drop_percent = (price_drop_amount / self.previous_price) * 100
+        return {
+            "event_type": EventType.PRICE_DROPPED,
+            "listing_id": self.listing_id,
+            "timestamp": timestamp,
+            "metadata": {
+                "old_price": str(self.previous_price),
+                "new_price": str(price),
+                "drop_amount": str(price_drop_amount),
+                "drop_percent": float(price_drop_percent),
+                "old_price_cents": to_cents(self.previous_price),
+                "new_price_cents": to_cents(price),
+                "drop_amount_cents": to_cents(price_drop_amount),
+            },
+        }
 
     def add_auction_record(
         self,
@@ -178,71 +337,102 @@ class Listing(BaseModel):
         if timestamp is None:
             timestamp = datetime.utcnow()
 
+        record = AuctionHistory(
+            auction_datetime=auction_datetime,
+            status=status,
+            timestamp=timestamp,
+            notes=notes,
+        )
+        event = self._apply_auction(record)
+        _insert_newest_first(self.auction_history, record)
+
+        if event is not None and event_timeline is not None:
+            event_timeline.add_event(**event)
+
+    def replay_auction_records(
+        self,
+        records: Iterable[AuctionHistory],
+        event_timeline: Optional[EventTimeline] = None,
+    ) -> int:
+        """
+        Apply a batch of auction records in one pass.
+
+        Equivalent to calling add_auction_record for each record in timestamp
+        order, but the history is merged once and auction events are added to
+        the timeline as a single batch.
+
+        Args:
+            records: Auction records to apply, in any order
+            event_timeline: Optional EventTimeline to log events to
+
+        Returns:
+            Number of auction events detected
+        """
+        batch = sorted(records, key=_by_timestamp)
+        events = []
+        for record in batch:
+            event = self._apply_auction(record)
+            if event is not None:
+                events.append(event)
+
+        _merge_newest_first(self.auction_history, batch)
+
+        if events and event_timeline is not None:
+            event_timeline.add_events(events)
+        return len(events)
+
+    def _apply_auction(self, record: AuctionHistory) -> Optional[Dict[str, Any]]:
+        """
+        Update status and next auction datetime for a new auction record.
+
+        Returns:
+            Fields of the auction event to log (CANCELLED, RESCHEDULED, VOIDED), or None
+        """
         # Detect status changes for event logging
         previous_status = self.status
         previous_auction_datetime = self.auction_datetime
 
         # Update current auction datetime if this is the most recent scheduled auction
-        if status == ListingStatus.SCHEDULED:
-            if self.auction_datetime is None or auction_datetime > self.auction_datetime:
-                self.auction_datetime = auction_datetime
+        if record.status == ListingStatus.SCHEDULED:
+            if self.auction_datetime is None or record.auction_datetime > self.auction_datetime:
+                self.auction_datetime = record.auction_datetime
 
         # Update status
-        self.status = status
-
-        # Add to history
-        self.auction_history.append(
-            AuctionHistory(
-                auction_datetime=auction_datetime,
-                status=status,
-                timestamp=timestamp,
-                notes=notes,
-            )
-        )
-
-        # Sort history by timestamp (most recent first)
-        self.auction_history.sort(key=lambda x: x.timestamp, reverse=True)
+        self.status = record.status
 
         # Log events based on status changes
-        if event_timeline is not None:
-            if status == ListingStatus.CANCELLED:
-                event_timeline.add_event(
-                    event_type=EventType.AUCTION_CANCELLED,
-                    listing_id=self.listing_id,
-                    timestamp=timestamp,
-                    metadata={
-                        "previous_status": str(previous_status),
-                        "auction_datetime": auction_datetime.isoformat(),
-                        "notes": notes,
-                    },
-                )
-            elif status == ListingStatus.VOIDED:
-                event_timeline.add_event(
-                    event_type=EventType.AUCTION_VOIDED,
-                    listing_id=self.listing_id,
-                    timestamp=timestamp,
-                    metadata={
-                        "previous_status": str(previous_status),
-                        "auction_datetime": auction_datetime.isoformat(),
-                        "notes": notes,
-                    },
-                )
-            elif (
-                status == ListingStatus.SCHEDULED
-                and previous_auction_datetime is not None
-                and auction_datetime != previous_auction_datetime
-            ):
-                # Auction was rescheduled
-                event_timeline.add_event(
-                    event_type=EventType.AUCTION_RESCHEDULED,
-                    listing_id=self.listing_id,
-                    timestamp=timestamp,
-                    metadata={
-                        "old_auction_datetime": previous_auction_datetime.isoformat(),
-                        "new_auction_datetime": auction_datetime.isoformat(),
-                        "notes": notes,
-                    },
-                )
+        if record.status in (ListingStatus.CANCELLED, ListingStatus.VOIDED):
+            event_type = (
+                EventType.AUCTION_CANCELLED
+                if record.status == ListingStatus.CANCELLED
+                else EventType.AUCTION_VOIDED
+            )
+            metadata = {
+                "previous_status": str(previous_status),
+                "auction_datetime": record.auction_datetime.isoformat(),
+                "notes": record.notes,
+            }
+        elif (
+            record.status == ListingStatus.SCHEDULED
+            and previous_auction_datetime is not None
+            and record.auction_datetime != previous_auction_datetime
+        ):
+            # Auction was rescheduled
+            event_type = EventType.AUCTION_RESCHEDULED
+            metadata = {
+                "old_auction_datetime": previous_auction_datetime.isoformat(),
+                "new_auction_datetime": record.auction_datetime.isoformat(),
+                "notes": record.notes,
+            }
+        else:
+            return None
+
+        return {
+            "event_type": event_type,
+            "listing_id": self.listing_id,
+            "timestamp": record.timestamp,
+            "metadata": metadata,
+        }
 
     class Config:
         """Pydantic configuration."""
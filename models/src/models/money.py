@@ -0,0 +1,46 @@
+"""
+Integer-cents price encoding.
+
+Prices are modelled as Decimal, which is exact but slow for bulk arithmetic
+and cannot go into NumPy arrays. This module converts them to and from
+int64 cents, so valuation and scoring can run as integer math while Decimal
+stays the representation at the edges (validation, display, JSON).
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Optional
+
+# Range of a signed 64-bit integer, the width used by columnar and NumPy storage
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def to_cents(value: Optional[Any]) -> Optional[int]:
+    """
+    Convert an amount to integer cents.
+
+    Amounts with a fraction of a cent are rounded half up; whole-cent
+    amounts (every real price) convert exactly.
+
+    Args:
+        value: Amount as a Decimal, int or numeric string (None passes through)
+
+    Returns:
+        Integer cents, or None
+
+    Raises:
+        ValueError: If the amount does not fit in a signed 64-bit integer
+    """
+    if value is None:
+        return None
+    cents = int(Decimal(value).scaleb(2).to_integral_value(ROUND_HALF_UP))
+    if not INT64_MIN <= cents <= INT64_MAX:
+        raise ValueError(f"Amount out of int64 cents range: {value}")
+    return cents
+
+
+def from_cents(cents: Optional[int]) -> Optional[Decimal]:
+    """Convert integer cents back to a Decimal amount, exactly."""
+    if cents is None:
+        return None
+    return Decimal(cents).scaleb(-2)
@@ -5,13 +5,23 @@ This module provides functions to convert raw scraper JSON data
 into standardized Listing models.
 """
 
-from typing import Dict, Optional, Any
+import gc
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Any, Tuple, Union
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 from .listing import Listing
 from .address import Address
+from .compact import ListingRecord
 from .enums import ListingStatus, PropertyType
+from .fingerprint import ID_FIELDS
 
 
 def normalize_realestate_data(data: Dict[str, Any]) -> Listing:
@@ -45,16 +55,16 @@ def normalize_realestate_data(data: Dict[str, Any]) -> Listing:
         land_value = property_sizes["land"].get("displayValue")
         if land_value:
             try:
-                land_size = Decimal(str(land_value))
-            except (ValueError, TypeError):
+                land_size = Decimal(str(land_value).replace(",", ""))
+            except (ValueError, TypeError, InvalidOperation):
                 pass
     
     if property_sizes.get("building"):
         building_value = property_sizes["building"].get("displayValue")
         if building_value:
             try:
-                building_size = Decimal(str(building_value))
-            except (ValueError, TypeError):
+                building_size = Decimal(str(building_value).replace(",", ""))
+            except (ValueError, TypeError, InvalidOperation):
                 pass
 
     # Extract general features
@@ -64,7 +74,7 @@ def normalize_realestate_data(data: Dict[str, Any]) -> Listing:
 
     # Extract property type
     property_type_str = data.get("propertyType", "")
-    property_type = PropertyType.from_string(property_type_str)
+    property_type = PropertyType.from_string(property_type_str, "realestate.com.au")
 
     # Extract auction information
     auction_data = data.get("auction")
@@ -119,7 +129,7 @@ def normalize_domain_data(data: Dict[str, Any]) -> Listing:
 
     # Extract property type
     property_type_str = data.get("propertyType", "")
-    property_type = PropertyType.from_string(property_type_str)
+    property_type = PropertyType.from_string(property_type_str, "domain.com.au")
 
     # Extract property sizes (domain format may differ)
     land_size = None
@@ -141,3 +151,188 @@ def normalize_domain_data(data: Dict[str, Any]) -> Listing:
 
     return listing
 
+
+NORMALIZERS: Dict[str, Callable[[Dict[str, Any]], Listing]] = {
+    "realestate.com.au": normalize_realestate_data,
+    "domain.com.au": normalize_domain_data,
+}
+
+
+def get_normalizer(source: str) -> Callable[[Dict[str, Any]], Listing]:
+    """
+    Return the normalizer for a data source.
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    try:
+        return NORMALIZERS[source]
+    except KeyError:
+        raise ValueError(f"Unknown source: {source!r}") from None
+
+
+class RecordError(NamedTuple):
+    """A record that failed to normalize."""
+
+    index: int
+    listing_id: Optional[str]
+    error_type: str
+    message: str
+
+
+class BatchResult(NamedTuple):
+    """Listings normalized by normalize_batch, and the records that failed."""
+
+    listings: List[Union[Listing, ListingRecord]]
+    errors: List[RecordError]
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Listings hold no reference cycles, but building millions of them sets off
+    # repeated full collections that cost more than the normalizing itself.
+    # Only used in pool workers: gc.disable() affects the whole process.
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _normalize_chunk(
+    source: str, start: int, records: List[Any], compact: bool = False
+) -> Tuple[List[Union[Listing, ListingRecord]], List[RecordError]]:
+    """Normalize a chunk of records, collecting failures instead of raising."""
+    normalize = get_normalizer(source)
+    id_field = ID_FIELDS[source]
+    listings = []
+    errors = []
+    for index, data in enumerate(records, start):
+        try:
+            if isinstance(data, (bytes, str)):
+                data = json.loads(data)
+            listing = normalize(data)
+            listings.append(ListingRecord.from_listing(listing) if compact else listing)
+        except Exception as e:
+            listing_id = data.get(id_field) if isinstance(data, Mapping) else None
+            errors.append(
+                RecordError(index, str(listing_id) if listing_id is not None else None, type(e).__name__, str(e))
+            )
+    return listings, errors
+
+
+def _normalize_chunk_in_worker(
+    source: str, start: int, records: List[Any], compact: bool
+) -> Tuple[List[Union[Listing, ListingRecord]], List[RecordError]]:
+    with _gc_paused():
+        return _normalize_chunk(source, start, records, compact)
+
+
+def _chunks(records: Iterable[Any], chunk_size: int) -> Iterator[Tuple[int, List[Any]]]:
+    iterator = iter(records)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def iter_normalized_chunks(
+    records: Iterable[Any],
+    source: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    context: Optional[str] = None,
+    compact: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Normalize records in chunks, yielding each chunk's result in input order.
+
+    Records are read lazily and only a few chunks per worker are in flight
+    at once, so memory stays flat however many records there are.
+
+    Args:
+        records: Raw JSON records from a scraper (any iterable), as dicts or
+            as JSON text (str or bytes), which is parsed in the workers
+        source: Data source ("realestate.com.au" or "domain.com.au")
+        workers: Number of worker processes (defaults to the CPU count);
+            0 or 1 normalizes in the calling process
+        chunk_size: Records sent to a worker at a time
+        context: Optional multiprocessing start method ("fork", "spawn", ...)
+        compact: Return ListingRecord objects instead of Listing models;
+            they pickle smaller and load about twice as fast in the
+            calling process
+
+    Yields:
+        BatchResult per chunk; RecordError.index is the record's position
+        in `records`
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    get_normalizer(source)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        for start, chunk in _chunks(records, chunk_size):
+            yield BatchResult(*_normalize_chunk(source, start, chunk, compact))
+        return
+
+    mp_context = multiprocessing.get_context(context)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+        pending: deque = deque()
+        for start, chunk in _chunks(records, chunk_size):
+            pending.append(executor.submit(_normalize_chunk_in_worker, source, start, chunk, compact))
+            if len(pending) >= workers * 2:
+                yield BatchResult(*pending.popleft().result())
+        while pending:
+            yield BatchResult(*pending.popleft().result())
+
+
+def normalize_batch(
+    records: Iterable[Any],
+    source: str,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    context: Optional[str] = None,
+    compact: bool = False,
+) -> BatchResult:
+    """
+    Normalize many records across a process pool without stopping on bad ones.
+
+    Records that fail to normalize are reported in the result's errors
+    rather than raised, so one malformed record does not abort a backfill.
+
+    Passing records as JSON text (e.g. lines of a JSONL file) instead of
+    dicts moves parsing into the workers and makes them cheaper to send.
+    Every listing is still unpickled in the calling process, which caps the
+    speedup from adding workers; compact=True sends ListingRecord objects,
+    which cost less than half as much to unpickle.
+
+    Args:
+        records: Raw JSON records from a scraper, as dicts or JSON text
+        source: Data source ("realestate.com.au" or "domain.com.au")
+        workers: Number of worker processes (defaults to the CPU count);
+            0 or 1 normalizes in the calling process
+        chunk_size: Records sent to a worker at a time
+        context: Optional multiprocessing start method ("fork", "spawn", ...)
+        compact: Return ListingRecord objects instead of Listing models
+
+    Returns:
+        BatchResult with the listings (in input order, failures left out)
+        and a RecordError per failed record
+
+    Raises:
+        ValueError: If the source is unknown
+    """
+    listings: List[Union[Listing, ListingRecord]] = []
+    errors: List[RecordError] = []
+    for result in iter_normalized_chunks(records, source, workers, chunk_size, context, compact):
+        listings.extend(result.listings)
+        errors.extend(result.errors)
+    return BatchResult(listings, errors)
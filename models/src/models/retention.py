@@ -0,0 +1,184 @@
+"""
+Event retention and compaction.
+
+This module rolls old events out of an EventTimeline according to a
+configurable policy. Expired events are folded into per-listing
+rollup events and ListingSummary records, which stay queryable through
+the timeline's query methods and EventTimeline.get_listing_summary.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Dict, List, Mapping
+
+from pydantic import BaseModel, Field
+
+from .enums import EventType, ListingStatus
+from .events import Event, EventTimeline
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionPolicy(BaseModel):
+    """
+    How long events are kept before being compacted.
+
+    Horizons can be set per event type and per listing status. When several
+    apply to an event, the shortest one wins; events with no applicable
+    horizon are kept forever.
+    """
+
+    default_horizon: Optional[timedelta] = Field(None, description="Horizon for all events (None keeps forever)")
+    horizons_by_type: Dict[EventType, timedelta] = Field(
+        default_factory=dict,
+        description="Horizon per event type",
+    )
+    horizons_by_status: Dict[ListingStatus, timedelta] = Field(
+        default_factory=dict,
+        description="Horizon for events of listings in a given status (e.g. sold, withdrawn)",
+    )
+
+    def horizon_for(
+        self,
+        event_type: EventType,
+        status: Optional[ListingStatus] = None,
+    ) -> Optional[timedelta]:
+        """
+        Get the retention horizon for an event.
+
+        Args:
+            event_type: Type of the event
+            status: Current status of the event's listing, if known
+
+        Returns:
+            Shortest applicable horizon, or None if the event is kept forever
+        """
+        horizons = [
+            self.default_horizon,
+            self.horizons_by_type.get(event_type),
+            self.horizons_by_status.get(status) if status is not None else None,
+        ]
+        horizons = [h for h in horizons if h is not None]
+        return min(horizons) if horizons else None
+
+
+class RetentionEngine:
+    """
+    Applies a RetentionPolicy to an EventTimeline incrementally.
+
+    Each call to run_step examines the next `batch_size` listings, so a full
+    pass over a large timeline can be spread out over time. start() runs the
+    steps on a background thread.
+
+    EventTimeline is not thread-safe: when running in the background, pass a
+    lock that every other user of the timeline also holds while reading or
+    writing it.
+    """
+
+    def __init__(
+        self,
+        timeline: EventTimeline,
+        policy: RetentionPolicy,
+        listing_statuses: Optional[Mapping[str, ListingStatus]] = None,
+        batch_size: int = 1000,
+        lock: Optional[threading.Lock] = None,
+    ):
+        """
+        Initialize a retention engine.
+
+        Args:
+            timeline: Timeline to compact
+            policy: Retention policy to apply
+            listing_statuses: Current status per listing ID, used for status horizons
+            batch_size: Number of listings examined per step
+            lock: Lock guarding the timeline when running in the background
+        """
+        self.timeline = timeline
+        self.policy = policy
+        self.listing_statuses = listing_statuses if listing_statuses is not None else {}
+        self.batch_size = batch_size
+        self.lock = lock if lock is not None else threading.Lock()
+
+        self._pending: List[str] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _is_expired(self, event: Event, now: datetime) -> bool:
+        horizon = self.policy.horizon_for(event.event_type, self.listing_statuses.get(event.listing_id))
+        return horizon is not None and event.timestamp < now - horizon
+
+    def run_step(self, now: Optional[datetime] = None) -> int:
+        """
+        Compact expired events for the next batch of listings.
+
+        A pass starts from a snapshot of the timeline's listing IDs; once it
+        has been worked through, the next step starts a new pass.
+
+        Args:
+            now: Reference time for horizons (defaults to now)
+
+        Returns:
+            Number of events compacted in this step
+        """
+        if now is None:
+            now = datetime.utcnow()
+
+        with self.lock:
+            if not self._pending:
+                self._pending = self.timeline.get_listing_ids()
+            batch = self._pending[-self.batch_size :]
+            del self._pending[-self.batch_size :]
+            return self.timeline.compact(lambda event: self._is_expired(event, now), batch)
+
+    def run(self, now: Optional[datetime] = None) -> int:
+        """
+        Run a full compaction pass over every listing.
+
+        Args:
+            now: Reference time for horizons (defaults to now)
+
+        Returns:
+            Number of events compacted
+        """
+        if now is None:
+            now = datetime.utcnow()
+
+        with self.lock:
+            self._pending = self.timeline.get_listing_ids()
+        compacted = 0
+        while self._pending:
+            compacted += self.run_step(now)
+        return compacted
+
+    def start(self, interval: float = 1.0) -> None:
+        """
+        Run compaction steps on a background thread.
+
+        A step that raises is logged and does not stop the thread.
+
+        Args:
+            interval: Seconds to wait between steps
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.run_step()
+                except Exception:
+                    # Keep the thread alive; the next step retries
+                    logger.exception("Retention step failed")
+
+        self._thread = threading.Thread(target=loop, name="retention-engine", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the background thread, waiting for the current step to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
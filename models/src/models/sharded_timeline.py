@@ -0,0 +1,374 @@
+"""
+Event timeline sharded across worker processes.
+
+This module provides ShardedEventTimeline, which partitions events by
+listing ID across N worker processes, each holding its own EventTimeline.
+Per-listing queries are routed to a single shard; global queries are sent to
+every shard and the results are k-way merged by timestamp.
+"""
+
+import multiprocessing
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import count
+from multiprocessing.connection import Connection
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+
+from .concurrent_timeline import merge_newest_first, shard_for
+from .enums import EventType
+from .events import Event, EventInput, EventTimeline, validate_events
+
+# Methods a worker will run on its timeline
+_WORKER_METHODS = {
+    "add_events",
+    "get_events_for_listing",
+    "get_events_between",
+    "get_latest_event",
+    "has_event_type",
+    "count_events",
+    "clear",
+    "_keyed_events",
+}
+
+
+class _AssignedSequence:
+    """Sequence numbers handed to a worker's timeline by the coordinator."""
+
+    def __init__(self):
+        self.pending: deque = deque()
+
+    def __iter__(self) -> "_AssignedSequence":
+        return self
+
+    def __next__(self) -> int:
+        return self.pending.popleft()
+
+
+def _worker(conn: Connection) -> None:
+    """Serve timeline requests from the coordinator until told to stop."""
+    sequence = _AssignedSequence()
+    timeline = EventTimeline(sequence=sequence)
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        method, args, sequence_numbers = message
+        sequence.pending.extend(sequence_numbers)
+        try:
+            if method not in _WORKER_METHODS:
+                raise AttributeError(f"Unsupported shard method: {method}")
+            conn.send((True, getattr(timeline, method)(*args)))
+        except Exception as e:
+            sequence.pending.clear()
+            conn.send((False, e))
+    conn.close()
+
+
+class ShardedEventTimeline:
+    """
+    Event timeline partitioned by listing ID across worker processes.
+
+    Has the same query API as EventTimeline. The coordinator validates events
+    and assigns their sequence numbers before sending them to a shard, so
+    merged global results order ties exactly as a single EventTimeline would.
+
+    Safe to share between threads: each shard's pipe is guarded by its own
+    lock, so requests to different shards proceed in parallel.
+
+    Close the timeline (or use it as a context manager) to stop the workers;
+    any later call raises RuntimeError.
+    """
+
+    def __init__(self, shards: int = 4, context: Optional[str] = None):
+        """
+        Start the shard worker processes.
+
+        Args:
+            shards: Number of worker processes
+            context: Optional multiprocessing start method ("fork", "spawn", ...)
+        """
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        ctx = multiprocessing.get_context(context)
+        self._sequence = count()
+        self._connections: List[Connection] = []
+        self._processes = []
+        self._locks = [threading.Lock() for _ in range(shards)]
+        for i in range(shards):
+            parent, child = ctx.Pipe()
+            process = ctx.Process(target=_worker, args=(child,), name=f"event-shard-{i}", daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def _check_open(self) -> None:
+        if not self._connections:
+            raise RuntimeError("timeline is closed")
+
+    def _shard(self, listing_id: str) -> int:
+        self._check_open()
+        return shard_for(listing_id, len(self._connections))
+
+    @contextmanager
+    def _locked(self, shards: Iterable[int]) -> Iterator[None]:
+        """Hold the locks of the given shards, acquired in ascending order."""
+        held = []
+        try:
+            for i in sorted(set(shards)):
+                self._locks[i].acquire()
+                held.append(i)
+            yield
+        finally:
+            for i in reversed(held):
+                self._locks[i].release()
+
+    def _receive(self, shard: int) -> Any:
+        ok, result = self._connections[shard].recv()
+        if not ok:
+            raise result
+        return result
+
+    def _call(self, shard: int, method: str, *args: Any, sequence_numbers: Tuple[int, ...] = ()) -> Any:
+        with self._locked((shard,)):
+            # close() may have run while this thread waited for the lock
+            self._check_open()
+            self._connections[shard].send((method, args, sequence_numbers))
+            return self._receive(shard)
+
+    def _scatter(self, requests: Dict[int, Tuple[str, tuple, Tuple[int, ...]]]) -> Dict[int, Any]:
+        """Send requests to several shards at once, then gather every reply."""
+        with self._locked(requests):
+            self._check_open()
+            for shard, request in requests.items():
+                self._connections[shard].send(request)
+            results = {}
+            errors = []
+            for shard in requests:
+                try:
+                    results[shard] = self._receive(shard)
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            raise errors[0]
+        return results
+
+    def _broadcast(self, method: str, *args: Any) -> List[Any]:
+        shards = range(len(self._locks))
+        results = self._scatter(dict.fromkeys(shards, (method, args, ())))
+        return [results[shard] for shard in shards]
+
+    def add_event(
+        self,
+        event_type: EventType,
+        listing_id: str,
+        timestamp: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Event:
+        """
+        Add an event to the timeline.
+
+        Args:
+            event_type: Type of event
+            listing_id: ID of the listing
+            timestamp: When the event occurred (defaults to now)
+            metadata: Additional metadata about the event
+
+        Returns:
+            The created Event instance
+        """
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+
+        if metadata is None:
+            metadata = {}
+
+        event = Event(
+            event_type=event_type,
+            timestamp=timestamp,
+            listing_id=listing_id,
+            metadata=metadata,
+        )
+        self._call(self._shard(listing_id), "add_events", [event], sequence_numbers=(next(self._sequence),))
+        return event
+
+    def add_events(self, events: Iterable[EventInput]) -> Dict[str, int]:
+        """
+        Add a batch of events, sending each shard its part in one message.
+
+        Args:
+            events: Event instances, mappings of Event fields, or tuples of
+                (event_type, listing_id[, timestamp[, metadata]])
+
+        Returns:
+            Number of events added per listing ID
+        """
+        by_shard: Dict[int, Tuple[List[Event], List[int]]] = {}
+        for event in validate_events(events):
+            shard_events, sequence_numbers = by_shard.setdefault(self._shard(event.listing_id), ([], []))
+            shard_events.append(event)
+            sequence_numbers.append(next(self._sequence))
+
+        results = self._scatter(
+            {
+                shard: ("add_events", (shard_events,), tuple(sequence_numbers))
+                for shard, (shard_events, sequence_numbers) in by_shard.items()
+            }
+        )
+        counts: Dict[str, int] = {}
+        for shard_counts in results.values():
+            counts.update(shard_counts)
+        return counts
+
+    def get_events_for_listing(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Query events for a specific listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events for the listing, sorted by timestamp (most recent first)
+        """
+        return self._call(self._shard(listing_id), "get_events_for_listing", listing_id, event_type, limit)
+
+    def get_all_events(
+        self,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get all events, optionally filtered by type.
+
+        Args:
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events, sorted by timestamp (most recent first)
+        """
+        return self.get_events_between(None, None, event_type=event_type, limit=limit)
+
+    def get_events_between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get events within a time range, optionally filtered by listing and/or type.
+
+        Args:
+            start: Earliest timestamp to include (None for no lower bound)
+            end: Latest timestamp to include (None for no upper bound)
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events in the range, sorted by timestamp (most recent first)
+        """
+        if listing_id is not None:
+            return self._call(
+                self._shard(listing_id), "get_events_between", start, end, listing_id, event_type, limit
+            )
+        keyed = self._broadcast("_keyed_events", None, event_type, start, end, limit)
+        return merge_newest_first(keyed, limit)
+
+    def get_latest_event(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+    ) -> Optional[Event]:
+        """
+        Get the most recent event for a listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+
+        Returns:
+            Most recent event, or None if no events exist
+        """
+        return self._call(self._shard(listing_id), "get_latest_event", listing_id, event_type)
+
+    def has_event_type(
+        self,
+        listing_id: str,
+        event_type: EventType,
+    ) -> bool:
+        """
+        Check if a listing has any events of a specific type.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Event type to check for
+
+        Returns:
+            True if listing has at least one event of this type
+        """
+        return self._call(self._shard(listing_id), "has_event_type", listing_id, event_type)
+
+    def count_events(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+    ) -> int:
+        """
+        Count events, optionally filtered by listing and/or event type.
+
+        Args:
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+
+        Returns:
+            Number of events matching the criteria
+        """
+        if listing_id is not None:
+            return self._call(self._shard(listing_id), "count_events", listing_id, event_type)
+        return sum(self._broadcast("count_events", None, event_type))
+
+    def clear(self) -> None:
+        """Clear all events from the timeline."""
+        self._broadcast("clear")
+
+    def close(self) -> None:
+        """Stop the worker processes. Closing twice is a no-op."""
+        with self._locked(range(len(self._locks))):
+            for conn in self._connections:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in self._processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+            self._processes = []
+
+    def __enter__(self) -> "ShardedEventTimeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the total number of events."""
+        return self.count_events()
+
+    def __repr__(self) -> str:
+        return f"ShardedEventTimeline(shards={len(self._locks)})"
@@ -0,0 +1,503 @@
+"""
+SQLite storage for listings and events.
+
+This module persists Listing and Event models with the stdlib sqlite3 module,
+so no outside database service is needed. Databases are opened in WAL mode,
+which lets ingestion workers write while API processes read concurrently.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
+
+from .columnar import decode_metadata, encode_metadata
+from .enums import EventType, ListingStatus
+from .events import Event, EventInput, from_epoch_micros, to_epoch_micros, validate_events
+from .listing import Listing
+from .money import to_cents
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    listing_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    tz_aware INTEGER NOT NULL DEFAULT 0,
+    metadata BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_events_listing_timestamp ON events (listing_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_type_timestamp ON events (event_type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_timestamp ON events (timestamp);
+
+CREATE TABLE IF NOT EXISTS listings (
+    listing_id TEXT PRIMARY KEY,
+    suburb TEXT NOT NULL,
+    property_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    updated_at INTEGER,
+    current_price_cents INTEGER,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_suburb ON listings (suburb);
+CREATE INDEX IF NOT EXISTS idx_listings_status ON listings (status);
+"""
+
+# Indexes on columns added after the first schema version; created once any
+# missing columns have been added to databases from earlier versions
+LATE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_listings_price ON listings (current_price_cents);
+"""
+
+# Columns added to the listings table since the first schema version
+_LISTING_COLUMNS_ADDED = {
+    "current_price_cents": "INTEGER",
+}
+
+# Events sharing a timestamp are returned in insertion order, as in EventTimeline
+_NEWEST_FIRST = "ORDER BY timestamp DESC, seq ASC"
+
+
+def connect(path: Union[str, Path], timeout: float = 30.0) -> sqlite3.Connection:
+    """
+    Open a SQLite database configured for concurrent readers and writers.
+
+    Enables WAL mode with synchronous=NORMAL and creates the schema if needed.
+
+    Args:
+        path: Database file path (or ":memory:")
+        timeout: Seconds to wait for a lock held by another connection
+
+    Returns:
+        Open sqlite3 connection
+    """
+    conn = sqlite3.connect(str(path), timeout=timeout)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    _migrate(conn)
+    return conn
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring a database created by an earlier schema version up to date."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(listings)")}
+    missing = {name: kind for name, kind in _LISTING_COLUMNS_ADDED.items() if name not in columns}
+    if missing:
+        with conn:
+            for name, kind in missing.items():
+                conn.execute(f"ALTER TABLE listings ADD COLUMN {name} {kind}")
+            if "current_price_cents" in missing:
+                rows = conn.execute("SELECT listing_id, data FROM listings").fetchall()
+                conn.executemany(
+                    "UPDATE listings SET current_price_cents = ? WHERE listing_id = ?",
+                    [(to_cents(json.loads(data).get("current_price")), listing_id) for listing_id, data in rows],
+                )
+    conn.executescript(LATE_INDEXES)
+
+
+class SQLiteEventTimeline:
+    """
+    Event timeline persisted in SQLite with the same query API as EventTimeline.
+
+    Timestamps are stored as integer microseconds since the Unix epoch and
+    metadata as compact JSON. Queries are served by composite indexes on
+    (listing_id, timestamp) and (event_type, timestamp).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, sqlite3.Connection],
+        batch_size: int = 10_000,
+    ):
+        """
+        Open (or create) an event timeline database.
+
+        Args:
+            path: Database file path, or an existing connection from `connect`
+            batch_size: Number of rows written per transaction by add_events
+        """
+        self._conn = path if isinstance(path, sqlite3.Connection) else connect(path)
+        self.batch_size = batch_size
+
+    def _row(self, event: Event) -> Tuple[str, str, int, bool, bytes]:
+        micros, aware = to_epoch_micros(event.timestamp)
+        return event.listing_id, event.event_type.value, micros, aware, encode_metadata(event.metadata)
+
+    def add_event(
+        self,
+        event_type: EventType,
+        listing_id: str,
+        timestamp: Optional[datetime] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Event:
+        """
+        Add an event to the timeline.
+
+        Args:
+            event_type: Type of event
+            listing_id: ID of the listing
+            timestamp: When the event occurred (defaults to now)
+            metadata: Additional metadata about the event
+
+        Returns:
+            The created Event instance
+        """
+        if timestamp is None:
+            timestamp = datetime.utcnow()
+
+        if metadata is None:
+            metadata = {}
+
+        event = Event(
+            event_type=event_type,
+            timestamp=timestamp,
+            listing_id=listing_id,
+            metadata=metadata,
+        )
+
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO events (listing_id, event_type, timestamp, tz_aware, metadata) VALUES (?, ?, ?, ?, ?)",
+                self._row(event),
+            )
+
+        return event
+
+    def add_events(self, events: Iterable[EventInput]) -> Dict[str, int]:
+        """
+        Add a batch of events to the timeline.
+
+        Accepts the same inputs as EventTimeline.add_events. Rows are written
+        with executemany in transactions of `batch_size` rows.
+
+        Args:
+            events: Event instances, mappings of Event fields, or tuples of
+                (event_type, listing_id[, timestamp[, metadata]])
+
+        Returns:
+            Number of events added per listing ID
+        """
+        validated = validate_events(events)
+        counts: Dict[str, int] = {}
+        for event in validated:
+            counts[event.listing_id] = counts.get(event.listing_id, 0) + 1
+
+        for start in range(0, len(validated), self.batch_size):
+            batch = validated[start : start + self.batch_size]
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO events (listing_id, event_type, timestamp, tz_aware, metadata) VALUES (?, ?, ?, ?, ?)",
+                    [self._row(event) for event in batch],
+                )
+
+        return counts
+
+    def _where(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[str, List[Any]]:
+        clauses = []
+        params: List[Any] = []
+        if listing_id is not None:
+            clauses.append("listing_id = ?")
+            params.append(listing_id)
+        if event_type is not None:
+            clauses.append("event_type = ?")
+            params.append(EventType(event_type).value)
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(to_epoch_micros(start)[0])
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(to_epoch_micros(end)[0])
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _select(self, where: str, params: List[Any], limit: Optional[int]) -> List[Event]:
+        sql = f"SELECT listing_id, event_type, timestamp, tz_aware, metadata FROM events{where} {_NEWEST_FIRST}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = params + [limit]
+        return [
+            Event.model_construct(
+                event_type=EventType(event_type),
+                timestamp=from_epoch_micros(timestamp, bool(tz_aware)),
+                listing_id=listing_id,
+                metadata=decode_metadata(metadata),
+            )
+            for listing_id, event_type, timestamp, tz_aware, metadata in self._conn.execute(sql, params)
+        ]
+
+    def get_events_for_listing(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Query events for a specific listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events for the listing, sorted by timestamp (most recent first)
+        """
+        return self._select(*self._where(listing_id, event_type), limit)
+
+    def get_all_events(
+        self,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get all events, optionally filtered by type.
+
+        Args:
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events, sorted by timestamp (most recent first)
+        """
+        return self._select(*self._where(event_type=event_type), limit)
+
+    def get_events_between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        Get events within a time range, optionally filtered by listing and/or type.
+
+        Args:
+            start: Earliest timestamp to include (None for no lower bound)
+            end: Latest timestamp to include (None for no upper bound)
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+            limit: Optional limit on number of events to return
+
+        Returns:
+            List of events in the range, sorted by timestamp (most recent first)
+        """
+        return self._select(*self._where(listing_id, event_type, start, end), limit)
+
+    def get_latest_event(
+        self,
+        listing_id: str,
+        event_type: Optional[EventType] = None,
+    ) -> Optional[Event]:
+        """
+        Get the most recent event for a listing.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Optional filter by event type
+
+        Returns:
+            Most recent event, or None if no events exist
+        """
+        events = self.get_events_for_listing(listing_id, event_type, limit=1)
+        return events[0] if events else None
+
+    def has_event_type(
+        self,
+        listing_id: str,
+        event_type: EventType,
+    ) -> bool:
+        """
+        Check if a listing has any events of a specific type.
+
+        Args:
+            listing_id: ID of the listing
+            event_type: Event type to check for
+
+        Returns:
+            True if listing has at least one event of this type
+        """
+        where, params = self._where(listing_id, event_type)
+        return self._conn.execute(f"SELECT 1 FROM events{where} LIMIT 1", params).fetchone() is not None
+
+    def count_events(
+        self,
+        listing_id: Optional[str] = None,
+        event_type: Optional[EventType] = None,
+    ) -> int:
+        """
+        Count events, optionally filtered by listing and/or event type.
+
+        Args:
+            listing_id: Optional filter by listing ID
+            event_type: Optional filter by event type
+
+        Returns:
+            Number of events matching the criteria
+        """
+        where, params = self._where(listing_id, event_type)
+        return self._conn.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()[0]
+
+    def clear(self) -> None:
+        """Clear all events from the timeline."""
+        with self._conn:
+            self._conn.execute("DELETE FROM events")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the total number of events."""
+        return self.count_events()
+
+    def __repr__(self) -> str:
+        return f"SQLiteEventTimeline(events={len(self)})"
+
+
+class SQLiteListingStore:
+    """
+    Listing storage in SQLite.
+
+    Each listing is stored as its JSON representation, with suburb, property
+    type, status and current price (as integer cents) copied into indexed
+    columns for filtering.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, sqlite3.Connection],
+        batch_size: int = 1_000,
+    ):
+        """
+        Open (or create) a listing database.
+
+        Args:
+            path: Database file path, or an existing connection from `connect`
+            batch_size: Number of listings written per transaction by save_listings
+        """
+        self._conn = path if isinstance(path, sqlite3.Connection) else connect(path)
+        self.batch_size = batch_size
+
+    def _row(self, listing: Listing) -> Tuple[Any, ...]:
+        updated_at = to_epoch_micros(listing.updated_at)[0] if listing.updated_at else None
+        return (
+            listing.listing_id,
+            listing.suburb,
+            listing.property_type.value,
+            listing.status.value,
+            updated_at,
+            listing.current_price_cents,
+            listing.model_dump_json(),
+        )
+
+    def save_listing(self, listing: Listing) -> None:
+        """Insert a listing, replacing any stored listing with the same ID."""
+        self.save_listings([listing])
+
+    def save_listings(self, listings: Iterable[Listing]) -> int:
+        """
+        Insert or replace a batch of listings.
+
+        Args:
+            listings: Listings to store
+
+        Returns:
+            Number of listings written
+        """
+        rows = [self._row(listing) for listing in listings]
+        for start in range(0, len(rows), self.batch_size):
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO listings "
+                    "(listing_id, suburb, property_type, status, updated_at, current_price_cents, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows[start : start + self.batch_size],
+                )
+        return len(rows)
+
+    def get_listing(self, listing_id: str) -> Optional[Listing]:
+        """
+        Get a listing by ID.
+
+        Args:
+            listing_id: ID of the listing
+
+        Returns:
+            The stored Listing, or None if it does not exist
+        """
+        row = self._conn.execute("SELECT data FROM listings WHERE listing_id = ?", (listing_id,)).fetchone()
+        return Listing.model_validate_json(row[0]) if row else None
+
+    def get_listings(
+        self,
+        suburb: Optional[str] = None,
+        status: Optional[ListingStatus] = None,
+        limit: Optional[int] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+    ) -> List[Listing]:
+        """
+        Get listings, optionally filtered by suburb, status and/or price range.
+
+        Args:
+            suburb: Optional filter by suburb name
+            status: Optional filter by listing status
+            limit: Optional limit on number of listings to return
+            min_price: Optional lowest current price to include
+            max_price: Optional highest current price to include
+
+        Returns:
+            List of listings ordered by listing ID
+        """
+        clauses = []
+        params: List[Any] = []
+        if suburb is not None:
+            clauses.append("suburb = ?")
+            params.append(suburb)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(ListingStatus(status).value)
+        if min_price is not None:
+            clauses.append("current_price_cents >= ?")
+            params.append(to_cents(min_price))
+        if max_price is not None:
+            clauses.append("current_price_cents <= ?")
+            params.append(to_cents(max_price))
+
+        sql = "SELECT data FROM listings"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY listing_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [Listing.model_validate_json(data) for (data,) in self._conn.execute(sql, params)]
+
+    def delete_listing(self, listing_id: str) -> bool:
+        """Delete a listing, returning True if it existed."""
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM listings WHERE listing_id = ?", (listing_id,))
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __contains__(self, listing_id: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM listings WHERE listing_id = ?", (listing_id,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        """Return the number of stored listings."""
+        return self._conn.execute("SELECT COUNT(*) FROM listings").fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f"SQLiteListingStore(listings={len(self)})"
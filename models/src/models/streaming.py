@@ -0,0 +1,256 @@
+"""
+Streaming readers for scraper output files.
+
+The scrapers write one large JSON array per run (results/search.json), and
+backfills may also arrive as JSON Lines. The readers in this module yield
+one record at a time from either format, holding only the record being
+parsed in memory, and stream_normalize feeds them through normalize_batch's
+chunked pipeline so multi-GB files load with flat memory use.
+"""
+
+import io
+import json
+import re
+from pathlib import Path
+from typing import Optional, Any, Dict, Iterator, Union
+
+from .jsonl import PathOrFile, open_compressed
+from .normalizers import BatchResult, iter_normalized_chunks
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,]")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+# A value cut off by the end of a block fails to decode within this many
+# characters of the buffer's end (a literal such as "-Infinity", a \uXXXX
+# escape or a number's exponent); an error further back is a real one
+_TRUNCATION_MARGIN = 16
+
+# Suffixes read as JSON Lines; anything else is sniffed from its first character
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+
+_decoder = json.JSONDecoder()
+
+
+def iter_json_array(
+    path: PathOrFile,
+    compression: Optional[str] = None,
+    read_size: int = 1 << 16,
+) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in blocks and each element is decoded as soon as it
+    is complete, so memory use is bounded by the largest element rather
+    than the file.
+
+    Args:
+        path: File path, or a binary file object to read from
+        compression: "gzip", "zstd", or None to infer from the suffix
+        read_size: Characters read per block
+
+    Yields:
+        Decoded array elements, in order
+
+    Raises:
+        ValueError: If the file is not a well-formed JSON array
+    """
+    f = open_compressed(path, "rb", compression)
+    text = io.TextIOWrapper(f, encoding="utf-8")
+    try:
+        buffer = text.read(read_size)
+        eof = not buffer
+        pos = 0
+        started = False
+        closed = False
+        after_element = False
+        after_comma = False
+        want = read_size
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer):
+                char = buffer[pos]
+                if closed:
+                    raise ValueError(f"Unexpected data after JSON array, found {char!r}")
+                if not started:
+                    if char != "[":
+                        raise ValueError("Expected a JSON array")
+                    pos += 1
+                    started = True
+                    continue
+                if char == "]":
+                    if after_comma:
+                        raise ValueError("Trailing comma in JSON array")
+                    # Only whitespace may follow the array
+                    pos += 1
+                    closed = True
+                    continue
+                if after_element:
+                    if char != ",":
+                        raise ValueError(f"Expected ',' or ']' in JSON array, found {char!r}")
+                    pos += 1
+                    after_element = False
+                    after_comma = True
+                    continue
+                try:
+                    value, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if eof or not _maybe_truncated(e, len(buffer)):
+                        raise ValueError(f"Invalid JSON array element: {e}") from e
+                else:
+                    # A number cut off by the end of the block (e.g. "-0." or
+                    # "12" of "12345") decodes short, so only accept a value
+                    # followed by a delimiter already in the buffer
+                    if eof or (end < len(buffer) and buffer[end] in _DELIMITERS):
+                        yield value
+                        pos = end
+                        after_element = True
+                        after_comma = False
+                        want = read_size
+                        continue
+                    tail = buffer[end:]
+                    if len(tail) >= _TRUNCATION_MARGIN or not _NUMBER_CHARS.issuperset(tail):
+                        raise ValueError(f"Expected ',' or ']' in JSON array, found {buffer[end]!r}")
+            elif eof:
+                if closed:
+                    return
+                raise ValueError("Unexpected end of JSON array" if started else "Expected a JSON array")
+
+            # Need more input: keep the unparsed tail and read a block, growing
+            # the block while a single element keeps spanning the buffer
+            block = text.read(want)
+            eof = not block
+            buffer = buffer[pos:] + block
+            pos = 0
+            want *= 2
+    finally:
+        if f is path:
+            text.detach()
+        else:
+            text.close()
+
+
+def _maybe_truncated(error: json.JSONDecodeError, length: int) -> bool:
+    # An unterminated string reports where the string starts, however long it is
+    return error.msg.startswith("Unterminated string") or length - error.pos < _TRUNCATION_MARGIN
+
+
+def iter_jsonl_records(
+    path: PathOrFile,
+    compression: Optional[str] = None,
+    raw: bool = False,
+) -> Iterator[Union[Dict[str, Any], bytes]]:
+    """
+    Yield the records of a JSON Lines file one at a time.
+
+    Args:
+        path: File path, or a binary file object to read from
+        compression: "gzip", "zstd", or None to infer from the suffix
+        raw: Yield each line's JSON text (bytes) instead of parsing it, e.g.
+            to let normalize_batch's workers parse it
+
+    Yields:
+        Decoded records (or raw lines), skipping blank lines
+
+    Raises:
+        ValueError: If a line is not valid JSON, with its line number
+    """
+    f = open_compressed(path, "rb", compression)
+    try:
+        for number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            if raw:
+                yield line
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON on line {number}: {e}") from e
+    finally:
+        if f is not path:
+            f.close()
+
+
+def _is_jsonl(path: PathOrFile, compression: Optional[str]) -> bool:
+    if isinstance(path, (str, Path)):
+        suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+        if any(suffix in JSONL_SUFFIXES for suffix in suffixes):
+            return True
+        if ".json" in suffixes:
+            return False
+        with open_compressed(path, "rb", compression) as f:
+            head = f.read(4096)
+    elif hasattr(path, "peek"):
+        head = path.peek(4096)
+    elif path.seekable():
+        start = path.tell()
+        head = path.read(4096)
+        path.seek(start)
+    else:
+        head = b""
+    return head.lstrip()[:1] == b"{"
+
+
+def iter_records(
+    path: PathOrFile,
+    compression: Optional[str] = None,
+    raw: bool = False,
+) -> Iterator[Union[Dict[str, Any], bytes]]:
+    """
+    Yield the raw records of a scraper output file, a JSON array or JSON Lines.
+
+    Files ending in .jsonl or .ndjson (before any compression suffix) are
+    read as JSON Lines and files ending in .json as a JSON array; otherwise
+    the format is detected from the first character (file objects are
+    peeked at, or read and rewound if seekable; others are read as a JSON
+    array).
+
+    Args:
+        path: File path, or a binary file object to read from
+        compression: "gzip", "zstd", or None to infer from the suffix
+        raw: For JSON Lines, yield each line's JSON text instead of parsing it
+            (JSON array elements are always parsed)
+    """
+    if _is_jsonl(path, compression):
+        return iter_jsonl_records(path, compression, raw)
+    return iter_json_array(path, compression)
+
+
+def stream_normalize(
+    path: PathOrFile,
+    source: str,
+    workers: Optional[int] = 1,
+    chunk_size: int = 1000,
+    compression: Optional[str] = None,
+) -> Iterator[BatchResult]:
+    """
+    Normalize a scraper output file chunk by chunk.
+
+    Records are read lazily and normalized in chunks, across a process pool
+    when workers > 1. JSON Lines records are parsed along with normalizing
+    (in the workers, if any), so a malformed line is reported like any other
+    failed record rather than raised.
+
+    Example:
+        for result in stream_normalize("results/search.json", "realestate.com.au"):
+            store.save_listings(result.listings)
+
+    Args:
+        path: File path, or a binary file object to read from
+        source: Data source ("realestate.com.au" or "domain.com.au")
+        workers: Number of worker processes (None for the CPU count); 0 or 1
+            normalizes in the calling process
+        chunk_size: Records per chunk
+        compression: "gzip", "zstd", or None to infer from the suffix
+
+    Yields:
+        BatchResult per chunk, in file order; RecordError.index is the
+        record's position in the file
+
+    Raises:
+        ValueError: If the source is unknown, or a JSON array file is malformed
+    """
+    records = iter_records(path, compression, raw=True)
+    return iter_normalized_chunks(records, source, workers, chunk_size)
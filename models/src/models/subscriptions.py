@@ -0,0 +1,364 @@
+"""
+Asynchronous publish/subscribe for timeline events.
+
+This module lets consumers such as alerting and re-scoring react to new
+events as they are added, instead of polling an EventTimeline. Each
+subscriber receives matching events through its own bounded asyncio queue.
+Subscriptions with the default "block" policy never lose events: publishers
+wait for queue space. Dropping on overflow is an explicit per-subscription
+policy.
+"""
+
+import asyncio
+import concurrent.futures
+from collections import deque
+from typing import Optional, Awaitable, Callable, Deque, Iterable, List, Set
+
+from .enums import EventType
+from .events import Event, EventTimeline
+
+# Overflow policies for a full subscriber queue: wait for space, or drop an event
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+_CLOSED = object()
+
+
+class EventSubscription:
+    """
+    A filtered stream of events delivered through a bounded queue.
+
+    Iterate with ``async for`` to receive events; iteration ends once the
+    subscription is closed and its queue has been drained. Closing also
+    releases publishers waiting for space in the queue.
+    """
+
+    def __init__(
+        self,
+        broker: "EventBroker",
+        event_types: Optional[Set[EventType]],
+        listing_ids: Optional[Set[str]],
+        maxsize: int,
+        overflow: str,
+    ):
+        self._broker = broker
+        self.event_types = event_types
+        self.listing_ids = listing_ids
+        self.overflow = overflow
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._closed = asyncio.Event()
+        # Events for a full "block" queue from synchronous writers on the
+        # loop, moved into the queue in order by the _drain task
+        self._backlog: Deque[Event] = deque()
+        self._backlog_empty = asyncio.Event()
+        self._backlog_empty.set()
+        self._drainer: Optional[asyncio.Task] = None
+
+    def matches(self, event: Event) -> bool:
+        """Check whether an event passes this subscription's filters."""
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return False
+        if self.listing_ids is not None and event.listing_id not in self.listing_ids:
+            return False
+        return True
+
+    async def _until_closed(self, awaitable: Awaitable) -> None:
+        """Await `awaitable`, abandoning it if the subscription is closed first."""
+        task = asyncio.ensure_future(awaitable)
+        closed = asyncio.ensure_future(self._closed.wait())
+        try:
+            await asyncio.wait((task, closed), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            task.cancel()
+            closed.cancel()
+
+    async def _put(self, event: Event) -> None:
+        """Enqueue, waiting for space; returns without delivering if the subscription closes."""
+        # Stay behind events that writers on the loop left in the backlog
+        while self._backlog and not self.closed:
+            await self._until_closed(self._backlog_empty.wait())
+        if self.closed:
+            return
+        if self._queue.full():
+            await self._until_closed(self._queue.put(event))
+        else:
+            self._queue.put_nowait(event)
+
+    def _put_later(self, event: Event) -> None:
+        """
+        Enqueue from synchronous code on the loop, which cannot wait.
+
+        A full "block" subscription keeps the event in its backlog and moves
+        it into the queue once there is space; drop policies apply at once.
+        """
+        if self.closed:
+            return
+        if self.overflow != BLOCK or (not self._backlog and not self._queue.full()):
+            self._put_nowait(event)
+            return
+        self._backlog.append(event)
+        self._backlog_empty.clear()
+        if self._drainer is None:
+            self._drainer = asyncio.ensure_future(self._drain())
+
+    async def _drain(self) -> None:
+        try:
+            while self._backlog and not self.closed:
+                await self._until_closed(self._queue.put(self._backlog[0]))
+                if not self.closed:
+                    self._backlog.popleft()
+        finally:
+            self._backlog.clear()
+            self._backlog_empty.set()
+            self._drainer = None
+
+    def _put_nowait(self, event: Event) -> None:
+        """
+        Enqueue without waiting, applying the overflow policy when full.
+
+        Raises:
+            asyncio.QueueFull: If the queue of a "block" subscription is full
+        """
+        if self._queue.full() or self._backlog:
+            if self.overflow == BLOCK:
+                raise asyncio.QueueFull
+            if self.overflow == DROP_OLDEST:
+                self._queue.get_nowait()
+            self.dropped += 1
+            self._broker.dropped += 1
+            if self.overflow == DROP_NEWEST:
+                return
+        self._queue.put_nowait(event)
+
+    async def get(self) -> Event:
+        """
+        Wait for the next event.
+
+        Raises:
+            StopAsyncIteration: If the subscription has been closed and drained
+        """
+        if self.closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is _CLOSED:
+            raise StopAsyncIteration
+        return event
+
+    def qsize(self) -> int:
+        """
+        Return the number of events waiting to be consumed.
+
+        Includes events held back for a full "block" queue (see
+        EventBroker.attach), so it can exceed maxsize.
+        """
+        return self._queue.qsize() + len(self._backlog)
+
+    def close(self) -> None:
+        """
+        Stop receiving events; already queued events can still be consumed.
+
+        Publishers waiting for space in this subscription's queue return
+        without delivering to it.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self._closed.set()
+        self._broker._unsubscribe(self)
+        # Wake a consumer waiting on an empty queue; a non-empty queue is
+        # drained first and then ends iteration through the closed flag
+        if not self._queue.full():
+            self._queue.put_nowait(_CLOSED)
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> Event:
+        return await self.get()
+
+    def __repr__(self) -> str:
+        return f"EventSubscription(queued={self.qsize()}, dropped={self.dropped}, closed={self.closed})"
+
+
+class EventBroker:
+    """
+    Fans out events to filtered, bounded subscriptions.
+
+    Subscriptions with the "block" policy apply backpressure: async producers
+    wait in ``await publish(event)`` and producers on other threads in
+    publish_threadsafe while such a subscriber's queue is full. "drop_oldest"
+    and "drop_newest" subscriptions never hold up a producer; the events they
+    drop are counted in their ``dropped`` attribute and the broker's.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Initialize a broker.
+
+        Args:
+            loop: Event loop that subscribers run on (defaults to the running
+                loop when the first subscription is made)
+        """
+        self._loop = loop
+        self._subscriptions: List[EventSubscription] = []
+        self.dropped = 0
+
+    def subscribe(
+        self,
+        event_types: Optional[Iterable[EventType]] = None,
+        listing_ids: Optional[Iterable[str]] = None,
+        maxsize: int = 1000,
+        overflow: str = BLOCK,
+    ) -> EventSubscription:
+        """
+        Subscribe to events, optionally filtered by type and/or listing.
+
+        Must be called from the event loop the subscriber consumes on.
+
+        Args:
+            event_types: Only deliver events of these types (None for all)
+            listing_ids: Only deliver events for these listings (None for all)
+            maxsize: Maximum number of undelivered events held for the subscriber
+            overflow: What happens when the queue is full: "block" makes
+                publishers wait for space, "drop_oldest" drops the oldest
+                queued event and "drop_newest" drops the incoming event
+
+        Returns:
+            EventSubscription to iterate over
+        """
+        if overflow not in (BLOCK, DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+        subscription = EventSubscription(
+            self,
+            set(event_types) if event_types is not None else None,
+            set(listing_ids) if listing_ids is not None else None,
+            maxsize,
+            overflow,
+        )
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: EventSubscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    async def publish(self, event: Event) -> None:
+        """
+        Deliver an event to every matching subscription.
+
+        Waits for queue space on "block" subscriptions, so a slow consumer
+        slows the publisher down rather than losing events. A subscription
+        closed while the publisher waits is skipped.
+        """
+        for subscription in list(self._subscriptions):
+            if not subscription.matches(event):
+                continue
+            if subscription.overflow == BLOCK:
+                await subscription._put(event)
+            else:
+                subscription._put_nowait(event)
+
+    def publish_threadsafe(self, event: Event, timeout: Optional[float] = None) -> None:
+        """
+        Deliver an event from a thread other than the broker's event loop.
+
+        Blocks the calling thread while a matching "block" subscription has a
+        full queue, so slow consumers slow the producer down.
+
+        Args:
+            event: Event to deliver
+            timeout: Seconds to wait at most (None waits indefinitely)
+
+        Raises:
+            TimeoutError: If the event was not delivered within `timeout`
+            RuntimeError: If called from the broker's event loop
+        """
+        if self._loop is None:
+            return
+        if self._in_loop():
+            raise RuntimeError("publish_threadsafe would block the event loop; use publish or publish_nowait")
+        future = asyncio.run_coroutine_threadsafe(self.publish(event), self._loop)
+        try:
+            future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError("Timed out waiting for subscriber queue space") from None
+
+    def publish_nowait(self, event: Event) -> None:
+        """
+        Deliver an event without waiting, from the broker's event loop.
+
+        "drop_oldest" and "drop_newest" subscriptions apply their policy when
+        full. Every other matching subscription still receives the event
+        before a full "block" subscription is reported.
+
+        Raises:
+            asyncio.QueueFull: If a matching "block" subscription's queue is full
+            RuntimeError: If called from another thread (use publish_threadsafe)
+        """
+        if self._loop is None:
+            return
+        if not self._in_loop():
+            raise RuntimeError("publish_nowait must be called from the broker's event loop; use publish_threadsafe")
+
+        full = None
+        for subscription in list(self._subscriptions):
+            if subscription.matches(event):
+                try:
+                    subscription._put_nowait(event)
+                except asyncio.QueueFull as e:
+                    full = e
+        if full is not None:
+            raise full
+
+    def _in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _publish_from_timeline(self, event: Event) -> None:
+        if self._loop is None:
+            return
+        if self._in_loop():
+            for subscription in list(self._subscriptions):
+                if subscription.matches(event):
+                    subscription._put_later(event)
+        else:
+            self.publish_threadsafe(event)
+
+    def attach(self, timeline: EventTimeline) -> Callable[[], None]:
+        """
+        Publish every event added to a timeline.
+
+        Writers on other threads wait in add_event/add_events while a "block"
+        subscriber's queue is full. A writer on the broker's event loop cannot
+        wait without blocking the consumers, so a full "block" subscriber
+        keeps the events in an unbounded backlog that is moved into its queue,
+        in order, as the consumer catches up. Either way a slow subscriber
+        never stops delivery to the others or makes add_event/add_events
+        raise.
+
+        Args:
+            timeline: Timeline to listen to
+
+        Returns:
+            Function that detaches the broker from the timeline
+        """
+        timeline.add_listener(self._publish_from_timeline)
+        return lambda: timeline.remove_listener(self._publish_from_timeline)
+
+    def close(self) -> None:
+        """Close every subscription."""
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+    def __len__(self) -> int:
+        """Return the number of active subscriptions."""
+        return len(self._subscriptions)
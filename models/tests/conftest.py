@@ -0,0 +1,15 @@
+"""
+Fixtures shared by the test modules.
+"""
+
+import json
+import pytest
+
+from helpers import SEARCH_JSON
+
+
+@pytest.fixture
+def raw_records():
+    """Raw scraper records from the sample search results."""
+    with open(SEARCH_JSON) as f:
+        return json.load(f)
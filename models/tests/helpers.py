@@ -0,0 +1,13 @@
+"""
+Helpers shared by the test modules.
+"""
+
+from pathlib import Path
+
+# Raw realestate.com.au search results captured from the scraper
+SEARCH_JSON = Path(__file__).resolve().parents[2] / "testdata" / "search.json"
+
+
+def event_summary(events):
+    """Return comparable (type, listing ID, timestamp, metadata) tuples for events."""
+    return [(e.event_type, e.listing_id, e.timestamp, e.metadata) for e in events]
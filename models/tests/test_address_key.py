@@ -0,0 +1,130 @@
+"""
+Tests for canonical address keys and the address index.
+"""
+
+import pytest
+
+from models import (
+    Address,
+    AddressIndex,
+    Listing,
+    PropertyType,
+    address_key,
+    normalize_domain_data,
+    normalize_realestate_data,
+    record_address_key,
+)
+from models.address_key import canonical_key, split_street_address
+
+
+def _domain_record(**overrides):
+    data = {
+        "listingId": 1,
+        "unitNumber": "1",
+        "streetNumber": "360",
+        "street": "Dorset Rd",
+        "suburb": "BORONIA",
+        "state": "VIC",
+        "postcode": "3155",
+        "propertyType": "Townhouse",
+    }
+    data.update(overrides)
+    return data
+
+
+def _realestate_record(full_address="1/360 Dorset Road, Boronia, Vic 3155", **overrides):
+    data = {
+        "id": "rea-1",
+        "address": {"suburb": "Boronia", "state": "vic", "postcode": "3155", "display": {"fullAddress": full_address}},
+        "propertyType": "Townhouse",
+    }
+    data.update(overrides)
+    return data
+
+
+def test_split_street_address():
+    """Test splitting unit, number and street from an address line."""
+    assert split_street_address("1/360 Dorset Road, Boronia, Vic 3155") == ("1", "360", "Dorset Road")
+    assert split_street_address("Unit 4 / 12A Smith St") == ("Unit 4", "12A", "Smith St")
+    assert split_street_address("31 Aberdeen Drive") == (None, "31", "Aberdeen Drive")
+    assert split_street_address("Dorset Road, Boronia") is None
+    assert split_street_address(None) is None
+
+
+def test_canonical_key_normalizes_formatting():
+    """Test that case, spacing, unit prefixes and street types are normalized."""
+    key = canonical_key("1", "360", "Dorset Road", "Boronia", "3155")
+    assert key == "1|360|dorset rd|boronia|3155"
+    assert canonical_key("Unit 1", " 360 ", "DORSET  RD.", "BORONIA", "3155") == key
+    assert canonical_key(None, "12", "St Kilda Road", "Melbourne", "3004") == "|12|st kilda rd|melbourne|3004"
+    assert canonical_key(None, "1", "Beach Road North", "Brighton", "3186") == "|1|beach rd n|brighton|3186"
+    assert canonical_key(None, None, "Dorset Road", "Boronia", "3155") is None
+
+
+def test_keys_match_across_sources():
+    """Test that the same property gives the same key from both sources."""
+    realestate = normalize_realestate_data(_realestate_record())
+    domain = normalize_domain_data(_domain_record())
+    assert address_key(realestate.address) == address_key(domain.address) == "1|360|dorset rd|boronia|3155"
+    assert record_address_key(_realestate_record(), "realestate.com.au") == address_key(realestate.address)
+    assert record_address_key(_domain_record(), "domain.com.au") == address_key(domain.address)
+
+    # Domain search results put unit and number into the street field
+    combined = _domain_record(unitNumber=None, streetNumber=None, street="1/360 Dorset Road")
+    assert record_address_key(combined, "domain.com.au") == address_key(domain.address)
+
+    with pytest.raises(ValueError):
+        record_address_key({}, "unknown.example")
+
+
+def test_address_without_street_has_no_key():
+    """Test that withheld addresses are not keyed."""
+    assert address_key(Address(suburb="Boronia", state="Vic", postcode="3155")) is None
+
+
+def test_address_index_match():
+    """Test indexing, matching and replacing listings."""
+    realestate = normalize_realestate_data(_realestate_record())
+    domain = normalize_domain_data(_domain_record())
+    withheld = Listing(
+        listing_id="rea-2",
+        address=Address(suburb="Boronia", state="Vic", postcode="3155"),
+        suburb="Boronia",
+        property_type=PropertyType.HOUSE,
+    )
+
+    index = AddressIndex([realestate, withheld])
+    assert len(index) == 1
+    assert "1|360|dorset rd|boronia|3155" in index
+    assert index.match_record(_domain_record(), "domain.com.au") == [realestate]
+    assert index.match(domain) == [realestate]
+    assert index.match(realestate) == []
+    assert index.match(withheld) == []
+
+    index.add(domain)
+    assert len(index) == 2
+    assert index.match(realestate) == [domain]
+
+    # Re-adding a listing with a new address moves it
+    moved = normalize_realestate_data(_realestate_record("2/360 Dorset Road, Boronia, Vic 3155"))
+    index.add(moved)
+    assert len(index) == 2
+    assert index.match(domain) == []
+    assert index.find(moved.address) == [moved]
+
+    index.discard(domain)
+    index.discard(domain)
+    assert len(index) == 1
+    assert "1|360|dorset rd|boronia|3155" not in index
+
+
+def test_address_index_sample_data(raw_records):
+    """Test indexing real scraper records."""
+    listings = [normalize_realestate_data(data) for data in raw_records]
+
+    index = AddressIndex(listings)
+    keyed = [listing for listing in listings if address_key(listing.address) is not None]
+    assert len(index) == len(keyed) > 0
+    for data, listing in zip(raw_records, listings, strict=True):
+        if record_address_key(data, "realestate.com.au") is not None:
+            assert listing in index.match_record(data, "realestate.com.au")
@@ -0,0 +1,72 @@
+"""
+Tests for the columnar event timeline.
+"""
+
+from datetime import datetime, timezone
+
+from models import ColumnarEventTimeline, EventTimeline, EventType
+from helpers import event_summary
+
+
+def _load(timeline):
+    timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, 5), metadata={"drop_percent": 6.25})
+    timeline.add_event(EventType.AUCTION_CANCELLED, "listing1", timestamp=datetime(2024, 12, 1))
+    timeline.add_event(EventType.PRICE_DROPPED, "listing2", timestamp=datetime(2024, 12, 5))
+    timeline.add_events(
+        [
+            (EventType.AUCTION_RESCHEDULED, "listing2", datetime(2024, 12, 3), {"notes": None}),
+            (EventType.PRICE_DROPPED, "listing1", datetime(2024, 11, 20)),
+            (EventType.AUCTION_VOIDED, "listing3", datetime(2024, 12, 9)),
+        ]
+    )
+    return timeline
+
+
+def test_columnar_matches_event_timeline():
+    """Test that every query returns the same events as EventTimeline."""
+    expected = _load(EventTimeline())
+    columnar = _load(ColumnarEventTimeline())
+
+    assert len(columnar) == len(expected) == 6
+    assert event_summary(columnar.get_all_events()) == event_summary(expected.get_all_events())
+    assert event_summary(columnar.get_all_events(EventType.PRICE_DROPPED, limit=2)) == event_summary(
+        expected.get_all_events(EventType.PRICE_DROPPED, limit=2)
+    )
+    for listing_id in ["listing1", "listing2", "listing3", "missing"]:
+        assert event_summary(columnar.get_events_for_listing(listing_id)) == event_summary(
+            expected.get_events_for_listing(listing_id)
+        )
+        for event_type in EventType:
+            assert columnar.count_events(listing_id, event_type) == expected.count_events(listing_id, event_type)
+            assert columnar.has_event_type(listing_id, event_type) == expected.has_event_type(listing_id, event_type)
+
+    window = (datetime(2024, 12, 1), datetime(2024, 12, 5))
+    assert event_summary(columnar.get_events_between(*window)) == event_summary(expected.get_events_between(*window))
+    assert event_summary(columnar.get_events_between(*window, listing_id="listing1", event_type=EventType.PRICE_DROPPED)) == [
+        (EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, 5), {"drop_percent": 6.25})
+    ]
+    assert columnar.get_latest_event("listing2").event_type == EventType.PRICE_DROPPED
+
+
+def test_columnar_keeps_timezone_awareness():
+    """Test that aware timestamps round-trip as UTC and naive ones stay naive."""
+    timeline = ColumnarEventTimeline()
+    aware = datetime(2024, 12, 1, 10, 0, tzinfo=timezone.utc)
+    timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=aware)
+    timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, 2))
+
+    events = timeline.get_events_for_listing("listing1")
+    assert events[0].timestamp == datetime(2024, 12, 2)
+    assert events[1].timestamp == aware
+
+
+def test_columnar_memory_usage():
+    """Test that bytes per event is reported and stays compact."""
+    timeline = ColumnarEventTimeline()
+    assert timeline.bytes_per_event() == 0.0
+
+    timeline.add_events((EventType.AUCTION_CANCELLED, f"listing{i % 10}", datetime(2024, 12, 1)) for i in range(1000))
+
+    assert 0 < timeline.bytes_per_event() < 64
+    timeline.clear()
+    assert len(timeline) == 0
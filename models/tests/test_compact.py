@@ -0,0 +1,79 @@
+"""
+Tests for compact, slotted listing records.
+"""
+
+import pickle
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from models import Address, Listing, ListingRecord, ListingStatus, PropertyType
+
+
+def _listing(listing_id="123", suburb="Dandenong North"):
+    return Listing(
+        listing_id=listing_id,
+        address=Address(
+            suburb=suburb,
+            state="Vic",
+            postcode="3175",
+            full_address=f"31 Aberdeen Drive, {suburb}, Vic 3175",
+        ),
+        suburb=suburb,
+        property_type=PropertyType.TOWNHOUSE,
+        bedrooms=3,
+        bathrooms=2,
+        land_size=Decimal("754.69"),
+        status=ListingStatus.SCHEDULED,
+        current_price=Decimal("750000"),
+        previous_price=Decimal("799999.99"),
+        auction_datetime=datetime(2024, 12, 20, 10),
+        description="A long description that the compact record leaves out.",
+        source="realestate.com.au",
+    )
+
+
+def test_record_round_trips_with_listing():
+    """Test converting a Listing to a record and back."""
+    listing = _listing()
+    record = ListingRecord.from_listing(listing)
+
+    assert record.current_price_cents == 75_000_000
+    assert record.previous_price_cents == 79_999_999
+    assert record.property_type == PropertyType.TOWNHOUSE
+    assert record.status == ListingStatus.SCHEDULED
+    assert record.current_price == Decimal("750000")
+
+    restored = record.to_listing()
+    assert restored.listing_id == listing.listing_id
+    assert restored.address.full_address == listing.address.full_address
+    assert restored.property_type == listing.property_type
+    assert restored.status == listing.status
+    assert restored.current_price == listing.current_price
+    assert restored.previous_price == listing.previous_price
+    assert restored.land_size == listing.land_size
+    assert restored.auction_datetime == listing.auction_datetime
+    assert restored.description is None
+    assert restored.price_history == []
+    assert ListingRecord.from_listing(restored) == record
+
+
+def test_record_is_read_only_and_shares_strings():
+    """Test that records cannot be modified and intern their area strings."""
+    first, second = ListingRecord.from_listings(
+        [_listing("1", "Dandenong " + "North"), _listing("2", "Dandenong North")]
+    )
+
+    with pytest.raises(AttributeError):
+        first.current_price_cents = 1
+    with pytest.raises(AttributeError):
+        first.extra = 1
+    assert not hasattr(first, "__dict__")
+    assert first.suburb is second.suburb
+    assert first.source is second.source
+
+
+def test_record_pickles():
+    """Test that records survive pickling."""
+    record = ListingRecord.from_listing(_listing())
+    assert pickle.loads(pickle.dumps(record)) == record
@@ -0,0 +1,96 @@
+"""
+Tests for the thread-safe, lock-striped event timeline.
+"""
+
+import threading
+from datetime import datetime, timedelta
+
+from models import ConcurrentEventTimeline, EventTimeline, EventType
+from models.concurrent_timeline import shard_for
+from helpers import event_summary
+
+
+def test_concurrent_timeline_matches_event_timeline():
+    """Test that merged stripe queries match a single EventTimeline."""
+    events = [
+        (EventType.PRICE_DROPPED if i % 3 else EventType.AUCTION_CANCELLED, f"listing{i % 7}", datetime(2024, 12, 1 + i % 20))
+        for i in range(100)
+    ]
+    expected = EventTimeline()
+    timeline = ConcurrentEventTimeline(stripes=4)
+    for event in events:
+        expected.add_event(*event)
+        timeline.add_event(*event)
+
+    assert len(timeline) == 100
+    assert event_summary(timeline.get_all_events()) == event_summary(expected.get_all_events())
+    assert event_summary(timeline.get_all_events(EventType.AUCTION_CANCELLED, limit=5)) == event_summary(
+        expected.get_all_events(EventType.AUCTION_CANCELLED, limit=5)
+    )
+    window = (datetime(2024, 12, 5), datetime(2024, 12, 9))
+    assert event_summary(timeline.get_events_between(*window)) == event_summary(expected.get_events_between(*window))
+    assert event_summary(timeline.get_events_for_listing("listing3")) == event_summary(expected.get_events_for_listing("listing3"))
+    assert timeline.count_events(event_type=EventType.PRICE_DROPPED) == expected.count_events(
+        event_type=EventType.PRICE_DROPPED
+    )
+    assert timeline.count_events("listing3", EventType.AUCTION_CANCELLED) == expected.count_events(
+        "listing3", EventType.AUCTION_CANCELLED
+    )
+    assert timeline.has_event_type("listing3", EventType.PRICE_DROPPED) is True
+    assert timeline.get_latest_event("listing3") == expected.get_latest_event("listing3")
+
+    timeline.clear()
+    assert len(timeline) == 0
+
+
+def test_concurrent_writers_lose_no_events():
+    """Test that many threads writing at once lose and misorder nothing."""
+    timeline = ConcurrentEventTimeline(stripes=8)
+    start = datetime(2024, 1, 1)
+    threads_count = 8
+    per_thread = 500
+
+    def writer(thread_id):
+        for i in range(per_thread):
+            listing_id = f"listing{(thread_id * per_thread + i) % 37}"
+            if i % 50 == 0:
+                timeline.add_events(
+                    [(EventType.AUCTION_VOIDED, listing_id, start + timedelta(minutes=i * threads_count + thread_id))]
+                )
+            else:
+                timeline.add_event(EventType.PRICE_DROPPED, listing_id, start + timedelta(minutes=i * threads_count + thread_id))
+
+    threads = [threading.Thread(target=writer, args=(t,)) for t in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    events = timeline.get_all_events()
+    assert len(events) == threads_count * per_thread
+    timestamps = [e.timestamp for e in events]
+    assert timestamps == sorted(timestamps, reverse=True)
+    assert len(set(timestamps)) == len(timestamps)
+    assert sum(timeline.count_events(f"listing{i}") for i in range(37)) == len(events)
+
+
+def test_batch_ties_keep_batch_order_across_stripes():
+    """Test that same-timestamp events in different stripes keep their batch order."""
+    stripes = 16
+    by_stripe = {}
+    for i in range(100):
+        by_stripe.setdefault(shard_for(f"listing{i}", stripes), []).append(f"listing{i}")
+    first, second = next(listing_ids for listing_ids in by_stripe.values() if len(listing_ids) >= 2)[:2]
+    other = next(listing_ids[0] for listing_ids in by_stripe.values() if first not in listing_ids)
+
+    # The middle event lands in another stripe than the two around it
+    timestamp = datetime(2024, 12, 1)
+    batch = [(EventType.PRICE_DROPPED, listing_id, timestamp) for listing_id in (first, other, second)]
+    expected = EventTimeline()
+    expected.add_events(batch)
+    timeline = ConcurrentEventTimeline(stripes=stripes)
+    timeline.add_events(batch)
+
+    assert [e.listing_id for e in expected.get_all_events()] == [first, other, second]
+    assert [e.listing_id for e in timeline.get_all_events()] == [first, other, second]
+    assert [e.listing_id for e in timeline.get_events_between(timestamp, timestamp)] == [first, other, second]
@@ -0,0 +1,117 @@
+"""
+Tests for listing diffs and change application.
+"""
+
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from models import (
+    Address,
+    EventTimeline,
+    EventType,
+    Listing,
+    ListingStatus,
+    PropertyType,
+    apply_changes,
+    diff_listings,
+    diff_record,
+    fingerprint_listing,
+    fingerprint_record,
+    normalize_realestate_data,
+)
+
+
+def _listing(**overrides):
+    fields = {
+        "listing_id": "123",
+        "address": Address(suburb="Test", state="Vic", postcode="3000"),
+        "suburb": "Test",
+        "property_type": PropertyType.HOUSE,
+        "bedrooms": 3,
+        "status": ListingStatus.SCHEDULED,
+        "current_price": Decimal("800000"),
+        "auction_datetime": datetime(2024, 12, 20, 10),
+    }
+    fields.update(overrides)
+    return Listing(**fields)
+
+
+def test_diff_reports_changed_fields():
+    """Test that only fields that differ are reported."""
+    old = _listing()
+    new = _listing(bedrooms=4, current_price=Decimal("750000"))
+
+    changes = diff_listings(old, new)
+    assert len(changes) == 2
+    assert changes.price.old == Decimal("800000")
+    assert changes.price.new == Decimal("750000")
+    assert changes.get("bedrooms").new == 4
+    assert changes.status is None
+    assert not diff_listings(old, _listing())
+
+
+def test_diff_ignores_fields_missing_from_new_snapshot():
+    """Test that omitted fields and an UNKNOWN status are not changes."""
+    old = _listing()
+    new = _listing(bedrooms=None, current_price=None, status=ListingStatus.UNKNOWN)
+    assert not diff_listings(old, new)
+
+
+def test_diff_short_circuits_on_fingerprint():
+    """Test that equal fingerprints skip the field comparison."""
+    old = _listing()
+    new = _listing(bedrooms=4)
+    fingerprint = fingerprint_listing(old)
+    assert not diff_listings(old, new, fingerprint, fingerprint)
+    assert diff_listings(old, new, fingerprint, fingerprint_listing(new))
+
+
+def test_diff_record_against_raw_data(raw_records):
+    """Test diffing a stored listing against rescraped raw data."""
+    data = raw_records[0]
+    stored = normalize_realestate_data(data)
+    stored_fingerprint = fingerprint_record(data, "realestate.com.au")
+
+    assert not diff_record(stored, data, "realestate.com.au", stored_fingerprint)
+
+    changed = dict(data, description="Now with a new kitchen.")
+    changes = diff_record(stored, changed, "realestate.com.au", stored_fingerprint)
+    assert list(changes.changes) == ["description"]
+
+    with pytest.raises(ValueError):
+        diff_record(stored, data, "unknown.example")
+
+
+def test_apply_changes_logs_events():
+    """Test that applied price and auction changes generate events."""
+    timeline = EventTimeline()
+    listing = _listing()
+    new = _listing(current_price=Decimal("750000"), auction_datetime=datetime(2024, 12, 13, 10), bedrooms=4)
+
+    apply_changes(listing, diff_listings(listing, new), datetime(2024, 12, 1), timeline)
+
+    assert listing.current_price == Decimal("750000")
+    assert listing.previous_price == Decimal("800000")
+    assert listing.auction_datetime == datetime(2024, 12, 13, 10)
+    assert listing.bedrooms == 4
+    assert listing.updated_at == datetime(2024, 12, 1)
+    assert timeline.has_event_type("123", EventType.PRICE_DROPPED)
+    assert timeline.has_event_type("123", EventType.AUCTION_RESCHEDULED)
+
+    cancelled = _listing(status=ListingStatus.CANCELLED, auction_datetime=datetime(2024, 12, 13, 10))
+    apply_changes(listing, diff_listings(listing, cancelled), datetime(2024, 12, 2), timeline)
+    assert listing.status == ListingStatus.CANCELLED
+    assert timeline.get_latest_event("123").event_type == EventType.AUCTION_CANCELLED
+    assert len(listing.auction_history) == 2
+
+
+def test_apply_status_change_without_auction():
+    """Test that a status change with no auction date just sets the status."""
+    listing = _listing(auction_datetime=None, status=ListingStatus.ACTIVE)
+    timeline = EventTimeline()
+    apply_changes(listing, diff_listings(listing, _listing(auction_datetime=None, status=ListingStatus.SOLD)), event_timeline=timeline)
+
+    assert listing.status == ListingStatus.SOLD
+    assert listing.auction_history == []
+    assert len(timeline) == 0
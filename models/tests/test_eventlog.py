@@ -0,0 +1,116 @@
+"""
+Tests for the persistent event log.
+"""
+
+import pytest
+from datetime import datetime
+
+from models import EventLog, EventTimeline, EventType, eventlog, load_timeline
+from models.enums import EVENT_TYPE_CODES, EVENT_TYPES
+from helpers import event_summary
+
+
+EVENTS = [
+    (EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, 5), {"old_price": "800000", "new_price": "750000"}),
+    (EventType.AUCTION_CANCELLED, "listing1", datetime(2024, 12, 1)),
+    (EventType.PRICE_DROPPED, "listing2", datetime(2024, 12, 5)),
+    (EventType.AUCTION_RESCHEDULED, "listing2", datetime(2024, 12, 3)),
+]
+
+
+def test_reopen_log_answers_queries(tmp_path):
+    """Test that a reopened log returns the same events as an in-memory timeline."""
+    with EventLog(tmp_path) as log:
+        log.append_events(EVENTS)
+        assert len(log) == 4
+
+    expected = EventTimeline()
+    expected.add_events(EVENTS)
+    timeline = load_timeline(tmp_path)
+
+    assert len(timeline) == 4
+    assert event_summary(timeline.get_all_events()) == event_summary(expected.get_all_events())
+    assert event_summary(timeline.get_events_for_listing("listing1")) == event_summary(expected.get_events_for_listing("listing1"))
+    assert timeline.count_events(event_type=EventType.PRICE_DROPPED) == 2
+    assert event_summary(timeline.get_events_between(datetime(2024, 12, 2), datetime(2024, 12, 4))) == [
+        (EventType.AUCTION_RESCHEDULED, "listing2", datetime(2024, 12, 3), {})
+    ]
+
+    with pytest.raises(TypeError):
+        timeline.add_event(EventType.PRICE_DROPPED, "listing1")
+
+
+def test_checkpoint_and_tail_are_merged(tmp_path):
+    """Test that events appended after a checkpoint are indexed on load."""
+    with EventLog(tmp_path) as log:
+        log.append_events(EVENTS)
+        log.checkpoint()
+
+    with EventLog(tmp_path) as log:
+        log.append_events(
+            [
+                (EventType.AUCTION_VOIDED, "listing3", datetime(2024, 12, 9)),
+                (EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, 2), {"drop_percent": 5.0}),
+            ]
+        )
+
+    timeline = load_timeline(tmp_path)
+    assert len(timeline) == 6
+    assert [e.timestamp.day for e in timeline.get_all_events()] == [9, 5, 5, 3, 2, 1]
+    assert [e.timestamp.day for e in timeline.get_events_for_listing("listing1")] == [5, 2, 1]
+    assert timeline.get_latest_event("listing1", EventType.PRICE_DROPPED).metadata["old_price"] == "800000"
+    assert timeline.get_events_for_listing("listing3")[0].event_type == EventType.AUCTION_VOIDED
+    assert timeline.count_events("listing1", EventType.PRICE_DROPPED) == 2
+    assert timeline.has_event_type("listing3", EventType.AUCTION_VOIDED) is True
+    assert timeline.has_event_type("listing3", EventType.PRICE_DROPPED) is False
+
+
+def test_partial_trailing_record_is_ignored(tmp_path):
+    """Test that a torn write at the end of the log is dropped on reopen."""
+    with EventLog(tmp_path) as log:
+        log.append_events(EVENTS)
+
+    with open(tmp_path / "events.dat", "ab") as f:
+        f.write(b"\x01\x02\x03")
+    with open(tmp_path / "metadata.dat", "ab") as f:
+        f.write(b'{"orphaned"')
+
+    assert len(load_timeline(tmp_path)) == 4
+
+    with EventLog(tmp_path) as log:
+        assert len(log) == 4
+        log.append((EventType.PRICE_DROPPED, "listing2", datetime(2024, 12, 6), {"new_price": "700000"}))
+
+    timeline = load_timeline(tmp_path)
+    assert timeline.get_latest_event("listing2").metadata == {"new_price": "700000"}
+
+
+def test_event_type_codes_are_pinned(tmp_path):
+    """Test that every event type has a distinct code and codes are written to the log."""
+    assert set(EVENT_TYPE_CODES) == set(EventType)
+    assert [EVENT_TYPE_CODES[event_type] for event_type in EVENT_TYPES] == list(range(len(EVENT_TYPES)))
+
+    with EventLog(tmp_path) as log:
+        log.append((EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, 5)))
+    records = (tmp_path / "events.dat").read_bytes()[16:]
+    assert records[12] == EVENT_TYPE_CODES[EventType.PRICE_DROPPED] == 3
+
+
+def test_load_ignores_records_appended_while_loading(tmp_path, monkeypatch):
+    """Test that a record written during load_timeline never points past the listings read."""
+    with EventLog(tmp_path) as log:
+        log.append_events(EVENTS)
+
+    writer = EventLog(tmp_path)
+    read_listing_ids = eventlog._read_listing_ids
+
+    def append_then_read(path):
+        writer.append((EventType.AUCTION_VOIDED, "listing3", datetime(2024, 12, 9)))
+        writer.flush()
+        return read_listing_ids(path)
+
+    monkeypatch.setattr(eventlog, "_read_listing_ids", append_then_read)
+    timeline = load_timeline(tmp_path)
+    writer.close()
+    assert len(timeline) == 4
+    assert [e.listing_id for e in timeline.get_all_events()] == ["listing1", "listing2", "listing2", "listing1"]
@@ -6,6 +6,8 @@ import pytest
 from datetime import datetime
 from decimal import Decimal
 
+from pydantic import ValidationError
+
 from models import (
     EventTimeline,
     EventType,
@@ -14,6 +16,7 @@ from models import (
     PropertyType,
     Address,
 )
+from models.events import validate_events
 
 
 def test_event_creation():
@@ -151,6 +154,9 @@ def test_automatic_price_drop_event():
     assert events[0].event_type == EventType.PRICE_DROPPED
     assert events[0].metadata["old_price"] == "800000"
     assert events[0].metadata["new_price"] == "750000"
+    assert events[0].metadata["old_price_cents"] == 80_000_000
+    assert events[0].metadata["new_price_cents"] == 75_000_000
+    assert events[0].metadata["drop_amount_cents"] == 5_000_000
 
 
 def test_automatic_auction_cancelled_event():
@@ -253,3 +259,177 @@ def test_has_event_type():
     assert timeline.has_event_type("listing1", EventType.AUCTION_VOIDED) is False
     assert timeline.has_event_type("listing2", EventType.PRICE_DROPPED) is False
 
+
+
+def test_out_of_order_events_keep_timeline_sorted():
+    """Test that events added out of order are placed by timestamp."""
+    timeline = EventTimeline()
+
+    for day in [5, 1, 9, 3, 7]:
+        timeline.add_event(
+            EventType.PRICE_DROPPED, f"listing{day % 2}", timestamp=datetime(2024, 12, day)
+        )
+
+    all_events = timeline.get_all_events()
+    assert [e.timestamp.day for e in all_events] == [9, 7, 5, 3, 1]
+
+    listing_events = timeline.get_events_for_listing("listing1")
+    assert [e.timestamp.day for e in listing_events] == [9, 7, 5, 3, 1]
+
+
+def test_events_with_equal_timestamps_keep_insertion_order():
+    """Test that events sharing a timestamp are returned in insertion order."""
+    timeline = EventTimeline()
+    timestamp = datetime(2024, 12, 1)
+
+    first = timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=timestamp)
+    second = timeline.add_event(EventType.AUCTION_CANCELLED, "listing1", timestamp=timestamp)
+    newer = timeline.add_event(EventType.AUCTION_VOIDED, "listing1", timestamp=datetime(2024, 12, 2))
+
+    assert timeline.get_all_events() == [newer, first, second]
+    assert timeline.get_events_for_listing("listing1", limit=2) == [newer, first]
+
+
+def test_add_events_bulk():
+    """Test adding a batch of events in one call."""
+    timeline = EventTimeline()
+    timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, 3))
+
+    counts = timeline.add_events(
+        [
+            (EventType.AUCTION_CANCELLED, "listing1", datetime(2024, 12, 5)),
+            ("price_dropped", "listing2", datetime(2024, 12, 1), {"old_price": "800000"}),
+            {"event_type": EventType.AUCTION_VOIDED, "listing_id": "listing2", "timestamp": datetime(2024, 12, 4)},
+        ]
+    )
+
+    assert counts == {"listing1": 1, "listing2": 2}
+    assert len(timeline) == 4
+    assert [e.timestamp.day for e in timeline.get_all_events()] == [5, 4, 3, 1]
+    assert [e.timestamp.day for e in timeline.get_events_for_listing("listing1")] == [5, 3]
+    assert timeline.get_latest_event("listing2").event_type == EventType.AUCTION_VOIDED
+    assert timeline.get_events_for_listing("listing2")[1].metadata == {"old_price": "800000"}
+
+
+def test_add_events_rejects_invalid_batch():
+    """Test that an invalid event leaves the timeline untouched."""
+    timeline = EventTimeline()
+
+    with pytest.raises(ValueError):
+        timeline.add_events(
+            [
+                (EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, 1)),
+                ("not_an_event_type", "listing1", datetime(2024, 12, 2)),
+            ]
+        )
+
+    assert len(timeline) == 0
+
+
+
+def test_validate_events_rejects_short_tuple():
+    """Test that a malformed tuple raises a ValidationError, not an unpacking error."""
+    with pytest.raises(ValidationError):
+        validate_events([(EventType.PRICE_DROPPED,)])
+
+def test_type_filtered_queries_across_listings():
+    """Test type-filtered queries, counts and existence checks use the type indexes."""
+    timeline = EventTimeline()
+
+    timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, 1))
+    timeline.add_event(EventType.AUCTION_CANCELLED, "listing1", timestamp=datetime(2024, 12, 2))
+    timeline.add_events(
+        [
+            (EventType.PRICE_DROPPED, "listing2", datetime(2024, 12, 3)),
+            (EventType.PRICE_DROPPED, "listing1", datetime(2024, 11, 30)),
+        ]
+    )
+
+    price_drops = timeline.get_all_events(event_type=EventType.PRICE_DROPPED)
+    assert [(e.listing_id, e.timestamp.day) for e in price_drops] == [
+        ("listing2", 3),
+        ("listing1", 1),
+        ("listing1", 30),
+    ]
+    assert timeline.get_all_events(event_type=EventType.PRICE_DROPPED, limit=1)[0].listing_id == "listing2"
+    assert timeline.get_all_events(event_type=EventType.AUCTION_VOIDED) == []
+
+    assert timeline.count_events(event_type=EventType.PRICE_DROPPED) == 3
+    assert timeline.count_events(listing_id="listing1", event_type=EventType.PRICE_DROPPED) == 2
+    assert timeline.count_events(listing_id="missing") == 0
+    assert timeline.has_event_type("listing2", EventType.PRICE_DROPPED) is True
+    assert timeline.has_event_type("listing2", EventType.AUCTION_CANCELLED) is False
+
+    timeline.clear()
+    assert timeline.count_events(event_type=EventType.PRICE_DROPPED) == 0
+    assert timeline.has_event_type("listing1", EventType.PRICE_DROPPED) is False
+
+
+def test_get_events_between():
+    """Test querying events within a time range."""
+    timeline = EventTimeline()
+
+    for day in range(1, 11):
+        event_type = EventType.PRICE_DROPPED if day % 2 else EventType.AUCTION_RESCHEDULED
+        timeline.add_event(event_type, f"listing{day % 3}", timestamp=datetime(2024, 12, day))
+
+    events = timeline.get_events_between(datetime(2024, 12, 3), datetime(2024, 12, 6))
+    assert [e.timestamp.day for e in events] == [6, 5, 4, 3]
+
+    events = timeline.get_events_between(datetime(2024, 12, 3), None, event_type=EventType.PRICE_DROPPED)
+    assert [e.timestamp.day for e in events] == [9, 7, 5, 3]
+
+    events = timeline.get_events_between(None, datetime(2024, 12, 8), listing_id="listing1")
+    assert [e.timestamp.day for e in events] == [7, 4, 1]
+
+    events = timeline.get_events_between(
+        datetime(2024, 12, 1), datetime(2024, 12, 10), listing_id="listing1", event_type=EventType.PRICE_DROPPED
+    )
+    assert [e.timestamp.day for e in events] == [7, 1]
+
+    events = timeline.get_events_between(datetime(2024, 12, 1), datetime(2024, 12, 10), limit=2)
+    assert [e.timestamp.day for e in events] == [10, 9]
+
+    assert timeline.get_events_between(datetime(2024, 12, 6, 1), datetime(2024, 12, 6, 23)) == []
+    assert timeline.get_events_between(datetime(2024, 12, 6), datetime(2024, 12, 6), listing_id="missing") == []
+
+
+def test_events_page_cursor_resumes():
+    """Test paging through events with an opaque cursor."""
+    timeline = EventTimeline()
+    timestamp = datetime(2024, 12, 1)
+    for i in range(5):
+        timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=timestamp, metadata={"i": i})
+    timeline.add_event(EventType.AUCTION_CANCELLED, "listing2", timestamp=datetime(2024, 12, 2))
+
+    page = timeline.get_events_page(page_size=4)
+    assert [e.listing_id for e in page.events] == ["listing2", "listing1", "listing1", "listing1"]
+    assert [e.metadata["i"] for e in page.events[1:]] == [0, 1, 2]
+
+    # Events added after the first page do not shift the next one
+    timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, 3))
+
+    page = timeline.get_events_page(cursor=page.next_cursor, page_size=4)
+    assert [e.metadata["i"] for e in page.events] == [3, 4]
+    assert page.next_cursor is None
+
+    page = timeline.get_events_page(listing_id="listing1", event_type=EventType.PRICE_DROPPED, page_size=6)
+    assert len(page.events) == 6
+    assert page.next_cursor is None
+
+    with pytest.raises(ValueError):
+        timeline.get_events_page(cursor="not-a-cursor")
+
+
+def test_iter_events_walks_all_events():
+    """Test iterating over all events page by page."""
+    timeline = EventTimeline()
+    timeline.add_events((EventType.PRICE_DROPPED, f"listing{i % 3}", datetime(2024, 1, 1 + i % 28)) for i in range(50))
+
+    assert list(timeline.iter_events(page_size=7)) == timeline.get_all_events()
+    assert list(timeline.iter_events(listing_id="listing1", page_size=4)) == timeline.get_events_for_listing("listing1")
+
+    pages = list(timeline.iter_pages(page_size=20))
+    assert [len(p.events) for p in pages] == [20, 20, 10]
+    resumed = list(timeline.iter_events(cursor=pages[0].next_cursor, page_size=20))
+    assert resumed == timeline.get_all_events()[20:]
@@ -0,0 +1,80 @@
+"""
+Tests for content fingerprints and skip-unchanged ingestion.
+"""
+
+import copy
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from models import (
+    FingerprintIndex,
+    fingerprint_listing,
+    fingerprint_record,
+    normalize_domain_data,
+    normalize_realestate_data,
+)
+
+
+def test_record_fingerprint_ignores_volatile_fields(raw_records):
+    """Test that image and agent changes keep the fingerprint, content changes do not."""
+    data = raw_records[0]
+    original = fingerprint_record(data, "realestate.com.au")
+
+    volatile = copy.deepcopy(data)
+    volatile["images"] = ["https://example.com/new.jpg"]
+    volatile["listers"] = []
+    assert fingerprint_record(volatile, "realestate.com.au") == original
+
+    changed = copy.deepcopy(data)
+    changed["generalFeatures"]["bedrooms"]["value"] += 1
+    assert fingerprint_record(changed, "realestate.com.au") != original
+
+    with pytest.raises(ValueError):
+        fingerprint_record(data, "unknown.example")
+
+
+def test_domain_record_fingerprint():
+    """Test fingerprints of domain.com.au records."""
+    data = {"listingId": 1, "suburb": "Test", "state": "Vic", "postcode": "3000", "beds": 3, "gallery": ["a.jpg"]}
+    original = fingerprint_record(data, "domain.com.au")
+
+    assert fingerprint_record({**data, "gallery": ["b.jpg"]}, "domain.com.au") == original
+    assert fingerprint_record({**data, "beds": 4}, "domain.com.au") != original
+    assert normalize_domain_data(data).bedrooms == 3
+
+
+def test_listing_fingerprint(raw_records):
+    """Test that the listing fingerprint covers content but not history."""
+    listing = normalize_realestate_data(raw_records[0])
+    original = fingerprint_listing(listing)
+    assert fingerprint_listing(normalize_realestate_data(raw_records[0])) == original
+
+    listing.current_price = Decimal("750000")
+    priced = fingerprint_listing(listing)
+    assert priced != original
+
+    listing.current_price = Decimal("750000.00")
+    listing.updated_at = datetime(2024, 12, 1)
+    listing.price_history = []
+    assert fingerprint_listing(listing) == priced
+
+
+def test_index_skips_unchanged_records(raw_records):
+    """Test that re-ingesting a scrape only yields new or changed records."""
+    index = FingerprintIndex()
+    assert len(list(index.skip_unchanged(raw_records, "realestate.com.au"))) == len(raw_records)
+    assert len(index) == len(raw_records)
+
+    rescrape = copy.deepcopy(raw_records)
+    for data in rescrape:
+        data["images"] = []
+    rescrape[3]["description"] = "Updated description"
+    changed = list(index.skip_unchanged(rescrape, "realestate.com.au"))
+    assert changed == [rescrape[3]]
+
+    key = f"realestate.com.au:{rescrape[3]['id']}"
+    index.discard(key)
+    assert key not in index
+    restored = FingerprintIndex(index.as_dict())
+    assert list(restored.skip_unchanged(rescrape, "realestate.com.au")) == [rescrape[3]]
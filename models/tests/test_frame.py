@@ -0,0 +1,102 @@
+"""
+Tests for the NumPy-backed listing frame.
+"""
+
+import pytest
+from decimal import Decimal
+
+from models import Address, Listing, ListingFrame, ListingRecord, ListingStatus, PropertyType
+
+np = pytest.importorskip("numpy")
+
+
+ROWS = [
+    ("1", "Carlton", PropertyType.HOUSE, 3, Decimal("900000")),
+    ("2", "Carlton", PropertyType.HOUSE, 4, Decimal("1100000")),
+    ("3", "Carlton", PropertyType.UNIT, 2, Decimal("500000")),
+    ("4", "Brunswick", PropertyType.HOUSE, 3, Decimal("800000")),
+    ("5", "Brunswick", PropertyType.HOUSE, 3, None),
+    ("6", "Brunswick", PropertyType.UNIT, None, Decimal("450000.50")),
+]
+
+
+def _listings():
+    return [
+        Listing(
+            listing_id=listing_id,
+            address=Address(suburb=suburb, state="Vic", postcode="3000"),
+            suburb=suburb,
+            property_type=property_type,
+            bedrooms=bedrooms,
+            status=ListingStatus.SCHEDULED if listing_id in ("1", "4") else ListingStatus.UNKNOWN,
+            current_price=price,
+        )
+        for listing_id, suburb, property_type, bedrooms, price in ROWS
+    ]
+
+
+def test_build_from_listings_records_and_compact():
+    """Test that all constructors produce the same columns."""
+    listings = _listings()
+    frames = [
+        ListingFrame.from_listings(listings),
+        ListingFrame.from_records([listing.model_dump() for listing in listings]),
+        ListingFrame.from_listings(ListingRecord.from_listings(listings)),
+    ]
+    for frame in frames:
+        assert len(frame) == 6
+        assert list(frame["listing_id"]) == ["1", "2", "3", "4", "5", "6"]
+        assert list(frame["suburb"]) == ["Carlton"] * 3 + ["Brunswick"] * 3
+        assert frame["property_type"][2] is PropertyType.UNIT
+        assert frame["current_price_cents"][5] == 45_000_050
+        assert list(frame.present("current_price_cents")) == [True, True, True, True, False, True]
+
+
+def test_filter():
+    """Test vectorized filtering by conditions and masks."""
+    frame = ListingFrame.from_listings(_listings())
+
+    houses = frame.filter(property_type=PropertyType.HOUSE, min_price=Decimal("850000"))
+    assert list(houses["listing_id"]) == ["1", "2"]
+    assert list(frame.filter(suburb="Brunswick", status="scheduled")["listing_id"]) == ["4"]
+    assert len(frame.filter(suburb="Nowhere")) == 0
+    assert list(frame.filter(frame["bedrooms"] >= 4)["listing_id"]) == ["2"]
+    assert list(frame.filter(max_bedrooms=2)["listing_id"]) == ["3"]
+
+
+def test_sort():
+    """Test sorting, with missing values last in either direction."""
+    frame = ListingFrame.from_listings(_listings())
+
+    assert list(frame.sort("current_price_cents")["listing_id"]) == ["6", "3", "4", "1", "2", "5"]
+    assert list(frame.sort("current_price_cents", descending=True)["listing_id"]) == ["2", "1", "4", "3", "6", "5"]
+    assert list(frame.sort("suburb")["listing_id"]) == ["4", "5", "6", "1", "2", "3"]
+    assert list(frame.sort("suburb", descending=True)["listing_id"]) == ["1", "2", "3", "4", "5", "6"]
+
+
+def test_aggregates():
+    """Test whole-frame and grouped median/percentile aggregates."""
+    frame = ListingFrame.from_listings(_listings())
+    prices = np.array([900000, 1100000, 500000, 800000, 450000.50]) * 100
+
+    assert frame.median("current_price_cents") == float(np.median(prices))
+    assert frame.percentile("current_price_cents", 90) == float(np.percentile(prices, 90))
+    assert frame.mean("bedrooms") == 3.0
+    assert frame.filter(suburb="Nowhere").median("current_price_cents") is None
+
+    by_suburb = frame.group_by("suburb")
+    assert by_suburb.count() == {"Brunswick": 3, "Carlton": 3}
+    assert by_suburb.median("current_price_cents") == {"Brunswick": 62_500_025.0, "Carlton": 90_000_000.0}
+    assert by_suburb.percentile("current_price_cents", 100) == {"Brunswick": 80_000_000.0, "Carlton": 110_000_000.0}
+
+    by_type = frame.group_by("suburb", "property_type")
+    assert by_type.median("current_price_cents") == {
+        ("Brunswick", PropertyType.HOUSE): 80_000_000.0,
+        ("Brunswick", PropertyType.UNIT): 45_000_050.0,
+        ("Carlton", PropertyType.HOUSE): 100_000_000.0,
+        ("Carlton", PropertyType.UNIT): 50_000_000.0,
+    }
+    assert by_type.mean("bedrooms")[("Carlton", PropertyType.HOUSE)] == 3.5
+
+    with pytest.raises(ValueError):
+        frame.group_by("current_price_cents")
@@ -0,0 +1,155 @@
+"""
+Tests for JSON Lines export and import.
+"""
+
+import io
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+
+from models import (
+    Address,
+    Event,
+    EventTimeline,
+    EventType,
+    JSONLWriter,
+    Listing,
+    ListingStatus,
+    PropertyType,
+    export_timeline,
+    import_timeline,
+    read_jsonl,
+    write_jsonl,
+)
+from helpers import event_summary
+
+
+EVENTS = [
+    (EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, 5), {"old_price": "800000", "drop_percent": 6.25}),
+    (EventType.AUCTION_CANCELLED, "listing1", datetime(2024, 12, 1)),
+    (EventType.PRICE_DROPPED, "listing2", datetime(2024, 12, 5)),
+    (EventType.AUCTION_RESCHEDULED, "listing2", datetime(2024, 12, 3, 9, 30, 0, 125)),
+]
+
+
+def _listing(listing_id):
+    listing = Listing(
+        listing_id=listing_id,
+        address=Address(suburb="Test", state="Vic", postcode="3000", full_address="1 Test St, Test"),
+        suburb="Test",
+        property_type=PropertyType.HOUSE,
+        bedrooms=3,
+        land_size=Decimal("512.5"),
+        description="Ünïcode\nand newlines",
+        source="realestate.com.au",
+    )
+    listing.add_price_record(Decimal("800000"), datetime(2024, 12, 1))
+    listing.add_price_record(Decimal("750000.50"), datetime(2024, 12, 8))
+    listing.add_auction_record(datetime(2025, 1, 11, 11), ListingStatus.SCHEDULED, datetime(2024, 12, 1))
+    return listing
+
+
+@pytest.mark.parametrize("name", ["listings.jsonl", "listings.jsonl.gz"])
+def test_listing_round_trip(tmp_path, name):
+    """Test that listings read back equal to what was written."""
+    listings = [_listing("1"), _listing("2")]
+    path = tmp_path / name
+
+    assert write_jsonl(path, listings) == 2
+    loaded = list(read_jsonl(path, Listing))
+
+    assert loaded == listings
+    assert loaded[0].price_history[0].price == Decimal("750000.50")
+
+
+def test_event_metadata_reads_back_as_json_values(tmp_path):
+    """Test that Decimal and datetime metadata come back as strings."""
+    path = tmp_path / "events.jsonl"
+    event = Event(
+        event_type=EventType.PRICE_DROPPED,
+        listing_id="1",
+        timestamp=datetime(2024, 12, 1),
+        metadata={"drop_amount": Decimal("50000.50"), "seen_at": datetime(2024, 12, 2), "drop_percent": 6.25},
+    )
+    write_jsonl(path, [event])
+
+    (loaded,) = read_jsonl(path, Event)
+    assert loaded.timestamp == event.timestamp
+    assert loaded.metadata == {"drop_amount": "50000.50", "seen_at": "2024-12-02T00:00:00", "drop_percent": 6.25}
+
+
+def test_gzip_inferred_from_suffix(tmp_path):
+    """Test that a .gz suffix produces a gzip file."""
+    path = tmp_path / "events.jsonl.gz"
+    timeline = EventTimeline()
+    timeline.add_events(EVENTS)
+    export_timeline(timeline, path)
+
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert len(import_timeline(path)) == 4
+
+
+def test_timeline_round_trip_preserves_order(tmp_path):
+    """Test that an exported timeline imports with the same query results."""
+    timeline = EventTimeline()
+    timeline.add_events(EVENTS)
+    path = tmp_path / "events.jsonl"
+
+    assert export_timeline(timeline, path) == 4
+    loaded = import_timeline(path, batch_size=3)
+
+    assert event_summary(loaded.get_all_events()) == event_summary(timeline.get_all_events())
+    assert event_summary(loaded.get_events_for_listing("listing1")) == event_summary(timeline.get_events_for_listing("listing1"))
+
+
+def test_export_streams_newest_first(tmp_path):
+    """Test that export pages through iter_events and both file orders import the same."""
+    timeline = EventTimeline()
+    timeline.add_events(EVENTS)
+    timeline.get_all_events = None  # export must not materialize the whole timeline
+    path = tmp_path / "events.jsonl"
+
+    assert export_timeline(timeline, path) == 4
+    lines = path.read_text().splitlines()
+    assert json.loads(lines[0])["listing_id"] == "listing1"
+    assert json.loads(lines[0])["timestamp"].startswith("2024-12-05")
+
+    oldest_first = tmp_path / "oldest-first.jsonl"
+    # Oldest first, ties in insertion order: the layout earlier exports used
+    oldest_first.write_text("\n".join(lines[:1:-1] + lines[:2]) + "\n")
+    expected = event_summary(EventTimeline.get_all_events(timeline))
+    for source in (path, oldest_first):
+        for batch_size in (1, 3):
+            assert event_summary(import_timeline(source, batch_size=batch_size).get_all_events()) == expected
+
+def test_writer_streams_to_file_object():
+    """Test writing to and reading from an in-memory binary file."""
+    buffer = io.BytesIO()
+    with JSONLWriter(buffer, buffer_size=1) as writer:
+        writer.write(Event(event_type=EventType.AUCTION_VOIDED, listing_id="1", timestamp=datetime(2024, 12, 1)))
+        writer.write_many([Event(event_type=EventType.PRICE_DROPPED, listing_id="2", timestamp=datetime(2024, 12, 2))])
+    assert writer.count == 2
+    assert buffer.getvalue().count(b"\n") == 2
+
+    buffer.seek(0)
+    assert [event.listing_id for event in read_jsonl(buffer, Event)] == ["1", "2"]
+
+
+def test_invalid_line_reports_line_number(tmp_path):
+    """Test that a bad line raises ValueError naming the line."""
+    path = tmp_path / "events.jsonl"
+    path.write_bytes(
+        b'{"event_type": "auction_voided", "listing_id": "1", "timestamp": "2024-12-01T00:00:00"}\n'
+        b"\n"
+        b'{"event_type": "nope"}\n'
+    )
+
+    with pytest.raises(ValueError, match="line 3"):
+        list(read_jsonl(path, Event))
+
+
+def test_unknown_compression(tmp_path):
+    """Test that an unknown compression is rejected."""
+    with pytest.raises(ValueError):
+        write_jsonl(tmp_path / "events.jsonl", [], compression="lz4")
@@ -107,6 +107,119 @@ def test_auction_history_tracking():
     assert len(listing.auction_history) == 2
 
 
+def test_price_history_out_of_order_insertion():
+    """Test that late price records are inserted in timestamp order."""
+    address = Address(suburb="Test", state="Vic", postcode="3000")
+    listing = Listing(
+        listing_id="123",
+        address=address,
+        suburb="Test",
+        property_type=PropertyType.HOUSE,
+    )
+
+    listing.add_price_record(Decimal("800000"), datetime(2024, 11, 1))
+    listing.add_price_record(Decimal("700000"), datetime(2024, 12, 1))
+    listing.add_price_record(Decimal("750000"), datetime(2024, 11, 15))
+    listing.add_price_record(Decimal("760000"), datetime(2024, 11, 15))
+
+    assert [r.price for r in listing.price_history] == [
+        Decimal("700000"),
+        Decimal("750000"),
+        Decimal("760000"),
+        Decimal("800000"),
+    ]
+
+
+def test_replay_records_match_individual_adds():
+    """Test that bulk replay gives the same state and events as one-by-one adds."""
+    from models import EventTimeline
+
+    address = Address(suburb="Test", state="Vic", postcode="3000")
+    prices = [
+        PriceHistory(price=Decimal(800000 - (i % 5) * 10000 + (i % 3) * 5000), timestamp=datetime(2024, 1, 1 + i % 28, i % 24))
+        for i in range(60)
+    ]
+    auctions = [
+        AuctionHistory(
+            auction_datetime=datetime(2024, 3, 1 + i % 4),
+            status=[ListingStatus.SCHEDULED, ListingStatus.CANCELLED, ListingStatus.SCHEDULED, ListingStatus.VOIDED][i % 4],
+            timestamp=datetime(2024, 2, 1 + i % 20),
+        )
+        for i in range(30)
+    ]
+
+    expected = Listing(listing_id="123", address=address, suburb="Test", property_type=PropertyType.HOUSE)
+    expected_timeline = EventTimeline()
+    for record in sorted(prices, key=lambda r: r.timestamp):
+        expected.add_price_record(record.price, record.timestamp, expected_timeline)
+    for record in sorted(auctions, key=lambda r: r.timestamp):
+        expected.add_auction_record(record.auction_datetime, record.status, record.timestamp, record.notes, expected_timeline)
+
+    listing = Listing(listing_id="123", address=address, suburb="Test", property_type=PropertyType.HOUSE)
+    timeline = EventTimeline()
+    cutoff = datetime(2024, 1, 10)
+    drops = listing.replay_price_records([r for r in prices if r.timestamp < cutoff], timeline)
+    drops += listing.replay_price_records([r for r in prices if r.timestamp >= cutoff], timeline)
+    listing.replay_auction_records(auctions, timeline)
+
+    assert drops > 0
+    assert listing.current_price == expected.current_price
+    assert listing.previous_price == expected.previous_price
+    assert listing.status == expected.status
+    assert listing.auction_datetime == expected.auction_datetime
+    assert [r.timestamp for r in listing.price_history] == [r.timestamp for r in expected.price_history]
+    assert [r.timestamp for r in listing.auction_history] == [r.timestamp for r in expected.auction_history]
+    assert [(e.event_type, e.timestamp, e.metadata) for e in timeline.get_all_events()] == [
+        (e.event_type, e.timestamp, e.metadata) for e in expected_timeline.get_all_events()
+    ]
+
+
+def test_from_trusted_matches_validated_listing():
+    """Test that trusted construction rebuilds the same listing without validation."""
+    address = Address(suburb="Test", state="Vic", postcode="3000")
+    listing = Listing(
+        listing_id="123",
+        address=address,
+        suburb="Test",
+        property_type=PropertyType.HOUSE,
+    )
+    listing.add_price_record(Decimal("800000"), datetime(2024, 11, 1))
+    listing.add_price_record(Decimal("750000"), datetime(2024, 12, 1))
+    listing.add_auction_record(datetime(2024, 12, 20, 10), ListingStatus.SCHEDULED, datetime(2024, 12, 1))
+    data = listing.model_dump()
+
+    trusted = Listing.from_trusted(data)
+    assert trusted == listing
+    assert trusted.model_dump() == data
+    assert isinstance(trusted.address, Address)
+    assert isinstance(trusted.price_history[0], PriceHistory)
+    assert isinstance(trusted.auction_history[0], AuctionHistory)
+
+    # The trusted instance is fully usable and does not share state with the input
+    trusted.add_price_record(Decimal("700000"), datetime(2025, 1, 1))
+    assert len(trusted.price_history) == 3
+    assert len(data["price_history"]) == 2
+
+    assert Listing.from_trusted_batch([data, data])[1] == listing
+
+
+def test_from_trusted_fills_defaults_for_partial_data():
+    """Test that missing fields get defaults and unknown keys are ignored."""
+    trusted = Listing.from_trusted(
+        {
+            "listing_id": "123",
+            "address": {"suburb": "Test", "state": "Vic", "postcode": "3000"},
+            "suburb": "Test",
+            "property_type": PropertyType.UNIT,
+            "unexpected": "ignored",
+        }
+    )
+
+    assert trusted.status == ListingStatus.UNKNOWN
+    assert trusted.price_history == []
+    assert trusted.address.full_address is None
+    assert not hasattr(trusted, "unexpected")
+
 def test_listing_status_enum():
     """Test that all required status values exist."""
     required_statuses = [
@@ -134,6 +247,25 @@ def test_property_type_from_string():
     assert PropertyType.from_string("") == PropertyType.OTHER
 
 
+def test_property_type_source_tables_and_bulk():
+    """Test per-source labels and bulk conversion to codes."""
+    assert PropertyType.from_string("ApartmentUnitFlat", "domain.com.au") == PropertyType.UNIT
+    assert PropertyType.from_string("Penthouse", "domain.com.au") == PropertyType.APARTMENT
+    assert PropertyType.from_string("  town   HOUSE ") == PropertyType.TOWNHOUSE
+    assert PropertyType.from_string("Unit", "example.com") == PropertyType.UNIT
+    assert PropertyType.from_string(None) == PropertyType.OTHER
+
+    codes = PropertyType.from_strings(["House", "Townhouse", None, "House", "NewApartments"], "domain.com.au")
+    types = list(PropertyType)
+    assert [types[code] for code in codes] == [
+        PropertyType.HOUSE,
+        PropertyType.TOWNHOUSE,
+        PropertyType.OTHER,
+        PropertyType.HOUSE,
+        PropertyType.APARTMENT,
+    ]
+
+
 def test_listing_json_serialization():
     """Test that listing can be serialized to JSON."""
     address = Address(suburb="Test", state="Vic", postcode="3000")
@@ -0,0 +1,45 @@
+"""
+Tests for integer-cents price encoding.
+"""
+
+import pytest
+from decimal import Decimal
+
+from models import Address, Listing, PriceHistory, PropertyType
+from models.money import INT64_MAX, from_cents, to_cents
+
+
+def test_cents_round_trip():
+    """Test Decimal to integer cents conversion."""
+    assert to_cents(Decimal("750000")) == 75_000_000
+    assert to_cents(Decimal("12.345")) == 1235
+    assert to_cents("799999.99") == 79_999_999
+    assert to_cents(None) is None
+    assert from_cents(1235) == Decimal("12.35")
+    assert from_cents(None) is None
+    assert from_cents(to_cents(Decimal("1234567.89"))) == Decimal("1234567.89")
+
+
+def test_cents_out_of_int64_range():
+    """Test that amounts too large for int64 cents are rejected."""
+    assert to_cents(from_cents(INT64_MAX)) == INT64_MAX
+    with pytest.raises(ValueError):
+        to_cents(from_cents(INT64_MAX) + Decimal("0.01"))
+
+
+def test_model_prices_in_cents():
+    """Test the cents accessors on Listing and PriceHistory."""
+    listing = Listing(
+        listing_id="123",
+        address=Address(suburb="Test", state="Vic", postcode="3000"),
+        suburb="Test",
+        property_type=PropertyType.HOUSE,
+    )
+    assert listing.current_price_cents is None
+
+    listing.add_price_record(Decimal("800000"))
+    listing.add_price_record(Decimal("750000.50"))
+    assert listing.current_price_cents == 75_000_050
+    assert listing.previous_price_cents == 80_000_000
+    assert listing.price_history[0].price_cents == 75_000_050
+    assert PriceHistory(price=Decimal("1.5"), timestamp="2024-01-01T00:00:00").price_cents == 150
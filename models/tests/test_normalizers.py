@@ -0,0 +1,76 @@
+"""
+Tests for batch normalization.
+"""
+
+import gc
+import json
+import pytest
+
+from models import BatchResult, ListingRecord, RecordError, normalize_batch, normalize_realestate_data
+from models.normalizers import iter_normalized_chunks
+
+
+def test_batch_matches_single_record_normalizer(raw_records):
+    """Test that a batch normalizes every record like the single-record function."""
+    result = normalize_batch(raw_records, "realestate.com.au", workers=1, chunk_size=7)
+
+    assert isinstance(result, BatchResult)
+    assert result.errors == []
+    assert result.listings == [normalize_realestate_data(data) for data in raw_records]
+
+
+def test_bad_records_are_reported_not_raised(raw_records):
+    """Test that failures are collected per record without aborting the batch."""
+    records = [raw_records[0], None, {"id": 42, "address": "not a mapping"}, raw_records[1]]
+    result = normalize_batch(records, "realestate.com.au", workers=1)
+
+    assert [listing.listing_id for listing in result.listings] == [str(raw_records[0]["id"]), str(raw_records[1]["id"])]
+    assert [(error.index, error.listing_id, error.error_type) for error in result.errors] == [
+        (1, None, "AttributeError"),
+        (2, "42", "AttributeError"),
+    ]
+
+    domain = normalize_batch([{"listingId": 7, "suburb": "Carlton", "beds": "many"}], "domain.com.au", workers=1)
+    assert domain.listings == []
+    assert domain.errors[0].listing_id == "7"
+    assert domain.errors[0].error_type == "ValidationError"
+
+
+def test_process_pool_keeps_input_order(raw_records):
+    """Test that fanning out across processes returns the same result in order."""
+    records = raw_records * 4
+    records.insert(30, {"id": "broken", "address": []})
+
+    result = normalize_batch(iter(records), "realestate.com.au", workers=2, chunk_size=10)
+
+    assert result.listings == normalize_batch(records, "realestate.com.au", workers=1).listings
+    assert result.errors == [RecordError(30, "broken", "AttributeError", result.errors[0].message)]
+
+
+def test_compact_results_and_gc_left_alone(raw_records):
+    """Test compact results from the pool, and that the caller's GC setting is untouched."""
+    expected = ListingRecord.from_listings(normalize_batch(raw_records, "realestate.com.au", workers=1).listings)
+    assert normalize_batch(raw_records, "realestate.com.au", workers=1, compact=True).listings == expected
+
+    assert gc.isenabled()
+    chunks = iter_normalized_chunks(raw_records, "realestate.com.au", workers=2, chunk_size=10, compact=True)
+    listings = []
+    for result in chunks:
+        assert gc.isenabled()
+        listings.extend(result.listings)
+    assert listings == expected
+
+
+def test_json_text_records(raw_records):
+    """Test that records given as JSON text are parsed and normalized."""
+    lines = [json.dumps(raw_records[0]).encode(), b"{not json", json.dumps(raw_records[1])]
+    result = normalize_batch(lines, "realestate.com.au", workers=1)
+
+    assert result.listings == [normalize_realestate_data(raw_records[0]), normalize_realestate_data(raw_records[1])]
+    assert [(error.index, error.error_type) for error in result.errors] == [(1, "JSONDecodeError")]
+
+
+def test_unknown_source():
+    """Test that an unknown source is rejected up front."""
+    with pytest.raises(ValueError):
+        normalize_batch([], "example.com")
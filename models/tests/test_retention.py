@@ -0,0 +1,177 @@
+"""
+Tests for event retention and compaction.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from models import EventTimeline, EventType, ListingStatus, RetentionEngine, RetentionPolicy
+
+
+NOW = datetime(2024, 12, 31)
+
+
+def _timeline():
+    timeline = EventTimeline()
+    timeline.add_events(
+        [
+            (EventType.PRICE_DROPPED, "sold", datetime(2024, 1, 1), {"drop_amount": "50000"}),
+            (EventType.PRICE_DROPPED, "sold", datetime(2024, 3, 1), {"drop_amount": "25000"}),
+            (EventType.AUCTION_CANCELLED, "sold", datetime(2024, 2, 1)),
+            (EventType.AUCTION_VOIDED, "sold", datetime(2024, 12, 20)),
+            (EventType.PRICE_DROPPED, "active", datetime(2024, 1, 1), {"drop_amount": "10000"}),
+            (EventType.AUCTION_RESCHEDULED, "active", datetime(2024, 1, 1)),
+            (EventType.PRICE_DROPPED, "active", datetime(2024, 12, 1), {"drop_amount": "5000"}),
+        ]
+    )
+    return timeline
+
+
+def test_policy_uses_shortest_horizon():
+    """Test that the shortest applicable horizon wins."""
+    policy = RetentionPolicy(
+        default_horizon=timedelta(days=365),
+        horizons_by_type={EventType.AUCTION_RESCHEDULED: timedelta(days=90)},
+        horizons_by_status={ListingStatus.SOLD: timedelta(days=30)},
+    )
+
+    assert policy.horizon_for(EventType.PRICE_DROPPED) == timedelta(days=365)
+    assert policy.horizon_for(EventType.AUCTION_RESCHEDULED) == timedelta(days=90)
+    assert policy.horizon_for(EventType.AUCTION_RESCHEDULED, ListingStatus.SOLD) == timedelta(days=30)
+    assert RetentionPolicy().horizon_for(EventType.PRICE_DROPPED) is None
+
+
+def test_compaction_rolls_events_into_summaries():
+    """Test that expired events are dropped and summarized per listing."""
+    timeline = _timeline()
+    policy = RetentionPolicy(
+        horizons_by_type={EventType.AUCTION_RESCHEDULED: timedelta(days=90)},
+        horizons_by_status={ListingStatus.SOLD: timedelta(days=30)},
+    )
+    engine = RetentionEngine(timeline, policy, listing_statuses={"sold": ListingStatus.SOLD}, batch_size=1)
+
+    assert engine.run(now=NOW) == 4
+
+    # Sold listing keeps its recent event plus one rollup per compacted type
+    events = timeline.get_events_for_listing("sold")
+    assert [(e.event_type, e.timestamp) for e in events] == [
+        (EventType.AUCTION_VOIDED, datetime(2024, 12, 20)),
+        (EventType.PRICE_DROPPED, datetime(2024, 3, 1)),
+        (EventType.AUCTION_CANCELLED, datetime(2024, 2, 1)),
+    ]
+    assert events[1].metadata == {
+        "compacted_events": 2,
+        "total_drop_amount_cents": 7_500_000,
+        "total_drop_amount": "75000.00",
+    }
+    assert events[2].metadata == {"compacted_events": 1}
+    assert timeline.count_events("sold") == 4
+    assert timeline.count_events("sold", EventType.PRICE_DROPPED) == 2
+
+    summary = timeline.get_listing_summary("sold")
+    assert summary.event_count == 3
+    assert summary.price_drop_count == 2
+    assert summary.total_drop_amount == Decimal("75000")
+    assert summary.total_drop_amount_cents == 7_500_000
+    assert summary.last_auction_outcome == EventType.AUCTION_CANCELLED
+    assert summary.first_event_at == datetime(2024, 1, 1)
+    assert summary.last_event_at == datetime(2024, 3, 1)
+
+    # Active listing only has the old reschedule event rolled up
+    assert timeline.count_events("active") == 3
+    assert timeline.has_event_type("active", EventType.AUCTION_RESCHEDULED) is True
+    assert timeline.get_listing_summary("active").event_counts == {EventType.AUCTION_RESCHEDULED: 1}
+
+    assert len(timeline) == 6
+    assert timeline.count_events() == 7
+    assert timeline.count_events(event_type=EventType.PRICE_DROPPED) == 4
+    assert [e.listing_id for e in timeline.get_all_events(limit=3)] == ["sold", "active", "sold"]
+
+    # A second pass has nothing left to compact
+    assert engine.run(now=NOW) == 0
+
+
+def test_run_step_is_incremental():
+    """Test that each step only examines one batch of listings."""
+    timeline = _timeline()
+    engine = RetentionEngine(timeline, RetentionPolicy(default_horizon=timedelta(days=180)), batch_size=1)
+
+    first = engine.run_step(now=NOW)
+    second = engine.run_step(now=NOW)
+    assert sorted([first, second]) == [2, 3]
+    assert timeline.count_events() == 7
+    assert timeline.get_listing_summary("missing") is None
+
+
+def test_recompaction_extends_rollup():
+    """Test that compacting more events of a type folds them into the existing rollup."""
+    timeline = EventTimeline()
+    timeline.add_events(
+        [
+            (EventType.PRICE_DROPPED, "listing1", datetime(2024, 1, 1), {"drop_amount": "100"}),
+            (EventType.PRICE_DROPPED, "listing1", datetime(2024, 2, 1), {"drop_amount": "200"}),
+            (EventType.PRICE_DROPPED, "listing1", datetime(2024, 3, 1), {"drop_amount": "300"}),
+        ]
+    )
+
+    assert timeline.compact(lambda event: event.timestamp < datetime(2024, 1, 15)) == 1
+    assert timeline.compact(lambda event: event.timestamp < datetime(2024, 2, 15)) == 1
+
+    events = timeline.get_events_for_listing("listing1")
+    assert [e.timestamp for e in events] == [datetime(2024, 3, 1), datetime(2024, 2, 1)]
+    assert events[1].metadata["compacted_events"] == 2
+    assert events[1].metadata["total_drop_amount"] == "300.00"
+    assert len(timeline) == 2
+    assert timeline.count_events("listing1", EventType.PRICE_DROPPED) == 3
+
+
+def test_queries_skip_compacted_events():
+    """Test range, limit and paged queries after compacting a few events of a large timeline."""
+    timeline = EventTimeline()
+    timeline.add_events(
+        [
+            (EventType.PRICE_DROPPED, f"listing{i}", datetime(2024, 1, day), {"drop_amount": "1000"})
+            for i in range(20)
+            for day in range(1, 6)
+        ]
+    )
+    expected = [
+        (e.listing_id, e.timestamp)
+        for e in timeline.get_all_events()
+        if e.listing_id != "listing0" or e.timestamp.day > 2
+    ]
+
+    compacted = timeline.compact(lambda event: event.timestamp.day <= 3, ["listing0"])
+    assert compacted == 3
+    assert len(timeline) == 98
+
+    assert [(e.listing_id, e.timestamp) for e in timeline.get_all_events()] == expected
+    assert [(e.listing_id, e.timestamp) for e in timeline.get_all_events(limit=5)] == expected[:5]
+    paged = [(e.listing_id, e.timestamp) for e in timeline.iter_events(page_size=7)]
+    assert paged == expected
+    between = timeline.get_events_between(datetime(2024, 1, 3), datetime(2024, 1, 3), limit=25)
+    assert [(e.listing_id, e.timestamp) for e in between] == [item for item in expected if item[1].day == 3][:25]
+    assert timeline.count_events(event_type=EventType.PRICE_DROPPED) == 100
+
+
+def test_background_loop_survives_errors(caplog):
+    """Test that a failing step is logged and the background thread keeps running."""
+    engine = RetentionEngine(EventTimeline(), RetentionPolicy(default_horizon=timedelta(days=1)))
+    calls = []
+    done = threading.Event()
+
+    def run_step():
+        calls.append(1)
+        if len(calls) == 1:
+            raise TypeError("can't compare offset-naive and offset-aware datetimes")
+        done.set()
+        return 0
+
+    engine.run_step = run_step
+    engine.start(interval=0.01)
+    try:
+        assert done.wait(5)
+    finally:
+        engine.stop()
+    assert "Retention step failed" in caplog.text
@@ -0,0 +1,114 @@
+"""
+Tests for the process-sharded event timeline.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from pydantic import ValidationError
+
+from models import EventTimeline, EventType, ShardedEventTimeline
+from helpers import event_summary
+
+
+@pytest.fixture
+def sharded():
+    with ShardedEventTimeline(shards=3) as timeline:
+        yield timeline
+
+
+def test_sharded_timeline_matches_event_timeline(sharded):
+    """Test that scatter-gather queries match a single EventTimeline."""
+    events = [
+        (EventType.PRICE_DROPPED if i % 3 else EventType.AUCTION_CANCELLED, f"listing{i % 7}", datetime(2024, 12, 1 + i % 20))
+        for i in range(100)
+    ]
+    expected = EventTimeline()
+    for event in events[:10]:
+        expected.add_event(*event)
+        sharded.add_event(*event)
+    expected.add_events(events[10:])
+    sharded.add_events(events[10:])
+
+    assert len(sharded) == 100
+    assert event_summary(sharded.get_all_events()) == event_summary(expected.get_all_events())
+    assert event_summary(sharded.get_all_events(EventType.AUCTION_CANCELLED, limit=5)) == event_summary(
+        expected.get_all_events(EventType.AUCTION_CANCELLED, limit=5)
+    )
+    window = (datetime(2024, 12, 5), datetime(2024, 12, 9))
+    assert event_summary(sharded.get_events_between(*window)) == event_summary(expected.get_events_between(*window))
+    assert event_summary(sharded.get_events_for_listing("listing3")) == event_summary(expected.get_events_for_listing("listing3"))
+    assert sharded.count_events(event_type=EventType.PRICE_DROPPED) == expected.count_events(
+        event_type=EventType.PRICE_DROPPED
+    )
+    assert sharded.count_events("listing3", EventType.AUCTION_CANCELLED) == expected.count_events(
+        "listing3", EventType.AUCTION_CANCELLED
+    )
+    assert sharded.has_event_type("listing3", EventType.PRICE_DROPPED) is True
+    assert sharded.get_latest_event("listing3") == expected.get_latest_event("listing3")
+
+    sharded.clear()
+    assert len(sharded) == 0
+
+
+def test_sharded_add_events_counts_and_validation(sharded):
+    """Test batch counts per listing and that an invalid batch adds nothing."""
+    counts = sharded.add_events(
+        [
+            (EventType.AUCTION_RESCHEDULED, "a", datetime(2024, 1, 1)),
+            (EventType.PRICE_DROPPED, "b", datetime(2024, 1, 2)),
+            (EventType.PRICE_DROPPED, "a", datetime(2024, 1, 3)),
+        ]
+    )
+    assert counts == {"a": 2, "b": 1}
+
+    with pytest.raises(ValidationError):
+        sharded.add_events([(EventType.AUCTION_RESCHEDULED, "c", datetime(2024, 1, 4)), ("not-a-type", "d")])
+    assert len(sharded) == 3
+    assert sharded.get_latest_event("a").event_type == EventType.PRICE_DROPPED
+
+
+def test_sharded_ties_keep_insertion_order(sharded):
+    """Test that events sharing a timestamp merge in insertion order across shards."""
+    ts = datetime(2024, 6, 1)
+    listing_ids = [f"listing{i}" for i in range(12)]
+    for listing_id in listing_ids:
+        sharded.add_event(EventType.AUCTION_RESCHEDULED, listing_id, ts)
+
+    assert [e.listing_id for e in sharded.get_all_events()] == listing_ids
+
+
+def test_sharded_timeline_requires_a_shard():
+    """Test that at least one shard is required."""
+    with pytest.raises(ValueError):
+        ShardedEventTimeline(shards=0)
+
+
+def test_sharded_timeline_is_thread_safe(sharded):
+    """Test that threads sharing a timeline never read each other's replies."""
+    timestamp = datetime(2024, 12, 1)
+
+    def write(worker):
+        for i in range(50):
+            listing_id = f"listing{worker}-{i % 5}"
+            sharded.add_events([(EventType.PRICE_DROPPED, listing_id, timestamp)] * 2)
+            assert sharded.count_events(listing_id) == 2 * (i // 5 + 1)
+            sharded.get_all_events(limit=3)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(write, range(4)))
+    assert len(sharded) == 400
+
+
+def test_sharded_timeline_rejects_calls_after_close():
+    """Test that a closed timeline raises RuntimeError and can be closed again."""
+    timeline = ShardedEventTimeline(shards=2)
+    timeline.close()
+    timeline.close()
+    with pytest.raises(RuntimeError, match="timeline is closed"):
+        timeline.add_event(EventType.PRICE_DROPPED, "listing1")
+    with pytest.raises(RuntimeError, match="timeline is closed"):
+        timeline.count_events()
+    with pytest.raises(RuntimeError, match="timeline is closed"):
+        timeline.add_events([])
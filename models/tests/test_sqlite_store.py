@@ -0,0 +1,131 @@
+"""
+Tests for SQLite listing and event storage.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from models import (
+    Address,
+    EventTimeline,
+    EventType,
+    Listing,
+    ListingStatus,
+    PropertyType,
+    SQLiteEventTimeline,
+    SQLiteListingStore,
+)
+from models.sqlite_store import connect
+from helpers import event_summary
+
+
+EVENTS = [
+    (EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, 5), {"old_price": "800000", "drop_percent": 6.25}),
+    (EventType.AUCTION_CANCELLED, "listing1", datetime(2024, 12, 1)),
+    (EventType.PRICE_DROPPED, "listing2", datetime(2024, 12, 5)),
+    (EventType.AUCTION_RESCHEDULED, "listing2", datetime(2024, 12, 3)),
+]
+
+
+def test_sqlite_timeline_matches_event_timeline(tmp_path):
+    """Test that SQLite queries return the same events as EventTimeline."""
+    expected = EventTimeline()
+    expected.add_events(EVENTS)
+    timeline = SQLiteEventTimeline(tmp_path / "events.db", batch_size=3)
+    assert timeline.add_events(EVENTS) == {"listing1": 2, "listing2": 2}
+
+    assert len(timeline) == 4
+    assert event_summary(timeline.get_all_events()) == event_summary(expected.get_all_events())
+    assert event_summary(timeline.get_all_events(EventType.PRICE_DROPPED, limit=1)) == event_summary(
+        expected.get_all_events(EventType.PRICE_DROPPED, limit=1)
+    )
+    assert event_summary(timeline.get_events_for_listing("listing2")) == event_summary(expected.get_events_for_listing("listing2"))
+    assert event_summary(timeline.get_events_between(datetime(2024, 12, 2), datetime(2024, 12, 5))) == event_summary(
+        expected.get_events_between(datetime(2024, 12, 2), datetime(2024, 12, 5))
+    )
+    assert timeline.count_events("listing1", EventType.PRICE_DROPPED) == 1
+    assert timeline.has_event_type("listing2", EventType.AUCTION_RESCHEDULED) is True
+    assert timeline.has_event_type("listing2", EventType.AUCTION_VOIDED) is False
+
+    event = timeline.add_event(EventType.AUCTION_VOIDED, "listing3", timestamp=datetime(2024, 12, 9))
+    assert timeline.get_latest_event("listing3") == event
+
+    timeline.clear()
+    assert len(timeline) == 0
+
+
+def test_sqlite_timeline_persists_across_connections(tmp_path):
+    """Test that events written by one connection are visible to another."""
+    path = tmp_path / "events.db"
+    writer = SQLiteEventTimeline(path)
+    writer.add_events(EVENTS)
+
+    reader = SQLiteEventTimeline(path)
+    assert reader.count_events() == 4
+    assert reader._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_listing_store_round_trip(tmp_path):
+    """Test saving, loading, filtering and deleting listings."""
+    conn = connect(tmp_path / "listings.db")
+    store = SQLiteListingStore(conn)
+    listing = Listing(
+        listing_id="149785064",
+        address=Address(suburb="Dandenong North", state="Vic", postcode="3175"),
+        suburb="Dandenong North",
+        property_type=PropertyType.HOUSE,
+        status=ListingStatus.SCHEDULED,
+        current_price=Decimal("750000"),
+    )
+    listing.add_price_record(Decimal("800000"), datetime(2024, 11, 1))
+    other = listing.model_copy(update={"listing_id": "2", "suburb": "Carlton", "status": ListingStatus.SOLD})
+
+    assert store.save_listings([listing, other]) == 2
+    assert len(store) == 2
+    assert "149785064" in store
+
+    loaded = store.get_listing("149785064")
+    assert loaded == listing
+    assert loaded.price_history[0].price == Decimal("800000")
+
+    assert [listing.listing_id for listing in store.get_listings(suburb="Carlton")] == ["2"]
+    assert [listing.listing_id for listing in store.get_listings(status=ListingStatus.SCHEDULED)] == ["149785064"]
+    priced = store.get_listings(min_price=Decimal("800000"), max_price=Decimal("800000"))
+    assert [listing.listing_id for listing in priced] == ["149785064", "2"]
+    assert store.get_listings(max_price=Decimal("799999.99")) == []
+    assert store.get_listing("missing") is None
+
+    assert store.delete_listing("2") is True
+    assert store.delete_listing("2") is False
+    assert len(store) == 1
+
+
+def test_sqlite_listing_store_migrates_price_column(tmp_path):
+    """Test that a database from before the price column gets it backfilled."""
+    import sqlite3
+
+    path = tmp_path / "old.db"
+    old = sqlite3.connect(str(path))
+    old.execute(
+        "CREATE TABLE listings (listing_id TEXT PRIMARY KEY, suburb TEXT NOT NULL, property_type TEXT NOT NULL, "
+        "status TEXT NOT NULL, updated_at INTEGER, data TEXT NOT NULL)"
+    )
+    listing = Listing(
+        listing_id="1",
+        address=Address(suburb="Carlton", state="Vic", postcode="3053"),
+        suburb="Carlton",
+        property_type=PropertyType.UNIT,
+        current_price=Decimal("612345.67"),
+    )
+    old.execute(
+        "INSERT INTO listings VALUES (?, ?, ?, ?, ?, ?)",
+        ("1", "Carlton", "unit", "unknown", None, listing.model_dump_json()),
+    )
+    old.commit()
+    old.close()
+
+    store = SQLiteListingStore(tmp_path / "old.db")
+    assert [listing.listing_id for listing in store.get_listings(min_price=Decimal("612345.67"))] == ["1"]
+    assert store.get_listings(min_price=Decimal("612345.68")) == []
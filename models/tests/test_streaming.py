@@ -0,0 +1,87 @@
+"""
+Tests for streaming readers of scraper output files.
+"""
+
+import gzip
+import io
+import json
+import pytest
+
+from models import (
+    iter_json_array,
+    iter_jsonl_records,
+    iter_records,
+    normalize_batch,
+    stream_normalize,
+)
+from helpers import SEARCH_JSON
+
+
+@pytest.mark.parametrize("read_size", [1, 7, 1 << 16])
+def test_json_array_matches_json_load(raw_records, read_size):
+    """Test that streaming the sample file yields the same records as json.load."""
+    assert list(iter_json_array(SEARCH_JSON, read_size=read_size)) == raw_records
+
+
+def test_json_array_block_boundaries(tmp_path):
+    """Test values split across blocks, including numbers and literals."""
+    path = tmp_path / "values.json"
+    path.write_text(' \n [12345, "ü,]", {"a": [1, 2]} , true, null, -0.5e3 ]\n')
+
+    for read_size in (1, 2, 3, 100):
+        assert list(iter_json_array(path, read_size=read_size)) == [12345, "ü,]", {"a": [1, 2]}, True, None, -500.0]
+
+    path.write_text("[]")
+    assert list(iter_json_array(path)) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "{}", "[1, 2", "[1 2]", "[1,, 2]", '[{"a": }]', '[{"a": 1}x, 2]', "[1,]", "[1] x", "[][]", "[1.5.5]"],
+)
+def test_json_array_malformed(tmp_path, text):
+    """Test that malformed arrays raise ValueError."""
+    path = tmp_path / "bad.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, read_size=2))
+
+
+def test_json_array_malformed_element_fails_fast():
+    """Test that a bad element is reported without reading the rest of the file."""
+    f = io.BytesIO(b'[{"a": 1}, {"b": nope}, ' + b'"padding", ' * 100_000 + b"1]")
+    with pytest.raises(ValueError, match="Invalid JSON array element"):
+        list(iter_json_array(f, read_size=64))
+    assert f.tell() < 100_000
+
+
+def test_jsonl_records_and_format_detection(tmp_path, raw_records):
+    """Test JSON Lines reading, gzip and picking the format per file."""
+    lines = b"\n".join(json.dumps(record).encode() for record in raw_records[:3]) + b"\n\n"
+    jsonl = tmp_path / "search.jsonl.gz"
+    jsonl.write_bytes(gzip.compress(lines))
+    untyped = tmp_path / "search.out"
+    untyped.write_bytes(lines)
+
+    assert list(iter_jsonl_records(jsonl)) == raw_records[:3]
+    assert list(iter_records(jsonl, raw=True)) == lines.splitlines()[:3]
+    assert list(iter_records(untyped)) == raw_records[:3]
+    assert list(iter_records(io.BufferedReader(io.BytesIO(lines)))) == raw_records[:3]
+    assert list(iter_records(io.BytesIO(lines))) == raw_records[:3]
+    assert list(iter_records(SEARCH_JSON)) == raw_records
+
+
+def test_stream_normalize(tmp_path, raw_records):
+    """Test that streaming normalization matches normalizing the loaded file."""
+    expected = normalize_batch(raw_records, "realestate.com.au", workers=1).listings
+
+    results = list(stream_normalize(SEARCH_JSON, "realestate.com.au", chunk_size=10))
+    assert len(results) == (len(raw_records) + 9) // 10
+    assert [listing for result in results for listing in result.listings] == expected
+
+    path = tmp_path / "search.jsonl"
+    path.write_bytes(b"\n".join([json.dumps(raw_records[0]).encode(), b"{broken", json.dumps(raw_records[1]).encode()]))
+    for workers in (1, 2):
+        (result,) = stream_normalize(path, "realestate.com.au", workers=workers)
+        assert result.listings == expected[:2]
+        assert [(error.index, error.error_type) for error in result.errors] == [(1, "JSONDecodeError")]
@@ -0,0 +1,197 @@
+"""
+Tests for asynchronous event subscriptions.
+"""
+
+import asyncio
+import threading
+import pytest
+from datetime import datetime
+
+from models import ConcurrentEventTimeline, Event, EventBroker, EventTimeline, EventType
+
+
+def _event(event_type=EventType.PRICE_DROPPED, listing_id="listing1", day=1):
+    return Event(event_type=event_type, listing_id=listing_id, timestamp=datetime(2024, 12, day))
+
+
+def test_subscribers_receive_filtered_events_from_timeline():
+    """Test that timeline events reach only matching subscribers."""
+
+    async def scenario():
+        broker = EventBroker()
+        price_drops = broker.subscribe(event_types=[EventType.PRICE_DROPPED])
+        listing2 = broker.subscribe(listing_ids=["listing2"])
+
+        timeline = EventTimeline()
+        detach = broker.attach(timeline)
+        timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, 1))
+        timeline.add_events(
+            [
+                (EventType.AUCTION_CANCELLED, "listing2", datetime(2024, 12, 2)),
+                (EventType.PRICE_DROPPED, "listing2", datetime(2024, 12, 3)),
+            ]
+        )
+        detach()
+        timeline.add_event(EventType.PRICE_DROPPED, "listing2")
+
+        broker.close()
+        return [e.listing_id async for e in price_drops], [e.event_type async for e in listing2]
+
+    price_drops, listing2 = asyncio.run(scenario())
+    assert price_drops == ["listing1", "listing2"]
+    assert listing2 == [EventType.AUCTION_CANCELLED, EventType.PRICE_DROPPED]
+
+
+def test_publish_applies_backpressure():
+    """Test that awaiting publish waits for a slow consumer instead of dropping."""
+
+    async def scenario():
+        broker = EventBroker()
+        subscription = broker.subscribe(maxsize=2)
+        received = []
+
+        async def consume():
+            async for event in subscription:
+                received.append(event.timestamp.day)
+                await asyncio.sleep(0)
+
+        consumer = asyncio.create_task(consume())
+        for day in range(1, 11):
+            await broker.publish(_event(day=day))
+            assert subscription.qsize() <= 2
+        subscription.close()
+        await consumer
+        return received, subscription.dropped
+
+    received, dropped = asyncio.run(scenario())
+    assert received == list(range(1, 11))
+    assert dropped == 0
+
+
+def test_publish_nowait_overflow_policies():
+    """Test that synchronous publishing drops events according to the policy."""
+
+    async def scenario():
+        broker = EventBroker()
+        oldest = broker.subscribe(maxsize=2, overflow="drop_oldest")
+        newest = broker.subscribe(maxsize=2, overflow="drop_newest")
+        for day in range(1, 5):
+            broker.publish_nowait(_event(day=day))
+        broker.close()
+        return (
+            [e.timestamp.day async for e in oldest],
+            [e.timestamp.day async for e in newest],
+            oldest.dropped,
+            broker.dropped,
+        )
+
+    oldest, newest, dropped, total_dropped = asyncio.run(scenario())
+    assert oldest == [3, 4]
+    assert newest == [1, 2]
+    assert dropped == 2
+    assert total_dropped == 4
+
+    with pytest.raises(ValueError):
+        asyncio.run(_subscribe_with_policy("sometimes"))
+
+
+async def _subscribe_with_policy(policy):
+    return EventBroker().subscribe(overflow=policy)
+
+
+def test_publish_from_another_thread():
+    """Test that events published from a worker thread reach the loop."""
+
+    async def scenario():
+        broker = EventBroker()
+        subscription = broker.subscribe()
+        timeline = EventTimeline()
+        broker.attach(timeline)
+
+        thread = threading.Thread(target=lambda: timeline.add_event(EventType.AUCTION_VOIDED, "listing1"))
+        thread.start()
+        event = await asyncio.wait_for(subscription.get(), timeout=5)
+        thread.join()
+        return event
+
+    assert asyncio.run(scenario()).event_type == EventType.AUCTION_VOIDED
+
+
+@pytest.mark.parametrize("timeline_class", [EventTimeline, ConcurrentEventTimeline])
+def test_attached_timeline_blocks_writer_on_full_queue(timeline_class):
+    """Test that a writer thread waits for a slow "block" subscriber instead of losing events."""
+
+    async def scenario():
+        broker = EventBroker()
+        subscription = broker.subscribe(maxsize=2)
+        timeline = timeline_class()
+        broker.attach(timeline)
+
+        def write():
+            for day in range(1, 11):
+                timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, day))
+            timeline.add_events([(EventType.AUCTION_VOIDED, "listing2", datetime(2024, 12, day)) for day in range(11, 21)])
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        received = []
+        while len(received) < 20:
+            event = await asyncio.wait_for(subscription.get(), timeout=5)
+            assert subscription.qsize() <= 2
+            # Consumers may read the timeline while the writer is waiting
+            assert timeline.count_events() >= len(received)
+            received.append(event.timestamp.day)
+            await asyncio.sleep(0.001)
+        await asyncio.to_thread(writer.join)
+        return received, subscription.dropped, broker.dropped
+
+    received, dropped, total_dropped = asyncio.run(scenario())
+    assert received == list(range(1, 21))
+    assert dropped == total_dropped == 0
+
+
+def test_attached_timeline_on_loop_keeps_events_for_full_queue():
+    """Test that a writer on the event loop never raises and a full "block" subscriber still gets every event."""
+
+    async def scenario():
+        broker = EventBroker()
+        blocking = broker.subscribe(maxsize=1)
+        dropping = broker.subscribe(maxsize=1, overflow="drop_newest")
+        timeline = EventTimeline()
+        broker.attach(timeline)
+
+        timeline.add_event(EventType.PRICE_DROPPED, "listing1", timestamp=datetime(2024, 12, 1))
+        timeline.add_events([(EventType.PRICE_DROPPED, "listing1", datetime(2024, 12, day)) for day in range(2, 5)])
+        assert blocking.qsize() == 4
+        with pytest.raises(asyncio.QueueFull):
+            broker.publish_nowait(_event(day=5))
+        with pytest.raises(RuntimeError):
+            broker.publish_threadsafe(_event())
+
+        received = [(await asyncio.wait_for(blocking.get(), timeout=5)).timestamp.day for _ in range(4)]
+        return len(timeline), received, dropping.dropped, blocking.dropped
+
+    assert asyncio.run(scenario()) == (4, [1, 2, 3, 4], 4, 0)
+
+
+def test_close_releases_blocked_publishers():
+    """Test that closing a full "block" subscription lets waiting publishers return."""
+
+    async def scenario():
+        broker = EventBroker()
+        subscription = broker.subscribe(maxsize=1)
+        other = broker.subscribe(maxsize=5)
+        await broker.publish(_event(day=1))
+
+        publisher = asyncio.create_task(broker.publish(_event(day=2)))
+        writer = asyncio.create_task(asyncio.to_thread(broker.publish_threadsafe, _event(day=3), 5))
+        await asyncio.sleep(0.05)
+        assert not publisher.done()
+
+        subscription.close()
+        await asyncio.wait_for(publisher, timeout=5)
+        await asyncio.wait_for(writer, timeout=5)
+        broker.close()
+        return [e.timestamp.day async for e in subscription], [e.timestamp.day async for e in other]
+
+    assert asyncio.run(scenario()) == ([1], [1, 2, 3])
@@ -0,0 +1,118 @@
+"""
+Offline parse-throughput benchmark for the scrapers' jmespath expressions.
+
+Rebuilds the scraped page data behind the saved results in each scraper's
+./results directory (no network access or Scrapfly key needed) and times each
+expression evaluated the old way, with jmespath.search on the expression string
+per item, against the extractor compiled once at import time. Outputs of the
+two are checked to be identical.
+
+Usage:
+    python bench_parse.py
+    python bench_parse.py --repeat 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import jmespath
+
+HERE = Path(__file__).parent
+# run from the source tree without installing the scrapers and their shared extractor
+sys.path[:0] = [str(HERE / "jmespath-extractor"), str(HERE / "realestatecom-scraper"), str(HERE / "domaincom-scraper")]
+# the scraper modules create a Scrapfly client on import; it is never used here
+os.environ.setdefault("SCRAPFLY_KEY", "offline-benchmark")
+
+import domaincom  # noqa: E402
+import realestate  # noqa: E402
+
+
+def load(path: Path):
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def realestate_listing(item):
+    """rebuild the raw listing data that parse_property_data refined into `item`"""
+    company = item.get("listingCompany")
+    return {
+        **item,
+        "propertyType": {"display": item["propertyType"]},
+        "_links": {"canonical": {"href": item["propertyLink"]}},
+        "propertyFeatures": [
+            {"displayLabel": feature["featureName"], "value": feature["value"]}
+            for feature in item.get("propertyFeatures") or []
+        ],
+        "media": {"images": [{"templatedUrl": url} for url in item.get("images") or []]},
+        "listingCompany": company
+        and {
+            "name": company["name"],
+            "id": company["id"],
+            "_links": {"canonical": {"href": company["companyLink"]}},
+            "businessPhone": company["phoneNumber"],
+            "address": {"display": {"fullAddress": company["address"]}},
+            "ratingsReviews": company["ratingsReviews"],
+            "description": company["description"],
+        },
+    }
+
+
+def domain_component_props(item):
+    """rebuild the componentProps data that parse_component_props refined into `item`"""
+    return {**item, "schoolCatchment": {"schools": item["schools"]}}
+
+
+def bench(label: str, query: str, extract, items, repeat: int) -> None:
+    for item in items:
+        assert extract(item) == jmespath.search(query, item), f"{label}: outputs differ"
+    timings = {}
+    for name, parse in (("jmespath.search", lambda item: jmespath.search(query, item)), ("compiled", extract)):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for item in items:
+                parse(item)
+        timings[name] = time.perf_counter() - started
+    count = repeat * len(items)
+    before, after = timings["jmespath.search"], timings["compiled"]
+    print(
+        f"{label:>24}: {count / before:>10,.0f} items/s before, {count / after:>10,.0f} items/s after"
+        f" ({before / after:4.1f}x)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    realestate_results = HERE / "realestatecom-scraper" / "results"
+    domain_results = HERE / "domaincom-scraper" / "results"
+    listings = [
+        realestate_listing(item)
+        for item in load(realestate_results / "search.json") + load(realestate_results / "properties.json")
+    ]
+    bench(
+        "realestate property", realestate.PROPERTY_DATA_QUERY, realestate.extract_property_data, listings, args.repeat
+    )
+    bench(
+        "domain search card",
+        domaincom.SEARCH_CARD_QUERY,
+        domaincom.extract_search_card,
+        load(domain_results / "search.json"),
+        args.repeat,
+    )
+    bench(
+        "domain component props",
+        domaincom.COMPONENT_PROPS_QUERY,
+        domaincom.extract_component_props,
+        [domain_component_props(item) for item in load(domain_results / "properties.json")],
+        args.repeat * 20,
+    )
+
+
+if __name__ == "__main__":
+    main()
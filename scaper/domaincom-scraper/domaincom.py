@@ -7,12 +7,11 @@ $ export $SCRAPFLY_KEY="your key from https://scrapfly.io/dashboard"
 
 import os
 import json
-import jmespath
 from scrapfly import ScrapeConfig, ScrapflyClient, ScrapeApiResponse
 from typing import Dict, List
 from pathlib import Path
 from loguru import logger as log
-
+from jmespath_extractor import compile_extractor
 
 SCRAPFLY = ScrapflyClient(key=os.environ["SCRAPFLY_KEY"])
 
@@ -29,6 +28,52 @@ output = Path(__file__).parent / "results"
 output.mkdir(exist_ok=True)
 
 
+PAGE_PROPS_QUERY = """{
+    propertyId: propertyId,
+    unitNumber: address.unitNumber,
+    streetNumber: address.streetNumber,
+    suburb: address.suburb,
+    postcode: address.postcode
+    }"""
+extract_page_props = compile_extractor(PAGE_PROPS_QUERY)
+
+COMPONENT_PROPS_QUERY = """{
+    listingId: listingId,
+    listingUrl: listingUrl,
+    unitNumber: unitNumber,
+    streetNumber: streetNumber,
+    street: street,
+    suburb: suburb,
+    postcode: postcode,
+    createdOn: createdOn,
+    propertyType: propertyType,
+    beds: beds,
+    phone: phone,
+    agencyName: agencyName,
+    propertyDeveloperName: propertyDeveloperName,
+    agencyProfileUrl: agencyProfileUrl,
+    propertyDeveloperUrl: propertyDeveloperUrl,
+    description: description,
+    loanfinder: loanfinder,
+    schools: schoolCatchment.schools,
+    suburbInsights: suburbInsights,
+    gallery: gallery,
+    listingSummary: listingSummary,
+    agents: agents,
+    features: features,
+    structuredFeatures: structuredFeatures,
+    faqs: faqs
+    }"""
+extract_component_props = compile_extractor(COMPONENT_PROPS_QUERY)
+
+SEARCH_CARD_QUERY = """{
+    id: id,
+    listingType: listingType,
+    listingModel: listingModel
+    }"""
+extract_search_card = compile_extractor(SEARCH_CARD_QUERY)
+
+
 def parse_hidden_data(response: ScrapeApiResponse):
     """parse json data from script tags"""
     selector = response.selector
@@ -60,16 +105,7 @@ def parse_page_props(data: Dict) -> Dict:
     data = data["__APOLLO_STATE__"]
     key = next(k for k in data if k.startswith("Property:"))
     data = data[key]
-    result = jmespath.search(
-        """{
-        propertyId: propertyId,
-        unitNumber: address.unitNumber,
-        streetNumber: address.streetNumber,
-        suburb: address.suburb,
-        postcode: address.postcode
-    }""",
-        data,
-    )
+    result = extract_page_props(data)
     # parse the photo data
     image_key = next(k for k in data if k.startswith("media("))
     result["gallery"] = []
@@ -82,36 +118,7 @@ def parse_component_props(data: Dict) -> Dict:
     """refine property pages data"""
     if not data:
         return
-    result = jmespath.search(
-        """{
-    listingId: listingId,
-    listingUrl: listingUrl,
-    unitNumber: unitNumber,
-    streetNumber: streetNumber,
-    street: street,
-    suburb: suburb,
-    postcode: postcode,
-    createdOn: createdOn,
-    propertyType: propertyType,
-    beds: beds,
-    phone: phone,
-    agencyName: agencyName,
-    propertyDeveloperName: propertyDeveloperName,
-    agencyProfileUrl: agencyProfileUrl,
-    propertyDeveloperUrl: propertyDeveloperUrl,
-    description: description,
-    loanfinder: loanfinder,
-    schools: schoolCatchment.schools,
-    suburbInsights: suburbInsights,
-    gallery: gallery,
-    listingSummary: listingSummary,
-    agents: agents,
-    features: features,
-    structuredFeatures: structuredFeatures,
-    faqs: faqs
-    }""",
-        data,
-    )
+    result = extract_component_props(data)
     return result
 
 
@@ -124,14 +131,7 @@ def parse_search_page(data):
     # iterate over card items in the search data
     for key in data.keys():
         item = data[key]
-        parsed_data = jmespath.search(
-            """{
-        id: id,
-        listingType: listingType,
-        listingModel: listingModel
-      }""",
-            item,
-        )
+        parsed_data = extract_search_card(item)
         # execulde the skeletonImages key from the data
         parsed_data["listingModel"].pop("skeletonImages")
         result.append(parsed_data)
@@ -0,0 +1,92 @@
+"""
+Compiled jmespath extractors shared by the scrapers.
+
+jmespath walks the parsed expression with a visitor on every search, which
+costs more than the rest of the parsing when run per listing.
+compile_extractor compiles an expression once into nested Python functions
+instead, mirroring jmespath's semantics for the node types the scrapers'
+expressions use; any other syntax falls back to jmespath's compiled
+expression.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import jmespath
+
+
+class _Unsupported(Exception):
+    """raised for a jmespath node type the extractor builder doesn't translate"""
+
+
+def compile_extractor(expression: str) -> Callable[[Any], Any]:
+    """compile a jmespath expression into a plain Python function"""
+    parsed = jmespath.compile(expression)
+    try:
+        return _build_extractor(parsed.parsed)
+    except _Unsupported:
+        return parsed.search
+
+
+def _build_extractor(node: dict) -> Callable[[Any], Any]:
+    """translate a jmespath AST node into a function with the same semantics"""
+    kind = node["type"]
+    children = [_build_extractor(child) for child in node["children"]]
+    if kind == "field":
+        name = node["value"]
+
+        def field(value):
+            try:
+                return value.get(name)
+            except AttributeError:
+                return None
+
+        return field
+    if kind == "subexpression":
+
+        def subexpression(value):
+            for child in children:
+                value = child(value)
+            return value
+
+        return subexpression
+    if kind == "key_val_pair":
+        return children[0]
+    if kind == "multi_select_dict":
+        pairs = [(child["value"], extract) for child, extract in zip(node["children"], children, strict=True)]
+
+        def multi_select_dict(value):
+            if value is None:
+                return None
+            return {key: extract(value) for key, extract in pairs}
+
+        return multi_select_dict
+    if kind == "flatten":
+        (base,) = children
+
+        def flatten(value):
+            value = base(value)
+            if not isinstance(value, list):
+                return None
+            merged = []
+            for element in value:
+                if isinstance(element, list):
+                    merged.extend(element)
+                else:
+                    merged.append(element)
+            return merged
+
+        return flatten
+    if kind == "projection":
+        base, project = children
+
+        def projection(value):
+            value = base(value)
+            if not isinstance(value, list):
+                return None
+            return [result for result in map(project, value) if result is not None]
+
+        return projection
+    if kind == "identity":
+        return lambda value: value
+    raise _Unsupported(kind)
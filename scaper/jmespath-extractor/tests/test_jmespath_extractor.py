@@ -0,0 +1,84 @@
+"""
+Tests that compiled extractors return exactly what jmespath.search returns.
+"""
+
+import jmespath
+import pytest
+
+from jmespath_extractor import compile_extractor
+
+# the shapes of the scrapers' queries: multi-select dicts of fields and
+# subexpressions (domaincom.py), plus flatten projections, projected
+# multi-selects and a nested multi-select (realestate.py); [*] is compiled too
+EXPRESSIONS = [
+    "id",
+    "address.suburb",
+    "_links.canonical.href",
+    "{id: id, suburb: address.suburb, postcode: address.postcode}",
+    "media.images[].templatedUrl",
+    "propertyFeatures[].{featureName: displayLabel, value: value}",
+    "listingCompany.{name: name, companyLink: _links.canonical.href, address: address.display.fullAddress}",
+    "groups[][]",
+    "groups[].items[].id",
+    "propertyFeatures[*].displayLabel",
+    """{
+    id: id,
+    propertyType: propertyType.display,
+    propertyFeatures: propertyFeatures[].{featureName: displayLabel, value: value},
+    images: media.images[].templatedUrl,
+    listingCompany: listingCompany.{name: name, companyLink: _links.canonical.href}
+    }""",
+]
+
+DOCUMENTS = [
+    {
+        "id": 149785064,
+        "address": {"suburb": "Dandenong North", "postcode": "3175"},
+        "_links": {"canonical": {"href": "https://example.com/149785064"}},
+        "propertyType": {"display": "House"},
+        "media": {
+            "images": [{"templatedUrl": "a.jpg"}, {"templatedUrl": None}, {}, "b.jpg", {"templatedUrl": "c.jpg"}]
+        },
+        "propertyFeatures": [{"displayLabel": "Pool", "value": True}, {"displayLabel": "Garage"}, None, "x"],
+        "listingCompany": {
+            "name": "Agency",
+            "_links": {"canonical": {"href": "https://example.com/agency"}},
+            "address": {"display": {"fullAddress": "1 Test St"}},
+        },
+        "groups": [[1, [2, 3]], 4, {"items": [{"id": 5}, {"id": None}]}, [{"items": [{"id": 6}]}]],
+    },
+    # missing keys and nulls everywhere
+    {"id": None, "address": None, "media": {"images": []}, "propertyFeatures": [], "listingCompany": None},
+    {},
+    # wrong types where objects and lists are expected
+    {"address": "1 Test St", "media": {"images": "a.jpg"}, "propertyFeatures": {"displayLabel": "Pool"}, "groups": 3},
+    {"listingCompany": [], "propertyType": ["House"], "_links": {"canonical": []}},
+    [],
+    "listing",
+    None,
+]
+
+
+@pytest.mark.parametrize("expression", EXPRESSIONS)
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_compiled_extractor_matches_jmespath(expression, document):
+    """Test that every projection, flatten and multi-select agrees with jmespath.search."""
+    assert compile_extractor(expression)(document) == jmespath.search(expression, document)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "propertyFeatures[?value].displayLabel",
+        "media.images[?templatedUrl != null].templatedUrl",
+        "propertyFeatures[0].displayLabel",
+        "length(@)",
+    ],
+)
+@pytest.mark.parametrize("document", DOCUMENTS[:3])
+def test_unsupported_syntax_falls_back_to_jmespath(expression, document):
+    """Test that filters, indexes and functions use jmespath's own search."""
+    extract = compile_extractor(expression)
+
+    assert isinstance(getattr(extract, "__self__", None), jmespath.parser.ParsedResult)
+    assert extract(document) == jmespath.search(expression, document)
@@ -7,11 +7,11 @@ $ export $SCRAPFLY_KEY="your key from https://scrapfly.io/dashboard"
 import os
 import re
 import json
-import jmespath
 from scrapfly import ScrapeConfig, ScrapflyClient, ScrapeApiResponse
 from typing import Dict, List
 from pathlib import Path
 from loguru import logger as log
+from jmespath_extractor import compile_extractor
 
 SCRAPFLY = ScrapflyClient(key=os.environ["SCRAPFLY_KEY"])
 
@@ -28,30 +28,30 @@ output = Path(__file__).parent / "results"
 output.mkdir(exist_ok=True)
 
 
+PROPERTY_DATA_QUERY = """{
+    id: id,
+    propertyType: propertyType.display,
+    description: description,
+    propertyLink: _links.canonical.href,
+    address: address,
+    propertySizes: propertySizes,
+    generalFeatures: generalFeatures,
+    propertyFeatures: propertyFeatures[].{featureName: displayLabel, value: value},
+    images: media.images[].templatedUrl,
+    videos: videos,
+    floorplans: floorplans,
+    listingCompany: listingCompany.{name: name, id: id, companyLink: _links.canonical.href, phoneNumber: businessPhone, address: address.display.fullAddress, ratingsReviews: ratingsReviews, description: description},
+    listers: listers,
+    auction: auction
+    }"""
+extract_property_data = compile_extractor(PROPERTY_DATA_QUERY)
+
+
 def parse_property_data(data: Dict) -> Dict:
     """refine property data from JSON"""
     if not data:
         return
-    result = jmespath.search(
-        """{
-        id: id,
-        propertyType: propertyType.display,
-        description: description,            
-        propertyLink: _links.canonical.href,
-        address: address,
-        propertySizes: propertySizes,
-        generalFeatures: generalFeatures,
-        propertyFeatures: propertyFeatures[].{featureName: displayLabel, value: value},
-        images: media.images[].templatedUrl,
-        videos: videos,
-        floorplans: floorplans,        
-        listingCompany: listingCompany.{name: name, id: id, companyLink: _links.canonical.href, phoneNumber: businessPhone, address: address.display.fullAddress, ratingsReviews: ratingsReviews, description: description},
-        listers: listers,
-        auction: auction
-        }
-        """,
-        data,
-    )
+    result = extract_property_data(data)
     return result
 
 